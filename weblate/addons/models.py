@@ -56,6 +56,7 @@ from weblate.utils.classloader import ClassLoader
 from weblate.utils.decorators import disable_for_loaddata
 from weblate.utils.errors import report_error
 from weblate.utils.fields import JSONField
+from weblate.utils.metrics import measure
 
 # Initialize addons registry
 ADDONS = ClassLoader("WEBLATE_ADDONS", False)
@@ -177,7 +178,8 @@ def pre_push(sender, component, **kwargs):
     for addon in Addon.objects.filter_event(component, EVENT_PRE_PUSH):
         component.log_debug("running pre_push addon: %s", addon.name)
         try:
-            addon.addon.pre_push(component)
+            with measure("addon", component):
+                addon.addon.pre_push(component)
         except Exception:
             handle_addon_error(addon, component)
 
@@ -187,7 +189,8 @@ def post_push(sender, component, **kwargs):
     for addon in Addon.objects.filter_event(component, EVENT_POST_PUSH):
         component.log_debug("running post_push addon: %s", addon.name)
         try:
-            addon.addon.post_push(component)
+            with measure("addon", component):
+                addon.addon.post_push(component)
         except Exception:
             handle_addon_error(addon, component)
 
@@ -206,7 +209,8 @@ def post_update(
             continue
         component.log_debug("running post_update addon: %s", addon.name)
         try:
-            addon.addon.post_update(component, previous_head, skip_push)
+            with measure("addon", component):
+                addon.addon.post_update(component, previous_head, skip_push)
         except Exception:
             handle_addon_error(addon, component)
 
@@ -216,7 +220,8 @@ def component_update(sender, component, **kwargs):
     for addon in Addon.objects.filter_event(component, EVENT_COMPONENT_UPDATE):
         component.log_debug("running component_update addon: %s", addon.name)
         try:
-            addon.addon.component_update(component)
+            with measure("addon", component):
+                addon.addon.component_update(component)
         except Exception:
             handle_addon_error(addon, component)
 
@@ -226,7 +231,8 @@ def pre_update(sender, component, **kwargs):
     for addon in Addon.objects.filter_event(component, EVENT_PRE_UPDATE):
         component.log_debug("running pre_update addon: %s", addon.name)
         try:
-            addon.addon.pre_update(component)
+            with measure("addon", component):
+                addon.addon.pre_update(component)
         except Exception:
             handle_addon_error(addon, component)
 
@@ -237,7 +243,8 @@ def pre_commit(sender, translation, author, **kwargs):
     for addon in addons:
         translation.log_debug("running pre_commit addon: %s", addon.name)
         try:
-            addon.addon.pre_commit(translation, author)
+            with measure("addon", translation.component):
+                addon.addon.pre_commit(translation, author)
         except Exception:
             handle_addon_error(addon, translation.component)
 
@@ -248,7 +255,8 @@ def post_commit(sender, component, **kwargs):
     for addon in addons:
         component.log_debug("running post_commit addon: %s", addon.name)
         try:
-            addon.addon.post_commit(component)
+            with measure("addon", component):
+                addon.addon.post_commit(component)
         except Exception:
             handle_addon_error(addon, component)
 
@@ -259,7 +267,8 @@ def post_add(sender, translation, **kwargs):
     for addon in addons:
         translation.log_debug("running post_add addon: %s", addon.name)
         try:
-            addon.addon.post_add(translation)
+            with measure("addon", translation.component):
+                addon.addon.post_add(translation)
         except Exception:
             handle_addon_error(addon, translation.component)
 
@@ -272,7 +281,8 @@ def unit_pre_create_handler(sender, unit, **kwargs):
     for addon in addons:
         unit.translation.log_debug("running unit_pre_create addon: %s", addon.name)
         try:
-            addon.addon.unit_pre_create(unit)
+            with measure("addon", unit.translation.component):
+                addon.addon.unit_pre_create(unit)
         except Exception:
             handle_addon_error(addon, unit.translation.component)
 
@@ -286,7 +296,8 @@ def unit_post_save_handler(sender, instance, created, **kwargs):
     for addon in addons:
         instance.translation.log_debug("running unit_post_save addon: %s", addon.name)
         try:
-            addon.addon.unit_post_save(instance, created)
+            with measure("addon", instance.translation.component):
+                addon.addon.unit_post_save(instance, created)
         except Exception:
             handle_addon_error(addon, instance.translation.component)
 
@@ -297,6 +308,7 @@ def store_post_load_handler(sender, translation, store, **kwargs):
     for addon in addons:
         translation.log_debug("running store_post_load addon: %s", addon.name)
         try:
-            addon.addon.store_post_load(translation, store)
+            with measure("addon", translation.component):
+                addon.addon.store_post_load(translation, store)
         except Exception:
             handle_addon_error(addon, translation.component)
@@ -29,6 +29,7 @@ from weblate.lang.models import Language
 from weblate.trans.models import Component, Project
 from weblate.utils.celery import app
 from weblate.utils.hash import calculate_checksum
+from weblate.utils.metrics import measure
 from weblate.utils.requests import request
 
 
@@ -95,7 +96,7 @@ def daily_addons():
     for addon in Addon.objects.filter(event__event=EVENT_DAILY).prefetch_related(
         "component"
     ):
-        with transaction.atomic():
+        with transaction.atomic(), measure("addon", addon.component):
             addon.addon.daily(addon.component)
 
 
@@ -27,14 +27,6 @@ class ThrottlingMiddleware:
         if "throttling_state" in request.META:
             throttling = request.META["throttling_state"]
             response["X-RateLimit-Limit"] = throttling.num_requests
-            response["X-RateLimit-Remaining"] = throttling.num_requests - len(
-                throttling.history
-            )
-            if throttling.history:
-                remaining_duration = throttling.duration - (
-                    throttling.now - throttling.history[-1]
-                )
-            else:
-                remaining_duration = throttling.duration
-            response["X-RateLimit-Reset"] = int(remaining_duration)
+            response["X-RateLimit-Remaining"] = throttling.get_remaining()
+            response["X-RateLimit-Reset"] = throttling.get_reset()
         return response
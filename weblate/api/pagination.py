@@ -0,0 +1,65 @@
+#
+# Copyright © 2012 - 2020 Michal Čihař <michal@cihar.com>
+#
+# This file is part of Weblate <https://weblate.org/>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""API pagination."""
+
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class PageSizeMixin:
+    """Allow clients to choose page size, authenticated ones can get more."""
+
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    anonymous_max_page_size = 100
+
+    def get_page_size(self, request):
+        page_size = super().get_page_size(request)
+        if not request.user.is_authenticated:
+            return min(page_size, self.anonymous_max_page_size)
+        return page_size
+
+
+class IdCursorPagination(PageSizeMixin, CursorPagination):
+    """Keyset pagination on object id.
+
+    It avoids counting all objects and skipping rows using offset, so the
+    cost of fetching a page does not depend on how deep it is.
+    """
+
+    ordering = "id"
+
+
+class StandardPagination(PageSizeMixin, PageNumberPagination):
+    """Page number pagination with opt-in cursor pagination.
+
+    The cursor pagination is used when cursor parameter is present in the
+    request, an empty value starts from the first object.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if IdCursorPagination.cursor_query_param in request.query_params:
+            self.cursor_pagination = IdCursorPagination()
+            return self.cursor_pagination.paginate_queryset(queryset, request, view)
+        self.cursor_pagination = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_pagination is not None:
+            return self.cursor_pagination.get_paginated_response(data)
+        return super().get_paginated_response(data)
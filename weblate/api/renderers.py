@@ -0,0 +1,71 @@
+#
+# Copyright © 2012 - 2020 Michal Čihař <michal@cihar.com>
+#
+# This file is part of Weblate <https://weblate.org/>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from rest_framework import renderers
+
+from weblate.utils.metrics import BUCKETS, TIMINGS
+
+
+def format_labels(**labels):
+    return ",".join(
+        '{}="{}"'.format(
+            key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for key, value in labels.items()
+    )
+
+
+class OpenMetricsRenderer(renderers.BaseRenderer):
+    """Renders metrics in the OpenMetrics text format used by Prometheus."""
+
+    media_type = "application/openmetrics-text"
+    format = "openmetrics"
+    charset = "utf-8"
+    render_style = "text"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        result = []
+        for key, value in data.items():
+            if isinstance(value, int):
+                result.append(f"# TYPE weblate_{key} gauge")
+                result.append(f"weblate_{key} {value}")
+            elif key == "celery_queues":
+                result.append(f"# TYPE weblate_{key} gauge")
+                for queue, length in value.items():
+                    labels = format_labels(queue=queue)
+                    result.append(f"weblate_{key}{{{labels}}} {length}")
+            elif key == "timings":
+                for name, series in value.items():
+                    metric = f"weblate_{name}_duration_seconds"
+                    result.append(f"# TYPE {metric} histogram")
+                    result.append(f"# UNIT {metric} seconds")
+                    result.append(f"# HELP {metric} {TIMINGS[name]}")
+                    for item in series:
+                        labels = format_labels(
+                            component=item["component"], format=item["format"]
+                        )
+                        bounds = [str(float(bucket)) for bucket in BUCKETS] + ["+Inf"]
+                        for bound, count in zip(bounds, item["buckets"]):
+                            result.append(
+                                f'{metric}_bucket{{{labels},le="{bound}"}} {count}'
+                            )
+                        result.append(f"{metric}_count{{{labels}}} {item['count']}")
+                        result.append(f"{metric}_sum{{{labels}}} {item['sum']}")
+        result.append("# EOF")
+        return "\n".join(result) + "\n"
@@ -46,6 +46,8 @@ from weblate.utils.views import create_component_from_doc, create_component_from
 class MultiFieldHyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
     def __init__(self, strip_parts=0, **kwargs):
         self.strip_parts = strip_parts
+        # Objects in a list often share parents, so cache reversed URLs
+        self.url_cache = {}
         super().__init__(**kwargs)
 
     # pylint: disable=redefined-builtin
@@ -70,7 +72,12 @@ class MultiFieldHyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
             if self.strip_parts:
                 lookup = "__".join(lookup.split("__")[self.strip_parts :])
             kwargs[lookup] = value
-        return self.reverse(view_name, kwargs=kwargs, request=request, format=format)
+        cache_key = (view_name, format, tuple(kwargs.items()))
+        if cache_key not in self.url_cache:
+            self.url_cache[cache_key] = self.reverse(
+                view_name, kwargs=kwargs, request=request, format=format
+            )
+        return self.url_cache[cache_key]
 
 
 class AbsoluteURLField(serializers.CharField):
@@ -21,12 +21,16 @@ from copy import copy
 from datetime import timedelta
 
 from django.core.files import File
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.test import APITestCase
 from weblate_language_data.languages import LANGUAGES
 
 from weblate.accounts.models import Subscription
+from weblate.api.throttling import UserRateThrottle
 from weblate.auth.models import Group, Role, User
 from weblate.glossary.models import Glossary
 from weblate.lang.models import Language
@@ -42,6 +46,7 @@ from weblate.trans.models import (
 from weblate.trans.tests.test_models import fixup_languages_seq
 from weblate.trans.tests.utils import RepoTestMixin, get_test_file
 from weblate.utils.django_hacks import immediate_on_commit, immediate_on_commit_leave
+from weblate.utils.metrics import COLLECTOR
 from weblate.utils.state import STATE_EMPTY, STATE_TRANSLATED
 
 TEST_PO = get_test_file("cs.po")
@@ -2222,6 +2227,20 @@ class TranslationAPITest(APIBaseTest):
         request = self.do_request("api:translation-units", self.translation_kwargs)
         self.assertEqual(request.data["count"], 4)
 
+    def test_units_queries(self):
+        self.authenticate()
+        url = reverse("api:translation-units", kwargs=self.translation_kwargs)
+        counts = []
+        for page_size in (1, 4):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url, {"page_size": page_size})
+            self.assertEqual(len(response.data["results"]), page_size)
+            counts.append(len(context))
+        self.assertEqual(counts[0], counts[1])
+        self.assertFalse(
+            any(unit["has_suggestion"] for unit in response.data["results"])
+        )
+
     def test_autotranslate(self):
         self.do_request(
             "api:translation-autotranslate",
@@ -2783,6 +2802,32 @@ class ChangeAPITest(APIBaseTest):
         response = self.client.get(reverse("api:change-list"))
         self.assertEqual(response.data["count"], 14)
 
+    def test_list_changes_page_size(self):
+        response = self.client.get(reverse("api:change-list"), {"page_size": 5})
+        self.assertEqual(response.data["count"], 14)
+        self.assertEqual(len(response.data["results"]), 5)
+
+    def test_list_changes_cursor(self):
+        self.authenticate()
+        response = self.client.get(
+            reverse("api:change-list"), {"cursor": "", "page_size": 10}
+        )
+        self.assertNotIn("count", response.data)
+        self.assertEqual(len(response.data["results"]), 10)
+        ids = [item["id"] for item in response.data["results"]]
+        response = self.client.get(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 4)
+        self.assertIsNone(response.data["next"])
+        ids.extend(item["id"] for item in response.data["results"])
+        self.assertEqual(
+            ids,
+            list(
+                Change.objects.last_changes(self.user)
+                .order_by("id")
+                .values_list("id", flat=True)
+            ),
+        )
+
     def test_filter_changes_after(self):
         """Filter chanages since timestamp."""
         start = Change.objects.order().last().timestamp
@@ -2813,9 +2858,32 @@ class ChangeAPITest(APIBaseTest):
 
 class MetricsAPITest(APIBaseTest):
     def test_metrics(self):
+        self.authenticate(True)
+        response = self.client.get(reverse("api:metrics"))
+        self.assertEqual(response.data["projects"], 1)
+        self.assertIn("vcs", response.data["timings"])
+
+    def test_metrics_timings_forbidden(self):
         self.authenticate()
+        COLLECTOR.flush()
         response = self.client.get(reverse("api:metrics"))
         self.assertEqual(response.data["projects"], 1)
+        self.assertNotIn("timings", response.data)
+        response = self.client.get(reverse("api:metrics"), {"format": "openmetrics"})
+        self.assertNotIn("test/test", response.content.decode())
+
+    def test_metrics_openmetrics(self):
+        self.authenticate(True)
+        COLLECTOR.flush()
+        response = self.client.get(reverse("api:metrics"), {"format": "openmetrics"})
+        self.assertEqual(response.status_code, 200)
+        content = response.content.decode()
+        self.assertIn("weblate_projects 1\n", content)
+        self.assertIn("# TYPE weblate_vcs_duration_seconds histogram\n", content)
+        self.assertIn(
+            'weblate_vcs_duration_seconds_bucket{component="test/test"', content
+        )
+        self.assertTrue(content.endswith("# EOF\n"))
 
     def test_forbidden(self):
         response = self.client.get(reverse("api:metrics"))
@@ -2828,6 +2896,25 @@ class MetricsAPITest(APIBaseTest):
         response = self.client.get(reverse("api:metrics"), HTTP_REMOTE_ADDR="127.0.0.2")
         self.assertEqual(current - 1, int(response["X-RateLimit-Remaining"]))
 
+    def test_ratelimit_exhausted(self):
+        request = RequestFactory().get("/", REMOTE_ADDR="127.0.0.3")
+        request.user = self.user
+        throttle = UserRateThrottle()
+        throttle.num_requests, throttle.duration = throttle.parse_rate("2/min")
+        throttle.timer = lambda: 1000
+        throttle.cache.delete(throttle.get_cache_key(request, None))
+        self.assertTrue(throttle.allow_request(request, None))
+        self.assertEqual(throttle.get_remaining(), 1)
+        self.assertTrue(throttle.allow_request(request, None))
+        self.assertEqual(throttle.get_remaining(), 0)
+        self.assertEqual(throttle.get_reset(), 60)
+        self.assertFalse(throttle.allow_request(request, None))
+        self.assertEqual(throttle.wait(), 30)
+        # Single request is allowed once its interval has passed
+        throttle.timer = lambda: 1030
+        self.assertTrue(throttle.allow_request(request, None))
+        self.assertFalse(throttle.allow_request(request, None))
+
 
 class ComponentListAPITest(APIBaseTest):
     def setUp(self):
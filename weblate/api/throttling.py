@@ -16,32 +16,109 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
-from functools import wraps
+"""API throttling using generic cell rate algorithm."""
 
+from math import ceil
+
+from django_redis.cache import RedisCache
 from rest_framework.throttling import AnonRateThrottle as DRFAnonRateThrottle
 from rest_framework.throttling import UserRateThrottle as DRFUserRateThrottle
 
+# Tolerance for floating point errors when comparing times
+EPSILON = 1e-6
 
-def patch_throttle_request(func):
-    """Stores throttling state in request to be picked up by ThrottlingMiddleware."""
+# Atomically updates theoretical arrival time, returns whether the request is
+# allowed and the stored time (as string to avoid truncating to integer)
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local duration = tonumber(ARGV[3]) + tonumber(ARGV[4])
+local tat = tonumber(redis.call("GET", KEYS[1]))
+if tat == nil or tat < now then
+    tat = now
+end
+local new_tat = tat + interval
+if new_tat - now > duration then
+    return {0, tostring(tat)}
+end
+redis.call("SET", KEYS[1], tostring(new_tat), "PX", math.ceil((new_tat - now) * 1000))
+return {1, tostring(new_tat)}
+"""
 
-    @wraps(func)
-    def patched(self, request, view):
-        result = func(self, request, view)
-        if result and hasattr(self, "history"):
-            request.META["throttling_state"] = self
-        return result
 
-    return patched
+class GCRAThrottleMixin:
+    """Throttling based on generic cell rate algorithm.
 
+    Instead of the list of all request timestamps used by Django REST
+    framework, only the theoretical arrival time of the next request is stored
+    for each client. The check therefore costs single cache operation with
+    constant payload size regardless of the configured rate.
+    """
 
-class AnonRateThrottle(DRFAnonRateThrottle):
-    @patch_throttle_request
-    def allow_request(self, request, view):
-        return super().allow_request(request, view)
+    cache_format = "throttle_gcra_%(scope)s_%(ident)s"
+
+    @property
+    def interval(self):
+        return self.duration / self.num_requests
+
+    def update_redis(self):
+        client = self.cache.client.get_client()
+        allowed, tat = client.eval(
+            GCRA_SCRIPT,
+            1,
+            self.cache.make_key(self.key),
+            self.now,
+            self.interval,
+            self.duration,
+            EPSILON,
+        )
+        return bool(allowed), float(tat)
 
+    def update_cache(self):
+        tat = max(self.cache.get(self.key, self.now), self.now)
+        new_tat = tat + self.interval
+        if new_tat - self.now > self.duration + EPSILON:
+            return False, tat
+        self.cache.set(self.key, new_tat, ceil(new_tat - self.now))
+        return True, new_tat
 
-class UserRateThrottle(DRFUserRateThrottle):
-    @patch_throttle_request
     def allow_request(self, request, view):
-        return super().allow_request(request, view)
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        if isinstance(self.cache, RedisCache):
+            allowed, self.tat = self.update_redis()
+        else:
+            allowed, self.tat = self.update_cache()
+
+        if not allowed:
+            return self.throttle_failure()
+        # Store state to be picked up by ThrottlingMiddleware
+        request.META["throttling_state"] = self
+        return True
+
+    def get_remaining(self):
+        """Return number of requests which can be performed now."""
+        return max(
+            0, int((self.duration - self.tat + self.now) / self.interval + EPSILON)
+        )
+
+    def get_reset(self):
+        """Return number of seconds until the limit is fully restored."""
+        return ceil(self.tat - self.now)
+
+    def wait(self):
+        return max(0, self.tat + self.interval - self.duration - self.now)
+
+
+class AnonRateThrottle(GCRAThrottleMixin, DRFAnonRateThrottle):
+    pass
+
+
+class UserRateThrottle(GCRAThrottleMixin, DRFUserRateThrottle):
+    pass
@@ -44,6 +44,8 @@ from rest_framework.views import APIView
 
 from weblate.accounts.models import Subscription
 from weblate.accounts.utils import remove_user
+from weblate.api.pagination import StandardPagination
+from weblate.api.renderers import OpenMetricsRenderer
 from weblate.api.serializers import (
     BasicUserSerializer,
     ChangeSerializer,
@@ -94,6 +96,7 @@ from weblate.trans.tasks import auto_translate, component_removal, project_remov
 from weblate.utils.celery import get_queue_stats
 from weblate.utils.docs import get_doc_url
 from weblate.utils.errors import report_error
+from weblate.utils.metrics import get_timings
 from weblate.utils.state import (
     STATE_APPROVED,
     STATE_EMPTY,
@@ -638,6 +641,7 @@ class ProjectViewSet(
     queryset = Project.objects.none()
     serializer_class = ProjectSerializer
     lookup_field = "slug"
+    pagination_class = StandardPagination
 
     def get_queryset(self):
         return self.request.user.allowed_projects.order_by("id")
@@ -890,6 +894,7 @@ class ComponentViewSet(
     queryset = Component.objects.none()
     serializer_class = ComponentSerializer
     lookup_fields = ("project__slug", "slug")
+    pagination_class = StandardPagination
 
     def get_queryset(self):
         return (
@@ -1034,6 +1039,7 @@ class TranslationViewSet(MultipleFieldMixin, WeblateViewSet, DestroyModelMixin):
     serializer_class = TranslationSerializer
     lookup_fields = ("component__project__slug", "component__slug", "language__code")
     raw_urls = ("translation-file",)
+    pagination_class = StandardPagination
 
     def get_queryset(self):
         return (
@@ -1147,7 +1153,10 @@ class TranslationViewSet(MultipleFieldMixin, WeblateViewSet, DestroyModelMixin):
             return Response(serializer.data, status=HTTP_200_OK)
 
         queryset = (
-            obj.unit_set.search(request.GET.get("q", "")).order_by("id").prefetch()
+            obj.unit_set.search(request.GET.get("q", ""))
+            .order_by("id")
+            .prefetch()
+            .annotate_existence()
         )
         page = self.paginate_queryset(queryset)
 
@@ -1243,7 +1252,12 @@ class UnitViewSet(viewsets.ReadOnlyModelViewSet, UpdateModelMixin, DestroyModelM
         return serializer_class(instance, *args, **kwargs)
 
     def get_queryset(self):
-        return Unit.objects.filter_access(self.request.user).order_by("id")
+        return (
+            Unit.objects.filter_access(self.request.user)
+            .order_by("id")
+            .prefetch()
+            .annotate_existence()
+        )
 
     def perform_update(self, serializer):
         data = serializer.validated_data
@@ -1440,6 +1454,7 @@ class ChangeViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Change.objects.none()
     serializer_class = ChangeSerializer
     filter_backends = (ChangesFilterBackend,)
+    pagination_class = StandardPagination
 
     def get_queryset(self):
         return Change.objects.last_changes(self.request.user).order_by("id")
@@ -1519,27 +1534,30 @@ class Metrics(APIView):
     """Metrics view for monitoring."""
 
     permission_classes = (IsAuthenticated,)
+    renderer_classes = (*api_settings.DEFAULT_RENDERER_CLASSES, OpenMetricsRenderer)
 
     # pylint: disable=redefined-builtin
     def get(self, request, format=None):
         """Return a list of all users."""
         stats = GlobalStats()
-        return Response(
-            {
-                "units": stats.all,
-                "units_translated": stats.translated,
-                "users": User.objects.count(),
-                "changes": stats.total_changes,
-                "projects": Project.objects.count(),
-                "components": Component.objects.count(),
-                "translations": Translation.objects.count(),
-                "languages": stats.languages,
-                "checks": Check.objects.count(),
-                "configuration_errors": ConfigurationError.objects.filter(
-                    ignored=False
-                ).count(),
-                "suggestions": Suggestion.objects.count(),
-                "celery_queues": get_queue_stats(),
-                "name": settings.SITE_TITLE,
-            }
-        )
+        result = {
+            "units": stats.all,
+            "units_translated": stats.translated,
+            "users": User.objects.count(),
+            "changes": stats.total_changes,
+            "projects": Project.objects.count(),
+            "components": Component.objects.count(),
+            "translations": Translation.objects.count(),
+            "languages": stats.languages,
+            "checks": Check.objects.count(),
+            "configuration_errors": ConfigurationError.objects.filter(
+                ignored=False
+            ).count(),
+            "suggestions": Suggestion.objects.count(),
+            "celery_queues": get_queue_stats(),
+            "name": settings.SITE_TITLE,
+        }
+        # The timings list all components including private ones
+        if request.user.is_superuser:
+            result["timings"] = get_timings()
+        return Response(result)
@@ -0,0 +1,78 @@
+# Generated by Django 3.1.1 on 2020-11-13 14:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import Length
+
+from weblate.utils.db import conditional_sum
+from weblate.utils.state import STATE_TRANSLATED
+
+
+def create_summary(apps, schema_editor):
+    Check = apps.get_model("checks", "Check")
+    CheckSummary = apps.get_model("checks", "CheckSummary")
+    db_alias = schema_editor.connection.alias
+    stats = (
+        Check.objects.using(db_alias)
+        .values("unit__translation", "check", "dismissed")
+        .annotate(
+            strings=Count("id"),
+            words=Sum("unit__num_words"),
+            chars=Sum(Length("unit__source")),
+            translated=conditional_sum(1, unit__state__gte=STATE_TRANSLATED),
+        )
+        .order_by()
+    )
+    CheckSummary.objects.using(db_alias).bulk_create(
+        (
+            CheckSummary(
+                translation_id=stat.pop("unit__translation"),
+                **stat,
+            )
+            for stat in stats.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("trans", "0108_dailyactivity"),
+        ("checks", "0004_auto_20200516_1821"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CheckSummary",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("check", models.CharField(max_length=50)),
+                ("dismissed", models.BooleanField(default=False)),
+                ("strings", models.IntegerField(default=0)),
+                ("words", models.IntegerField(default=0)),
+                ("chars", models.IntegerField(default=0)),
+                ("translated", models.IntegerField(default=0)),
+                (
+                    "translation",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="trans.Translation",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("translation", "check", "dismissed")},
+            },
+        ),
+        migrations.RunPython(create_summary, migrations.RunPython.noop, elidable=True),
+    ]
@@ -19,17 +19,21 @@
 
 
 import json
+from collections import Counter, defaultdict
 
 from appconf import AppConf
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
-from django.db.models import Q
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Length
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils.functional import cached_property
 
 from weblate.utils.classloader import ClassLoader
+from weblate.utils.db import conditional_sum
 from weblate.utils.decorators import disable_for_loaddata
+from weblate.utils.state import STATE_TRANSLATED
 
 
 class ChecksLoader(ClassLoader):
@@ -177,16 +181,143 @@ class Check(models.Model):
 
     def set_dismiss(self, state=True):
         """Set ignore flag."""
-        self.dismissed = state
+        if self.dismissed != state:
+            # Move the check to the summary of the other state
+            CheckSummary.objects.add_checks([self], -1)
+            self.dismissed = state
+            CheckSummary.objects.add_checks([self])
         self.save()
 
 
+class CheckSummaryQuerySet(models.QuerySet):
+    def filter_access(self, user):
+        if user.is_superuser:
+            return self
+        return self.filter(
+            Q(translation__component__project_id__in=user.allowed_project_ids)
+            & (
+                Q(translation__component__restricted=False)
+                | Q(translation__component_id__in=user.component_permissions)
+            )
+        )
+
+    def update_counts(self, counts):
+        """Add the differences to the summary rows.
+
+        The counts are keyed by translation id, check and dismissed state.
+        """
+        for (translation_id, check, dismissed), values in counts.items():
+            rows = self.filter(
+                translation_id=translation_id, check=check, dismissed=dismissed
+            )
+            update = {field: F(field) + value for field, value in values.items()}
+            if rows.update(**update) or values["strings"] <= 0:
+                continue
+            try:
+                with transaction.atomic():
+                    self.create(
+                        translation_id=translation_id,
+                        check=check,
+                        dismissed=dismissed,
+                        **values
+                    )
+            except IntegrityError:
+                # Created meanwhile by other process
+                rows.update(**update)
+        # Remove rows without failing checks
+        self.filter(
+            translation_id__in={key[0] for key in counts}, strings__lte=0
+        ).delete()
+
+    def add_checks(self, checks, delta: int = 1):
+        """Update summary for created checks, removed with negative delta."""
+        counts = defaultdict(Counter)
+        for check in checks:
+            unit = check.unit
+            values = counts[unit.translation_id, check.check, check.dismissed]
+            for field, value in zip(
+                ("strings", "words", "chars", "translated"),
+                (1, *unit.get_check_values()),
+            ):
+                values[field] += delta * value
+        self.update_counts(counts)
+
+    def update_units(self, changes):
+        """Update summary for units with changed summary values.
+
+        The changes map unit ids to tuples of previous and current values.
+        """
+        if not changes:
+            return
+        counts = defaultdict(Counter)
+        for unit_id, translation_id, check, dismissed in Check.objects.filter(
+            unit_id__in=changes
+        ).values_list("unit_id", "unit__translation_id", "check", "dismissed"):
+            values = counts[translation_id, check, dismissed]
+            previous, current = changes[unit_id]
+            for field, old, new in zip(
+                ("words", "chars", "translated"), previous, current
+            ):
+                values[field] += new - old
+        self.update_counts(counts)
+
+    def update_translation(self, translation):
+        """Recalculate summary for a translation from its checks.
+
+        This is used after changing units in bulk, other changes update the
+        summary incrementally.
+        """
+        stats = (
+            Check.objects.filter(unit__translation=translation)
+            .values("check", "dismissed")
+            .annotate(
+                strings=Count("id"),
+                words=Sum("unit__num_words"),
+                chars=Sum(Length("unit__source")),
+                translated=conditional_sum(1, unit__state__gte=STATE_TRANSLATED),
+            )
+            .order_by()
+        )
+        with transaction.atomic():
+            self.filter(translation=translation).delete()
+            self.bulk_create(
+                [CheckSummary(translation=translation, **stat) for stat in stats]
+            )
+
+
+class CheckSummary(models.Model):
+    """Failing checks count per translation, check and dismissed state.
+
+    Maintained on every change of translation checks, so that checks overview
+    does not have to aggregate all checks.
+    """
+
+    translation = models.ForeignKey(
+        "trans.Translation", on_delete=models.deletion.CASCADE
+    )
+    check = models.CharField(max_length=50)
+    dismissed = models.BooleanField(default=False)
+    strings = models.IntegerField(default=0)
+    words = models.IntegerField(default=0)
+    chars = models.IntegerField(default=0)
+    translated = models.IntegerField(default=0)
+
+    objects = CheckSummaryQuerySet.as_manager()
+
+    class Meta:
+        unique_together = ("translation", "check", "dismissed")
+
+    def __str__(self):
+        return "{}: {}".format(self.check, self.strings)
+
+
 @receiver(post_save, sender=Check)
 @disable_for_loaddata
 def check_post_save(sender, instance, created, **kwargs):
     """Handle check creation or updates."""
-    if not created:
-        instance.unit.translation.invalidate_cache()
+    if created:
+        CheckSummary.objects.add_checks([instance])
+    instance.unit.translation.invalidate_cache()
 
 
 @receiver(post_delete, sender=Check)
@@ -194,6 +325,7 @@ def check_post_save(sender, instance, created, **kwargs):
 def remove_complimentary_checks(sender, instance, **kwargs):
     """Remove propagate checks from all units."""
     unit = instance.unit
+    CheckSummary.objects.add_checks([instance], -1)
     unit.translation.invalidate_cache()
     check_obj = instance.check_obj
     if not check_obj:
@@ -19,12 +19,17 @@
 
 """Tests for unitdata models."""
 
-
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import Length
 from django.urls import reverse
 from django.utils.encoding import force_str
 
-from weblate.checks.models import Check
-from weblate.trans.tests.test_views import FixtureTestCase
+from weblate.checks.models import Check, CheckSummary
+from weblate.trans.models import Unit
+from weblate.trans.tests.test_views import FixtureTestCase, ViewTestCase
+from weblate.utils.db import conditional_sum
+from weblate.utils.state import STATE_TRANSLATED
 
 
 class CheckModelTestCase(FixtureTestCase):
@@ -58,3 +63,92 @@ class CheckModelTestCase(FixtureTestCase):
             '<img class="img-responsive" src="{0}?pos=0" /></a>'.format(url),
         )
         self.assert_png(self.client.get(url))
+
+
+class CheckSummaryMixin:
+    def assert_summary(self, translation):
+        expected = (
+            Check.objects.filter(unit__translation=translation)
+            .values_list("check", "dismissed")
+            .annotate(
+                strings=Count("id"),
+                words=Sum("unit__num_words"),
+                chars=Sum(Length("unit__source")),
+                translated=conditional_sum(1, unit__state__gte=STATE_TRANSLATED),
+            )
+        )
+        self.assertEqual(
+            set(
+                CheckSummary.objects.filter(translation=translation).values_list(
+                    "check", "dismissed", "strings", "words", "chars", "translated"
+                )
+            ),
+            set(expected),
+        )
+
+
+class CheckSummaryTestCase(CheckSummaryMixin, FixtureTestCase):
+    def test_summary(self):
+        translation = self.get_translation()
+        self.assert_summary(translation)
+        failing = getattr(translation.stats, "check:same")
+
+        self.edit_unit("Hello, world!\n", "Hello, world!\n")
+        translation = self.get_translation()
+        self.assert_summary(translation)
+        self.assertEqual(getattr(translation.stats, "check:same"), failing + 1)
+
+        check = self.get_unit().check_set.get(check="same")
+        check.set_dismiss()
+        self.assert_summary(translation)
+        translation = self.get_translation()
+        self.assertEqual(getattr(translation.stats, "check:same"), failing)
+
+        self.edit_unit("Hello, world!\n", "Nazdar svete!\n")
+        self.assert_summary(translation)
+        self.assertFalse(
+            CheckSummary.objects.filter(
+                translation=translation, check="same", dismissed=True
+            ).exists()
+        )
+
+    def test_summary_state(self):
+        self.edit_unit("Hello, world!\n", "Hello, world!\n")
+        translation = self.get_translation()
+        self.assert_summary(translation)
+        summary = CheckSummary.objects.get(translation=translation, check="same")
+        # Translated count of existing check is updated
+        self.edit_unit("Hello, world!\n", "Hello, world!\n", fuzzy="yes", review="10")
+        self.assert_summary(translation)
+        summary.refresh_from_db()
+        self.assertEqual(summary.translated, 0)
+
+    def test_summary_rollback(self):
+        translation = self.get_translation()
+        try:
+            with transaction.atomic():
+                self.edit_unit("Hello, world!\n", "Hello, world!\n")
+                self.assertTrue(
+                    CheckSummary.objects.filter(
+                        translation=translation, check="same"
+                    ).exists()
+                )
+                raise ValueError()
+        except ValueError:
+            pass
+        self.assert_summary(translation)
+        self.edit_unit("Hello, world!\n", "Hello, world!\n")
+        self.assert_summary(translation)
+
+
+class CheckSummarySyncTestCase(CheckSummaryMixin, ViewTestCase):
+    def test_summary_stale(self):
+        self.edit_unit("Hello, world!\n", "Hello, world!\n")
+        unit = self.get_unit()
+        self.assertTrue(unit.check_set.filter(check="same").exists())
+        # Make the unit stale, it is removed on next sync
+        Unit.objects.filter(pk=unit.pk).update(id_hash=1)
+        translation = self.get_translation()
+        translation.check_sync(force=True)
+        self.assertFalse(Unit.objects.filter(pk=unit.pk).exists())
+        self.assert_summary(translation)
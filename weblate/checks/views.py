@@ -17,19 +17,18 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
-from django.db.models import Count
+from django.db.models import Sum
 from django.http import Http404
 from django.shortcuts import get_object_or_404, render
 from django.utils.encoding import force_str
 from django.utils.http import urlencode
 from django.utils.translation import gettext as _
 
-from weblate.checks.models import CHECKS, Check
+from weblate.checks.models import CHECKS, Check, CheckSummary
 from weblate.trans.models import Component, Translation, Unit
 from weblate.trans.util import redirect_param
 from weblate.utils.db import conditional_sum
 from weblate.utils.forms import FilterForm
-from weblate.utils.state import STATE_TRANSLATED
 from weblate.utils.views import get_component, get_project
 
 
@@ -49,33 +48,30 @@ def show_checks(request):
     form = FilterForm(request.GET)
     if form.is_valid():
         if form.cleaned_data.get("project"):
-            kwargs["unit__translation__component__project__slug"] = form.cleaned_data[
+            kwargs["translation__component__project__slug"] = form.cleaned_data[
                 "project"
             ]
             url_params["project"] = form.cleaned_data["project"]
 
         if form.cleaned_data.get("lang"):
-            kwargs["unit__translation__language__code"] = form.cleaned_data["lang"]
+            kwargs["translation__language__code"] = form.cleaned_data["lang"]
             url_params["lang"] = form.cleaned_data["lang"]
 
         if form.cleaned_data.get("component"):
-            kwargs["unit__translation__component__slug"] = form.cleaned_data[
-                "component"
-            ]
+            kwargs["translation__component__slug"] = form.cleaned_data["component"]
             url_params["component"] = form.cleaned_data["component"]
 
     allchecks = (
-        Check.objects.filter(**kwargs)
+        CheckSummary.objects.filter(**kwargs)
         .filter_access(user)
         .values("check")
         .annotate(
-            check_count=Count("id"),
-            dismissed_check_count=conditional_sum(1, dismissed=True),
-            active_check_count=conditional_sum(1, dismissed=False),
-            translated_check_count=conditional_sum(
-                1, dismissed=False, unit__state__gte=STATE_TRANSLATED
-            ),
+            check_count=Sum("strings"),
+            dismissed_check_count=conditional_sum("strings", dismissed=True),
+            active_check_count=conditional_sum("strings", dismissed=False),
+            translated_check_count=conditional_sum("translated", dismissed=False),
         )
+        .order_by("check")
     )
 
     return render(
@@ -99,7 +95,7 @@ def show_check(request, name):
     url_params = {}
 
     kwargs = {
-        "component__translation__unit__check__check": name,
+        "component__translation__checksummary__check": name,
     }
 
     form = FilterForm(request.GET)
@@ -120,17 +116,18 @@ def show_check(request, name):
     projects = (
         request.user.allowed_projects.filter(**kwargs)
         .annotate(
-            check_count=Count("component__translation__unit__check"),
+            check_count=Sum("component__translation__checksummary__strings"),
             dismissed_check_count=conditional_sum(
-                1, component__translation__unit__check__dismissed=True
+                "component__translation__checksummary__strings",
+                component__translation__checksummary__dismissed=True,
             ),
             active_check_count=conditional_sum(
-                1, component__translation__unit__check__dismissed=False
+                "component__translation__checksummary__strings",
+                component__translation__checksummary__dismissed=False,
             ),
             translated_check_count=conditional_sum(
-                1,
-                component__translation__unit__check__dismissed=False,
-                component__translation__unit__state__gte=STATE_TRANSLATED,
+                "component__translation__checksummary__translated",
+                component__translation__checksummary__dismissed=False,
             ),
         )
         .order()
@@ -160,7 +157,7 @@ def show_check_project(request, name, project):
 
     kwargs = {
         "project": prj,
-        "translation__unit__check__check": name,
+        "translation__checksummary__check": name,
     }
 
     form = FilterForm(request.GET)
@@ -173,17 +170,18 @@ def show_check_project(request, name, project):
         Component.objects.filter_access(request.user)
         .filter(**kwargs)
         .annotate(
-            check_count=Count("translation__unit__check"),
+            check_count=Sum("translation__checksummary__strings"),
             dismissed_check_count=conditional_sum(
-                1, translation__unit__check__dismissed=True
+                "translation__checksummary__strings",
+                translation__checksummary__dismissed=True,
             ),
             active_check_count=conditional_sum(
-                1, translation__unit__check__dismissed=False
+                "translation__checksummary__strings",
+                translation__checksummary__dismissed=False,
             ),
             translated_check_count=conditional_sum(
-                1,
-                translation__unit__check__dismissed=False,
-                translation__unit__state__gte=STATE_TRANSLATED,
+                "translation__checksummary__translated",
+                translation__checksummary__dismissed=False,
             ),
         )
         .order()
@@ -217,14 +215,18 @@ def show_check_component(request, name, project, component):
 
     translations = (
         Translation.objects.filter(
-            component=component, unit__check__check=name, **kwargs
+            component=component, checksummary__check=name, **kwargs
         )
         .annotate(
-            check_count=Count("unit__check"),
-            dismissed_check_count=conditional_sum(1, unit__check__dismissed=True),
-            active_check_count=conditional_sum(1, unit__check__dismissed=False),
+            check_count=Sum("checksummary__strings"),
+            dismissed_check_count=conditional_sum(
+                "checksummary__strings", checksummary__dismissed=True
+            ),
+            active_check_count=conditional_sum(
+                "checksummary__strings", checksummary__dismissed=False
+            ),
             translated_check_count=conditional_sum(
-                1, unit__check__dismissed=False, unit__state__gte=STATE_TRANSLATED
+                "checksummary__translated", checksummary__dismissed=False
             ),
         )
         .order_by("language__code")
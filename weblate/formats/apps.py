@@ -27,6 +27,8 @@ from weblate.utils.checks import weblate_check
 def check_formats(app_configs, **kwargs):
     from weblate.formats.models import FILE_FORMATS
 
+    # Building the index records formats with missing dependencies
+    FILE_FORMATS.exists()
     message = "Failure in loading handler for {} file format: {}"
     return [
         weblate_check(
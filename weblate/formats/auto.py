@@ -31,9 +31,11 @@ from weblate.formats.ttkit import TTKitFormat
 def detect_filename(filename):
     """Filename based format autodetection."""
     name = os.path.basename(filename)
-    for pattern, storeclass in FILE_FORMATS.autoload:
+    for pattern, format_id in FILE_FORMATS.autoload:
         if fnmatch(name, pattern):
-            return storeclass
+            storeclass = FILE_FORMATS.get(format_id)
+            if storeclass is not None:
+                return storeclass
     return None
 
 
@@ -154,6 +154,70 @@ class TranslationUnit:
         raise NotImplementedError()
 
 
+class CachedUnit:
+    """Read only snapshot of parsed unit.
+
+    It provides the attributes needed to update the database from the file
+    without parsing it again. The values are stored as a plain tuple.
+    """
+
+    __slots__ = (
+        "context",
+        "source",
+        "target",
+        "flags",
+        "notes",
+        "locations",
+        "previous_source",
+        "id_hash",
+        "fuzzy",
+        "approved",
+        "translated",
+        "readonly",
+        "template",
+    )
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    @classmethod
+    def serialize(cls, unit) -> Tuple:
+        """Return tuple of values to construct the snapshot."""
+        return (
+            unit.context,
+            unit.source,
+            unit.target,
+            unit.flags,
+            unit.notes,
+            unit.locations,
+            unit.previous_source,
+            unit.id_hash,
+            unit.is_fuzzy(None),
+            unit.is_approved(None),
+            bool(unit.is_translated()),
+            bool(unit.is_readonly()),
+            # Only used to indicate monolingual unit
+            None if unit.template is None else True,
+        )
+
+    def is_translated(self):
+        return self.translated
+
+    def is_approved(self, fallback=False):
+        if self.approved is None:
+            return fallback
+        return self.approved
+
+    def is_fuzzy(self, fallback=False):
+        if self.fuzzy is None:
+            return fallback
+        return self.fuzzy
+
+    def is_readonly(self):
+        return self.readonly
+
+
 class TranslationFormat:
     """Generic object defining file format loader."""
 
@@ -223,9 +287,21 @@ class TranslationFormat:
     def load(cls, storefile, template_store):
         raise NotImplementedError()
 
+    def get_plural_formula(self):
+        """Return number of plurals and formula defined in the file.
+
+        None is returned when the file does not define plurals.
+        """
+        return None
+
+    @staticmethod
+    def find_plural(language, plural_formula):
+        """Return plural object matching the formula from the file."""
+        return language.plural
+
     def get_plural(self, language):
         """Return matching plural object."""
-        return language.plural
+        return self.find_plural(language, self.get_plural_formula())
 
     @cached_property
     def has_template(self):
@@ -292,6 +368,10 @@ class TranslationFormat:
         """Update store header if available."""
         return
 
+    def track_change(self, ttkit_unit):
+        """Remember unit prior to changing it if the format needs it."""
+        return
+
     def save_atomic(self, filename, callback):
         dirname, basename = os.path.split(filename)
         if not os.path.exists(dirname):
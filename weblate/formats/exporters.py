@@ -20,10 +20,10 @@
 
 import re
 
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
-from lxml.etree import XMLSyntaxError
+from lxml.etree import Comment, XMLSyntaxError
 from translate.misc.multistring import multistring
 from translate.storage.aresource import AndroidResourceFile
 from translate.storage.csvl10n import csvfile
@@ -47,6 +47,10 @@ _CHARMAP = dict.fromkeys(x for x in range(32) if x not in (9, 10, 13))
 
 DASHES = re.compile("--+")
 
+# Markers used to split serialized XML documents when streaming
+STREAM_START = "weblate-stream-start"
+STREAM_END = "weblate-stream-end"
+
 
 class BaseExporter:
     content_type = "text/plain"
@@ -54,6 +58,14 @@ class BaseExporter:
     name = ""
     verbose = ""
     set_id = False
+    # Whether the exporter can serialize units in chunks, see split_serialized
+    streaming = False
+    # Bytes placed between serialized chunks when streaming
+    chunk_separator = b""
+    # File format identifiers the exporter is limited to, empty for all
+    supported_formats = ()
+    # Whether the exporter is limited to monolingual components
+    requires_template = False
 
     def __init__(
         self,
@@ -78,9 +90,12 @@ class BaseExporter:
             self.url = url
         self.fieldnames = fieldnames
 
-    @staticmethod
-    def supports(translation):
-        return True
+    @classmethod
+    def supports(cls, translation):
+        component = translation.component
+        if cls.supported_formats and component.file_format not in cls.supported_formats:
+            return False
+        return not cls.requires_template or component.has_template()
 
     @cached_property
     def storage(self):
@@ -177,27 +192,87 @@ class BaseExporter:
 
         self.storage.addunit(output)
 
-    def get_response(self, filetemplate="{project}-{language}.{extension}"):
-        filename = filetemplate.format(
+    def get_filename(self, filetemplate):
+        return filetemplate.format(
             project=self.project.slug,
             language=self.language.code,
             extension=self.extension,
         )
 
+    def get_response(self, filetemplate="{project}-{language}.{extension}"):
         response = HttpResponse(
             content_type="{0}; charset=utf-8".format(self.content_type)
         )
-        response["Content-Disposition"] = "attachment; filename={0}".format(filename)
+        response["Content-Disposition"] = "attachment; filename={0}".format(
+            self.get_filename(filetemplate)
+        )
 
         # Save to response
         response.write(self.serialize())
 
         return response
 
+    def get_streaming_response(
+        self, chunks, filetemplate="{project}-{language}.{extension}"
+    ):
+        """Return response serializing units from chunks on the fly."""
+        response = StreamingHttpResponse(
+            self.iter_serialize(chunks),
+            content_type="{0}; charset=utf-8".format(self.content_type),
+        )
+        response["Content-Disposition"] = "attachment; filename={0}".format(
+            self.get_filename(filetemplate)
+        )
+        return response
+
     def serialize(self):
         """Return storage content."""
         return TTKitFormat.serialize(self.storage)
 
+    def reset_storage(self):
+        """Discard current storage, new one is created on next access."""
+        self.__dict__.pop("storage", None)
+
+    def serialize_units(self, units):
+        """Serialize storage containing only given units."""
+        current = self.storage.units
+        self.storage.units = units
+        try:
+            return self.serialize()
+        finally:
+            self.storage.units = current
+
+    def split_serialized(self):
+        """Split serialized storage to header, units and footer."""
+        raise NotImplementedError()
+
+    def iter_serialize(self, chunks):
+        """Serialize units coming in chunks.
+
+        Every chunk is added to a fresh storage, which is then serialized and
+        split to header, units and footer. The header is emitted before the
+        first chunk and the footer after the last one, so only single chunk
+        is kept in memory.
+        """
+        footer = None
+        for chunk in chunks:
+            self.reset_storage()
+            self.add_units(chunk)
+            header, content, chunk_footer = self.split_serialized()
+            if not content:
+                continue
+            if footer is None:
+                yield header
+            else:
+                yield self.chunk_separator
+            yield content
+            footer = chunk_footer
+        self.reset_storage()
+        if footer is None:
+            yield self.serialize()
+        else:
+            yield footer
+
     def store_flags(self, output, flags):
         return
 
@@ -208,6 +283,14 @@ class PoExporter(BaseExporter):
     extension = "po"
     verbose = _("gettext PO")
     storage_class = pofile
+    streaming = True
+    chunk_separator = b"\n"
+
+    def split_serialized(self):
+        units = self.storage.units
+        header = self.serialize_units([unit for unit in units if unit.isheader()])
+        content = self.serialize_units([unit for unit in units if not unit.isheader()])
+        return header + self.chunk_separator, content, b""
 
     def store_flags(self, output, flags):
         for flag in flags.items():
@@ -246,6 +329,17 @@ class XMLExporter(BaseExporter):
     def add(self, unit, word):
         unit.settarget(word, self.language.code)
 
+    def split_serialized(self):
+        # Units can not contain the markers as text is escaped there
+        body = self.storage.body
+        body.insert(0, Comment(STREAM_START))
+        body.append(Comment(STREAM_END))
+        header, content = self.serialize().split(
+            "<!--{}-->".format(STREAM_START).encode(), 1
+        )
+        content, footer = content.split("<!--{}-->".format(STREAM_END).encode(), 1)
+        return header.rstrip(), content.rstrip(), footer
+
 
 class PoXliffExporter(XMLExporter):
     name = "xliff"
@@ -254,6 +348,7 @@ class PoXliffExporter(XMLExporter):
     set_id = True
     verbose = _("XLIFF with gettext extensions")
     storage_class = PoXliffFile
+    streaming = True
 
     def store_flags(self, output, flags):
         if flags.has_value("max-length"):
@@ -293,6 +388,7 @@ class TBXExporter(XMLExporter):
     extension = "tbx"
     verbose = _("TBX")
     storage_class = tbxfile
+    streaming = True
 
 
 class TMXExporter(XMLExporter):
@@ -301,6 +397,7 @@ class TMXExporter(XMLExporter):
     extension = "tmx"
     verbose = _("TMX")
     storage_class = tmxfile
+    streaming = True
 
 
 class MoExporter(PoExporter):
@@ -308,7 +405,9 @@ class MoExporter(PoExporter):
     content_type = "application/x-gettext-catalog"
     extension = "mo"
     verbose = _("gettext MO")
+    supported_formats = ("po",)
     storage_class = mofile
+    streaming = False
 
     def __init__(
         self,
@@ -363,10 +462,6 @@ class MoExporter(PoExporter):
         # Add unit to the storage
         self.storage.addunit(output)
 
-    @staticmethod
-    def supports(translation):
-        return translation.component.file_format == "po"
-
 
 class CVSBaseExporter(BaseExporter):
     storage_class = csvfile
@@ -380,6 +475,11 @@ class CSVExporter(CVSBaseExporter):
     content_type = "text/csv"
     extension = "csv"
     verbose = _("CSV")
+    streaming = True
+
+    def split_serialized(self):
+        header = self.serialize_units([])
+        return header, self.serialize()[len(header) :], b""
 
     def string_filter(self, text):
         """Avoid Excel interpreting text as formula.
@@ -410,9 +510,7 @@ class XlsxExporter(CVSBaseExporter):
 class MonolingualExporter(BaseExporter):
     """Base class for monolingual exports."""
 
-    @staticmethod
-    def supports(translation):
-        return translation.component.has_template()
+    requires_template = True
 
     def build_unit(self, unit):
         output = self.storage.UnitClass(unit.context)
@@ -427,6 +525,14 @@ class JSONExporter(MonolingualExporter):
     content_type = "application/json"
     extension = "json"
     verbose = _("JSON")
+    streaming = True
+    chunk_separator = b",\n"
+
+    def split_serialized(self):
+        data = self.serialize()
+        start = data.index(b"{") + 1
+        end = data.rindex(b"}")
+        return data[:start] + b"\n", data[start:end].strip(b"\n"), b"\n" + data[end:]
 
 
 class AndroidResourceExporter(MonolingualExporter):
@@ -0,0 +1,82 @@
+#
+# Copyright © 2012 - 2020 Michal Čihař <michal@cihar.com>
+#
+# This file is part of Weblate <https://weblate.org/>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+
+import json
+import os
+import subprocess
+import sys
+from statistics import median
+
+from weblate.utils.management.base import BaseCommand
+
+SCRIPT = """
+import json
+import sys
+import time
+
+start = time.monotonic()
+
+import django
+
+django.setup()
+
+from weblate.formats.models import EXPORTERS, FILE_FORMATS
+
+FILE_FORMATS.get_choices()
+FILE_FORMATS.autoload
+EXPORTERS.get_choices()
+if sys.argv[1] == "eager":
+    FILE_FORMATS.load_data()
+    EXPORTERS.load_data()
+print(json.dumps({"time": time.monotonic() - start, "modules": len(sys.modules)}))
+"""
+
+
+class Command(BaseCommand):
+    """Measure cold start cost of the file format registry."""
+
+    help = "benchmarks loading of file formats and exporters"
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--rounds", type=int, default=5, help="number of measured processes"
+        )
+
+    def run(self, mode):
+        output = subprocess.run(
+            [sys.executable, "-c", SCRIPT, mode],
+            check=True,
+            capture_output=True,
+            env=os.environ,
+            text=True,
+        ).stdout
+        return json.loads(output.splitlines()[-1])
+
+    def handle(self, *args, **options):
+        for mode in ("lazy", "eager"):
+            results = [self.run(mode) for _i in range(options["rounds"])]
+            self.stdout.write(
+                "{}: {:.3f} s, {} modules".format(
+                    mode,
+                    median(result["time"] for result in results),
+                    results[0]["modules"],
+                )
+            )
@@ -0,0 +1,591 @@
+#
+# Copyright © 2012 - 2020 Michal Čihař <michal@cihar.com>
+#
+# This file is part of Weblate <https://weblate.org/>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Static metadata of the built-in file formats and exporters.
+
+The registries in weblate.formats.models use this to list formats and their
+capabilities without importing the modules implementing them. The manifest
+has to be kept in sync with the classes, this is verified in the testsuite.
+"""
+
+from django.utils.translation import gettext_lazy as _
+
+FORMATS_MANIFEST = {
+    "weblate.formats.ttkit.PoFormat": {
+        "id": "po",
+        "name": _("gettext PO file"),
+        "autoload": ("*.po", "*.pot"),
+        "monolingual": False,
+        "can_add_unit": True,
+        "new_translation": False,
+        "update_bilingual": True,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.PoMonoFormat": {
+        "id": "po-mono",
+        "name": _("gettext PO file (monolingual)"),
+        "autoload": (),
+        "monolingual": True,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": True,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.TSFormat": {
+        "id": "ts",
+        "name": _("Qt Linguist translation file"),
+        "autoload": ("*.ts",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.XliffFormat": {
+        "id": "xliff",
+        "name": _("XLIFF translation file"),
+        "autoload": ("*.xlf", "*.xliff"),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.PoXliffFormat": {
+        "id": "poxliff",
+        "name": _("XLIFF translation file with PO extensions"),
+        "autoload": ("*.poxliff",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.StringsFormat": {
+        "id": "strings",
+        "name": _("iOS strings (UTF-16)"),
+        "autoload": ("*.strings",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.StringsUtf8Format": {
+        "id": "strings-utf8",
+        "name": _("iOS strings (UTF-8)"),
+        "autoload": ("*.strings",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.PropertiesUtf8Format": {
+        "id": "properties-utf8",
+        "name": _("Java Properties (UTF-8)"),
+        "autoload": (),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.PropertiesUtf16Format": {
+        "id": "properties-utf16",
+        "name": _("Java Properties (UTF-16)"),
+        "autoload": (),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.PropertiesFormat": {
+        "id": "properties",
+        "name": _("Java Properties (ISO 8859-1)"),
+        "autoload": ("*.properties",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.JoomlaFormat": {
+        "id": "joomla",
+        "name": _("Joomla Language File"),
+        "autoload": ("*.ini",),
+        "monolingual": True,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.GWTFormat": {
+        "id": "gwt",
+        "name": _("GWT Properties"),
+        "autoload": ("*.strings",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.PhpFormat": {
+        "id": "php",
+        "name": _("PHP strings"),
+        "autoload": ("*.php",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": ("phply",),
+    },
+    "weblate.formats.ttkit.LaravelPhpFormat": {
+        "id": "laravel",
+        "name": _("Laravel PHP strings"),
+        "autoload": ("*.php",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": ("phply",),
+    },
+    "weblate.formats.ttkit.RESXFormat": {
+        "id": "resx",
+        "name": _(".NET resource file"),
+        "autoload": ("*.resx",),
+        "monolingual": True,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.AndroidFormat": {
+        "id": "aresource",
+        "name": _("Android String Resource"),
+        "autoload": ("strings*.xml", "values*.xml"),
+        "monolingual": True,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.JSONFormat": {
+        "id": "json",
+        "name": _("JSON file"),
+        "autoload": ("*.json",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.JSONNestedFormat": {
+        "id": "json-nested",
+        "name": _("JSON nested structure file"),
+        "autoload": (),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.WebExtensionJSONFormat": {
+        "id": "webextension",
+        "name": _("WebExtension JSON file"),
+        "autoload": ("messages*.json",),
+        "monolingual": True,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.I18NextFormat": {
+        "id": "i18next",
+        "name": _("i18next JSON file"),
+        "autoload": (),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.GoI18JSONFormat": {
+        "id": "go-i18n-json",
+        "name": _("go-i18n JSON file"),
+        "autoload": (),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.ARBFormat": {
+        "id": "arb",
+        "name": _("ARB file"),
+        "autoload": ("*.arb",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.CSVFormat": {
+        "id": "csv",
+        "name": _("CSV file"),
+        "autoload": ("*.csv",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.CSVSimpleFormat": {
+        "id": "csv-simple",
+        "name": _("Simple CSV file"),
+        "autoload": ("*.txt",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.CSVSimpleFormatISO": {
+        "id": "csv-simple-iso",
+        "name": _("Simple CSV file (ISO-8859-1)"),
+        "autoload": (),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.YAMLFormat": {
+        "id": "yaml",
+        "name": _("YAML file"),
+        "autoload": ("*.pyml",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": ("ruamel.yaml",),
+    },
+    "weblate.formats.ttkit.RubyYAMLFormat": {
+        "id": "ruby-yaml",
+        "name": _("Ruby YAML file"),
+        "autoload": ("*.ryml", "*.yml", "*.yaml"),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": ("ruamel.yaml",),
+    },
+    "weblate.formats.ttkit.SubRipFormat": {
+        "id": "srt",
+        "name": _("SubRip subtitle file"),
+        "autoload": ("*.srt",),
+        "monolingual": True,
+        "can_add_unit": True,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": ("aeidon",),
+    },
+    "weblate.formats.ttkit.MicroDVDFormat": {
+        "id": "sub",
+        "name": _("MicroDVD subtitle file"),
+        "autoload": ("*.sub",),
+        "monolingual": True,
+        "can_add_unit": True,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": ("aeidon",),
+    },
+    "weblate.formats.ttkit.AdvSubStationAlphaFormat": {
+        "id": "ass",
+        "name": _("Advanced SubStation Alpha subtitle file"),
+        "autoload": ("*.ass",),
+        "monolingual": True,
+        "can_add_unit": True,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": ("aeidon",),
+    },
+    "weblate.formats.ttkit.SubStationAlphaFormat": {
+        "id": "ssa",
+        "name": _("SubStation Alpha subtitle file"),
+        "autoload": ("*.ssa",),
+        "monolingual": True,
+        "can_add_unit": True,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": ("aeidon",),
+    },
+    "weblate.formats.ttkit.DTDFormat": {
+        "id": "dtd",
+        "name": _("DTD file"),
+        "autoload": ("*.dtd",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.FlatXMLFormat": {
+        "id": "flatxml",
+        "name": _("Flat XML file"),
+        "autoload": (),
+        "monolingual": True,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.INIFormat": {
+        "id": "ini",
+        "name": _("INI file"),
+        "autoload": (),
+        "monolingual": True,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": ("iniparse",),
+    },
+    "weblate.formats.ttkit.InnoSetupINIFormat": {
+        "id": "islu",
+        "name": _("Inno Setup INI file"),
+        "autoload": (),
+        "monolingual": True,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": ("iniparse",),
+    },
+    "weblate.formats.external.XlsxFormat": {
+        "id": "xlsx",
+        "name": _("Excel Open XML"),
+        "autoload": ("*.xlsx",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.txt.AppStoreFormat": {
+        "id": "appstore",
+        "name": _("App store metadata files"),
+        "autoload": (),
+        "monolingual": True,
+        "can_add_unit": False,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.convert.HTMLFormat": {
+        "id": "html",
+        "name": _("HTML file"),
+        "autoload": ("*.htm", "*.html"),
+        "monolingual": True,
+        "can_add_unit": False,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.convert.IDMLFormat": {
+        "id": "idml",
+        "name": _("IDML file"),
+        "autoload": ("*.idml", "*.idms"),
+        "monolingual": True,
+        "can_add_unit": False,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.convert.OpenDocumentFormat": {
+        "id": "odf",
+        "name": _("OpenDocument file"),
+        "autoload": (
+            "*.sxw",
+            "*.odt",
+            "*.ods",
+            "*.odp",
+            "*.odg",
+            "*.odc",
+            "*.odf",
+            "*.odi",
+            "*.odm",
+            "*.ott",
+            "*.ots",
+            "*.otp",
+            "*.otg",
+            "*.otc",
+            "*.otf",
+            "*.oti",
+            "*.oth",
+        ),
+        "monolingual": True,
+        "can_add_unit": False,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.convert.WindowsRCFormat": {
+        "id": "rc",
+        "name": _("RC file"),
+        "autoload": ("*.rc",),
+        "monolingual": True,
+        "can_add_unit": False,
+        "new_translation": False,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.XWikiPropertiesFormat": {
+        "id": "xwiki-java-properties",
+        "name": "XWiki Java Properties",
+        "autoload": ("*.properties",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.XWikiPagePropertiesFormat": {
+        "id": "xwiki-page-properties",
+        "name": "XWiki Page Properties",
+        "autoload": ("*.properties",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+    "weblate.formats.ttkit.XWikiFullPageFormat": {
+        "id": "xwiki-fullpage",
+        "name": "XWiki Full Page",
+        "autoload": ("*.properties",),
+        "monolingual": None,
+        "can_add_unit": True,
+        "new_translation": True,
+        "update_bilingual": False,
+        "requires": (),
+    },
+}
+
+EXPORTERS_MANIFEST = {
+    "weblate.formats.exporters.PoExporter": {
+        "id": "po",
+        "name": "po",
+        "verbose": _("gettext PO"),
+        "extension": "po",
+        "content_type": "text/x-po",
+        "supported_formats": (),
+        "requires_template": False,
+    },
+    "weblate.formats.exporters.PoXliffExporter": {
+        "id": "xliff",
+        "name": "xliff",
+        "verbose": _("XLIFF with gettext extensions"),
+        "extension": "xlf",
+        "content_type": "application/x-xliff+xml",
+        "supported_formats": (),
+        "requires_template": False,
+    },
+    "weblate.formats.exporters.XliffExporter": {
+        "id": "xliff11",
+        "name": "xliff11",
+        "verbose": _("XLIFF 1.1"),
+        "extension": "xlf",
+        "content_type": "application/x-xliff+xml",
+        "supported_formats": (),
+        "requires_template": False,
+    },
+    "weblate.formats.exporters.TBXExporter": {
+        "id": "tbx",
+        "name": "tbx",
+        "verbose": _("TBX"),
+        "extension": "tbx",
+        "content_type": "application/x-tbx",
+        "supported_formats": (),
+        "requires_template": False,
+    },
+    "weblate.formats.exporters.TMXExporter": {
+        "id": "tmx",
+        "name": "tmx",
+        "verbose": _("TMX"),
+        "extension": "tmx",
+        "content_type": "application/x-tmx",
+        "supported_formats": (),
+        "requires_template": False,
+    },
+    "weblate.formats.exporters.MoExporter": {
+        "id": "mo",
+        "name": "mo",
+        "verbose": _("gettext MO"),
+        "extension": "mo",
+        "content_type": "application/x-gettext-catalog",
+        "supported_formats": ("po",),
+        "requires_template": False,
+    },
+    "weblate.formats.exporters.CSVExporter": {
+        "id": "csv",
+        "name": "csv",
+        "verbose": _("CSV"),
+        "extension": "csv",
+        "content_type": "text/csv",
+        "supported_formats": (),
+        "requires_template": False,
+    },
+    "weblate.formats.exporters.XlsxExporter": {
+        "id": "xlsx",
+        "name": "xlsx",
+        "verbose": _("Excel Open XML"),
+        "extension": "xlsx",
+        "content_type": (
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        ),
+        "supported_formats": (),
+        "requires_template": False,
+    },
+    "weblate.formats.exporters.JSONExporter": {
+        "id": "json",
+        "name": "json",
+        "verbose": _("JSON"),
+        "extension": "json",
+        "content_type": "application/json",
+        "supported_formats": (),
+        "requires_template": True,
+    },
+    "weblate.formats.exporters.AndroidResourceExporter": {
+        "id": "aresource",
+        "name": "aresource",
+        "verbose": _("Android String Resource"),
+        "extension": "xml",
+        "content_type": "application/xml",
+        "supported_formats": (),
+        "requires_template": True,
+    },
+    "weblate.formats.exporters.StringsExporter": {
+        "id": "strings",
+        "name": "strings",
+        "verbose": _("iOS strings"),
+        "extension": "strings",
+        "content_type": "text/plain",
+        "supported_formats": (),
+        "requires_template": True,
+    },
+}
@@ -21,24 +21,49 @@
 from appconf import AppConf
 from django.utils.functional import cached_property
 
-from weblate.utils.classloader import ClassLoader
+from weblate.formats.manifest import EXPORTERS_MANIFEST, FORMATS_MANIFEST
+from weblate.utils.classloader import ManifestClassLoader
 
 
-class ExporterLoader(ClassLoader):
+class ExporterLoader(ManifestClassLoader):
     def __init__(self):
-        super().__init__("WEBLATE_EXPORTERS", False)
+        super().__init__("WEBLATE_EXPORTERS", False, EXPORTERS_MANIFEST)
+
+    def get_metadata(self, obj):
+        return {
+            "id": obj.get_identifier(),
+            "name": obj.name,
+            "verbose": obj.verbose,
+            "extension": obj.extension,
+            "content_type": obj.content_type,
+            "supported_formats": obj.supported_formats,
+            "requires_template": obj.requires_template,
+        }
+
+    def supports(self, key, translation):
+        """Check whether exporter supports translation without importing it."""
+        if key in self.loaded:
+            return self.loaded[key].supports(translation)
+        info = self.get_info(key)
+        component = translation.component
+        if (
+            info.supported_formats
+            and component.file_format not in info.supported_formats
+        ):
+            return False
+        return not info.requires_template or component.has_template()
 
     def list_exporters(self, translation):
         return [
             {"name": x.name, "verbose": x.verbose}
-            for x in sorted(self.values(), key=lambda x: x.name)
-            if x.supports(translation)
+            for x in sorted(map(self.get_info, self), key=lambda x: x.name)
+            if self.supports(x.id, translation)
         ]
 
     def list_exporters_filter(self, allowed):
         return [
             {"name": x.name, "verbose": x.verbose}
-            for x in sorted(self.values(), key=lambda x: x.name)
+            for x in sorted(map(self.get_info, self), key=lambda x: x.name)
             if x.name in allowed
         ]
 
@@ -46,28 +71,31 @@ class ExporterLoader(ClassLoader):
 EXPORTERS = ExporterLoader()
 
 
-class FileFormatLoader(ClassLoader):
+class FileFormatLoader(ManifestClassLoader):
     def __init__(self):
-        super().__init__("WEBLATE_FORMATS", False)
-        self.errors = {}
+        super().__init__("WEBLATE_FORMATS", False, FORMATS_MANIFEST)
+
+    def get_metadata(self, obj):
+        return {
+            "id": obj.get_identifier(),
+            "name": obj.name,
+            "autoload": obj.autoload,
+            "monolingual": obj.monolingual,
+            "can_add_unit": obj.can_add_unit,
+            "new_translation": bool(obj.new_translation),
+            "update_bilingual": hasattr(obj, "update_bilingual"),
+        }
+
+    def validate(self, obj):
+        obj.get_class()
 
     @cached_property
     def autoload(self):
+        """List of autoload patterns and matching format identifiers."""
         result = []
-        for fileformat in self.data.values():
-            for autoload in fileformat.autoload:
-                result.append((autoload, fileformat))
-        return result
-
-    def load_data(self):
-        result = super().load_data()
-        for fileformat in list(result.values()):
-            try:
-                fileformat.get_class()
-            except (AttributeError, ImportError) as error:
-                result.pop(fileformat.format_id)
-                self.errors[fileformat.format_id] = str(error)
-
+        for format_id in self:
+            for autoload in self.get_info(format_id).autoload:
+                result.append((autoload, format_id))
         return result
 
 
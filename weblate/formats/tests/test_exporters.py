@@ -85,7 +85,7 @@ class PoExporterTest(BaseTestCase):
     def test_glossary_special(self):
         self.check_glossary(Term(source="bar\x1e\x1efoo", target="br\x1eff"))
 
-    def check_unit(self, nplurals=3, template=None, source_info=None, **kwargs):
+    def get_translation(self, nplurals=3, template=None):
         if nplurals == 3:
             formula = "n==0 ? 0 : n==1 ? 1 : 2"
         else:
@@ -103,6 +103,9 @@ class PoExporterTest(BaseTestCase):
         translation = Translation(language=lang, component=component, plural=plural)
         # Fake file format to avoid need for actual files
         translation.store = EmptyFormat(BytesIOMode("", b""))
+        return translation
+
+    def get_unit(self, translation, source_info=None, **kwargs):
         unit = Unit(translation=translation, id_hash=-1, **kwargs)
         if source_info:
             for key, value in source_info.items():
@@ -117,10 +120,41 @@ class PoExporterTest(BaseTestCase):
         else:
             unit.__dict__["unresolved_comments"] = []
         unit.source_unit = unit
-        exporter = self.get_exporter(lang, translation=translation)
+        return unit
+
+    def check_unit(self, nplurals=3, template=None, source_info=None, **kwargs):
+        translation = self.get_translation(nplurals, template)
+        unit = self.get_unit(translation, source_info, **kwargs)
+        exporter = self.get_exporter(translation.language, translation=translation)
         exporter.add_unit(unit)
         return self.check_export(exporter)
 
+    def test_streaming(self):
+        if not self._class.streaming:
+            self.skipTest("Streaming not supported")
+        translation = self.get_translation(template="template")
+        units = [
+            self.get_unit(
+                translation,
+                source="source {}".format(i),
+                target="target {}".format(i),
+                context="context{}".format(i),
+                state=STATE_TRANSLATED,
+            )
+            for i in range(5)
+        ]
+        exporter = self.get_exporter(translation.language, translation=translation)
+        exporter.add_units(units)
+        expected = exporter.serialize()
+        exporter = self.get_exporter(translation.language, translation=translation)
+        streamed = b"".join(exporter.iter_serialize([units[:2], [], units[2:]]))
+        self.assertEqual(streamed, expected)
+        # Empty export
+        exporter = self.get_exporter(translation.language, translation=translation)
+        expected = exporter.serialize()
+        exporter = self.get_exporter(translation.language, translation=translation)
+        self.assertEqual(b"".join(exporter.iter_serialize([])), expected)
+
     def test_unit(self):
         self.check_unit(source="xxx", target="yyy")
 
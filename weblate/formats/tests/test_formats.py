@@ -22,6 +22,7 @@ import os.path
 import shutil
 from io import BytesIO
 from unittest import SkipTest, TestCase
+from unittest.mock import patch
 
 from django.utils.encoding import force_str
 from lxml import etree
@@ -232,6 +233,61 @@ class AutoFormatTest(FixtureTestCase, TempDirMixin):
     def test_edit(self):
         self.test_save(True)
 
+    def prepare_in_place(self):
+        if not getattr(self.FORMAT, "can_patch", False):
+            raise SkipTest("Not supported")
+        testfile = os.path.join(self.tempdir, os.path.basename(self.FILE))
+        shutil.copy(self.FILE, testfile)
+        # Normalize the file first, only such units can be found
+        self.parse_file(testfile).save()
+        storage = self.parse_file(testfile)
+        storage.all_units[self.EDIT_OFFSET].set_target(self.EDIT_TARGET)
+        return testfile, storage
+
+    def test_edit_in_place(self):
+        testfile, storage = self.prepare_in_place()
+        with open(testfile, "rb") as handle:
+            testdata = handle.read()
+
+        with patch.object(storage, "save_content") as save_content:
+            storage.save()
+        save_content.assert_not_called()
+
+        with open(testfile, "rb") as handle:
+            newdata = handle.read()
+        self.assertNotEqual(newdata, testdata)
+        storage = self.parse_file(testfile)
+        self.assertEqual(storage.all_units[self.EDIT_OFFSET].target, self.EDIT_TARGET)
+
+    def test_edit_in_place_fallback(self):
+        testfile, storage = self.prepare_in_place()
+        # Unit is not found in the changed file
+        with open(testfile, "wb") as handle:
+            handle.write(b"")
+
+        with patch.object(
+            storage, "save_content", wraps=storage.save_content
+        ) as save_content:
+            storage.save()
+        save_content.assert_called_once()
+
+        storage = self.parse_file(testfile)
+        self.assertEqual(len(storage.all_units), self.COUNT)
+        self.assertEqual(storage.all_units[self.EDIT_OFFSET].target, self.EDIT_TARGET)
+
+    def assert_edit_in_place_entry(self, content, offset, expected):
+        """Edit unit in file containing other entry with similar content."""
+        testfile = os.path.join(self.tempdir, "test.{0}".format(self.EXT))
+        with open(testfile, "wb") as handle:
+            handle.write(content)
+        storage = self.parse_file(testfile)
+        storage.all_units[offset].set_target("Changed")
+        storage.save()
+        storage = self.parse_file(testfile)
+        self.assertEqual(
+            {unit.unit.getid(): unit.target for unit in storage.all_units}, expected
+        )
+
     def assert_same(self, newdata, testdata):
         """Content aware comparison.
 
@@ -382,6 +438,13 @@ class PropertiesFormatTest(AutoFormatTest):
     NEW_UNIT_MATCH = b"\nkey=Source string\n"
     EXPECTED_FLAGS = ""
 
+    def test_edit_in_place_suffix(self):
+        if self.FORMAT is not PropertiesFormat:
+            raise SkipTest("Different structure")
+        self.assert_edit_in_place_entry(
+            b"ba=x\na = x\n", 1, {"ba": "x", "a": "Changed"}
+        )
+
     def assert_same(self, newdata, testdata):
         self.assertEqual(
             force_str(newdata).strip().splitlines(),
@@ -448,6 +511,15 @@ class JSONFormatTest(AutoFormatTest):
     def assert_same(self, newdata, testdata):
         self.assertJSONEqual(force_str(newdata), force_str(testdata))
 
+    def test_edit_in_place_nested(self):
+        if self.FORMAT is not JSONFormat:
+            raise SkipTest("Different structure")
+        self.assert_edit_in_place_entry(
+            b'{\n  "a": "x",\n  "b": {\n    "a": "x"\n  }\n}\n',
+            0,
+            {".a": "Changed", ".b.a": "x"},
+        )
+
 
 class JSONNestedFormatTest(JSONFormatTest):
     FORMAT = JSONNestedFormat
@@ -0,0 +1,69 @@
+#
+# Copyright © 2012 - 2020 Michal Čihař <michal@cihar.com>
+#
+# This file is part of Weblate <https://weblate.org/>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""File format registry tests."""
+
+from types import SimpleNamespace
+from unittest import TestCase
+
+from weblate.formats.manifest import EXPORTERS_MANIFEST, FORMATS_MANIFEST
+from weblate.formats.models import EXPORTERS, FILE_FORMATS, ExporterLoader
+from weblate.utils.classloader import load_class
+
+
+class ManifestTest(TestCase):
+    def assert_manifest(self, loader, manifest):
+        for path, metadata in manifest.items():
+            metadata = metadata.copy()
+            metadata.pop("requires", None)
+            with self.subTest(path=path):
+                self.assertEqual(
+                    loader.get_metadata(load_class(path, "TEST")), metadata
+                )
+
+    def test_formats(self):
+        self.assert_manifest(FILE_FORMATS, FORMATS_MANIFEST)
+
+    def test_exporters(self):
+        self.assert_manifest(EXPORTERS, EXPORTERS_MANIFEST)
+
+    def test_autoload(self):
+        self.assertIn(("*.po", "po"), FILE_FORMATS.autoload)
+
+    def test_info(self):
+        self.assertEqual(FILE_FORMATS.get_info("po").name, "gettext PO file")
+        self.assertEqual(FILE_FORMATS["po"].format_id, "po")
+
+    def test_list_exporters(self):
+        loader = ExporterLoader()
+        for file_format, template in (("po", False), ("json", True)):
+            translation = SimpleNamespace(
+                component=SimpleNamespace(
+                    file_format=file_format, has_template=lambda: template
+                )
+            )
+            with self.subTest(file_format=file_format):
+                names = {item["name"] for item in loader.list_exporters(translation)}
+                # Listing uses manifest and does not import the exporters
+                self.assertEqual(loader.loaded, {})
+                self.assertEqual(
+                    names,
+                    {key for key in EXPORTERS if EXPORTERS[key].supports(translation)},
+                )
+                self.assertEqual("mo" in names, file_format == "po")
+                self.assertEqual("json" in names, template)
@@ -21,9 +21,12 @@
 
 import importlib
 import inspect
+import json
 import os
 import re
 import subprocess
+from copy import copy
+from io import BytesIO
 from typing import List, Optional, Tuple, Union
 
 from django.utils.functional import cached_property
@@ -60,6 +63,10 @@ from weblate.utils.errors import report_error
 LOCATIONS_RE = re.compile(r"^([+-]|.*, [+-]|.*:[+-])")
 SUPPORTS_FUZZY = (pounit, tsunit)
 XLIFF_FUZZY_STATES = {"new", "needs-translation", "needs-adaptation", "needs-l10n"}
+# Maximal number of changed units to update in place on save
+PATCH_UNITS_LIMIT = 100
+# Indentation of the first top level key in JSON file
+JSON_INDENT_RE = re.compile(rb"^\{\r?\n( *)\"")
 
 
 class TTKitUnit(TranslationUnit):
@@ -135,6 +142,7 @@ class TTKitUnit(TranslationUnit):
 
     def set_target(self, target):
         """Set translation unit target."""
+        self.parent.track_change(self.unit)
         self._invalidate_target()
         if isinstance(target, list):
             target = multistring(target)
@@ -142,12 +150,14 @@ class TTKitUnit(TranslationUnit):
 
     def mark_fuzzy(self, fuzzy):
         """Set fuzzy flag on translated unit."""
+        self.parent.track_change(self.unit)
         if "flags" in self.__dict__:
             del self.__dict__["flags"]
         self.unit.markfuzzy(fuzzy)
 
     def mark_approved(self, value):
         """Set approved flag on translated unit."""
+        self.parent.track_change(self.unit)
         if "flags" in self.__dict__:
             del self.__dict__["flags"]
         if hasattr(self.unit, "markapproved"):
@@ -213,11 +223,14 @@ class KeyValueUnit(TTKitUnit):
 class TTKitFormat(TranslationFormat):
     unit_class = TTKitUnit
     loader = ("", "")
+    # Whether changed units can be updated in place, see save_patched
+    can_patch = False
 
     def __init__(
         self, storefile, template_store=None, language_code=None, is_template=False
     ):
         super().__init__(storefile, template_store, language_code, is_template)
+        self.reset_changes()
         # Set language (needed for some which do not include this)
         if language_code is not None and self.store.gettargetlanguage() is None:
             # This gets already native language code, so no conversion is needed
@@ -284,6 +297,8 @@ class TTKitFormat(TranslationFormat):
 
     def add_unit(self, ttkit_unit):
         """Add new unit to underlaying store."""
+        # New units can not be updated in place
+        self.patch_units = None
         if isinstance(self.store, LISAfile):
             # LISA based stores need to know this
             self.store.addunit(ttkit_unit, new=True)
@@ -296,7 +311,124 @@ class TTKitFormat(TranslationFormat):
 
     def save(self):
         """Save underlaying store to disk."""
-        self.save_atomic(self.storefile, self.save_content)
+        if not self.save_patched():
+            self.save_atomic(self.storefile, self.save_content)
+        self.reset_changes()
+
+    def reset_changes(self):
+        """Start tracking of changed units for in place update."""
+        # Maps unit id to tuple of unit and its content in the file,
+        # None indicates that the whole store has to be saved
+        self.patch_units = {} if self.can_patch else None
+
+    def track_change(self, ttkit_unit):
+        """Remember unit content prior to changing it."""
+        if self.patch_units is None or id(ttkit_unit) in self.patch_units:
+            return
+        if len(self.patch_units) >= PATCH_UNITS_LIMIT:
+            # Too many changes, it is faster to serialize the whole store
+            self.patch_units = None
+            return
+        self.patch_units[id(ttkit_unit)] = (
+            ttkit_unit,
+            self.get_unit_content(ttkit_unit),
+        )
+
+    def get_unit_content(self, ttkit_unit) -> Optional[bytes]:
+        """Return unit as it is serialized in the file.
+
+        Returns None when the unit can not be updated in place.
+        """
+        raise NotImplementedError()
+
+    def is_unit_boundary(self, content: bytes, start: int, end: int) -> bool:
+        """Check that matched content is a whole entry in the file."""
+        return content[start - 1 : start] in (b"", b"\n") and (
+            content[end - 1 : end] == b"\n"
+            or content[end : end + 1] in (b"", b"\r", b"\n")
+        )
+
+    def find_unit_content(self, content: bytes, original: bytes) -> Optional[int]:
+        """Return offset of the unit in the file.
+
+        Returns None unless there is exactly one whole entry matching.
+        """
+        result = None
+        start = content.find(original)
+        while start != -1:
+            if self.is_unit_boundary(content, start, start + len(original)):
+                if result is not None:
+                    return None
+                result = start
+            start = content.find(original, start + 1)
+        return result
+
+    def verify_content(self, content: bytes) -> bool:
+        """Check that patched file is parsed back to the current store."""
+        try:
+            units = self.parse_store(BytesIO(content)).units
+        except Exception:
+            return False
+        if len(units) != len(self.store.units):
+            return False
+        for unit, ttkit_unit in zip(units, self.store.units):
+            if unit.getid() != ttkit_unit.getid():
+                return False
+            parsed = self.unit_class(self, unit)
+            current = self.unit_class(self, ttkit_unit)
+            if (
+                parsed.target != current.target
+                or parsed.is_fuzzy() != current.is_fuzzy()
+            ):
+                return False
+        return True
+
+    def save_patched(self) -> bool:
+        """Update changed units in the file in place.
+
+        This avoids serializing the whole store when only few units were
+        changed. Returns False when the whole store needs to be saved.
+        """
+        if not self.patch_units or not isinstance(self.storefile, str):
+            return False
+        try:
+            with open(self.storefile, "rb") as handle:
+                content = handle.read()
+        except OSError:
+            return False
+
+        replacements = []
+        for ttkit_unit, original in self.patch_units.values():
+            updated = self.get_unit_content(ttkit_unit)
+            if original is None or updated is None:
+                return False
+            if original == updated:
+                continue
+            start = self.find_unit_content(content, original)
+            if start is None:
+                return False
+            replacements.append((start, start + len(original), updated))
+
+        if not replacements:
+            return True
+
+        parts = []
+        offset = 0
+        for start, end, updated in sorted(replacements):
+            if start < offset:
+                return False
+            parts.append(content[offset:start])
+            parts.append(updated)
+            offset = end
+        parts.append(content[offset:])
+        content = b"".join(parts)
+
+        # Make sure no other entry was changed
+        if not self.verify_content(content):
+            return False
+
+        self.save_atomic(self.storefile, lambda handle: handle.write(content))
+        return True
 
     @classmethod
     def mimetype(cls):
@@ -395,6 +527,7 @@ class TTKitFormat(TranslationFormat):
         return (unit for unit in self.store.units if not unit.isobsolete())
 
     def delete_unit(self, ttkit_unit) -> Optional[str]:
+        self.patch_units = None
         self.store.removeunit(ttkit_unit)
 
 
@@ -821,16 +954,25 @@ class INIUnit(TTKitUnit):
 
 class BasePoFormat(TTKitFormat, BilingualUpdateMixin):
     loader = pofile
+    can_patch = True
 
-    def get_plural(self, language):
-        """Return matching plural object."""
+    def get_plural_formula(self):
         from weblate.lang.models import Plural
 
         header = self.store.parseheader()
         try:
-            number, formula = Plural.parse_plural_forms(header["Plural-Forms"])
+            return Plural.parse_plural_forms(header["Plural-Forms"])
         except (ValueError, KeyError):
-            return super().get_plural(language)
+            return None
+
+    @staticmethod
+    def find_plural(language, plural_formula):
+        """Return matching plural object."""
+        from weblate.lang.models import Plural
+
+        if plural_formula is None:
+            return language.plural
+        number, formula = plural_formula
 
         # Find matching one
         for plural in language.plural_set.iterator():
@@ -870,8 +1012,21 @@ class BasePoFormat(TTKitFormat, BilingualUpdateMixin):
         ):
             kwargs["Content_Type"] = "text/plain; charset=UTF-8"
 
+        header_unit = self.store.header()
+        if header_unit is None:
+            # Header will be added
+            self.patch_units = None
+        else:
+            self.track_change(header_unit)
+
         self.store.updateheader(**kwargs)
 
+    def get_unit_content(self, ttkit_unit) -> Optional[bytes]:
+        try:
+            return str(ttkit_unit).encode(self.store.encoding)
+        except (LookupError, UnicodeError):
+            return None
+
     @classmethod
     def do_bilingual_update(cls, in_file: str, out_file: str, template: str, **kwargs):
         """Wrapper around msgmerge."""
@@ -982,6 +1137,7 @@ class PoXliffFormat(XliffFormat):
 
 class PropertiesBaseFormat(TTKitFormat):
     unit_class = PropertiesUnit
+    can_patch = True
 
     def is_valid(self):
         result = super().is_valid()
@@ -1002,11 +1158,20 @@ class PropertiesBaseFormat(TTKitFormat):
     def construct_unit(self, source: str):
         return self.store.UnitClass(source, personality=self.store.personality.name)
 
+    def get_unit_content(self, ttkit_unit) -> Optional[bytes]:
+        try:
+            # The getoutput modifies the unit, so work on a copy
+            return copy(ttkit_unit).getoutput().encode(self.store.encoding)
+        except (LookupError, UnicodeError):
+            return None
+
 
 class StringsFormat(PropertiesBaseFormat):
     name = _("iOS strings (UTF-16)")
     format_id = "strings"
     loader = ("properties", "stringsfile")
+    # UTF-16 can not be updated in place due to byte order mark
+    can_patch = False
     new_translation: Optional[Union[str, bytes]] = "\n".encode("utf-16")
     autoload = ("*.strings",)
     language_format = "bcp"
@@ -1016,6 +1181,7 @@ class StringsUtf8Format(StringsFormat):
     name = _("iOS strings (UTF-8)")
     format_id = "strings-utf8"
     loader = ("properties", "stringsutf8file")
+    can_patch = True
     new_translation = "\n"
 
 
@@ -1031,6 +1197,7 @@ class PropertiesUtf16Format(PropertiesUtf8Format):
     name = _("Java Properties (UTF-16)")
     format_id = "properties-utf16"
     loader = ("properties", "javafile")
+    can_patch = False
     language_format = "java"
 
     @classmethod
@@ -1063,6 +1230,8 @@ class JoomlaFormat(PropertiesBaseFormat):
     name = _("Joomla Language File")
     format_id = "joomla"
     loader = ("properties", "joomlafile")
+    # Quoted values do not round trip through the unit
+    can_patch = False
     monolingual = True
     new_translation = "\n"
     autoload = ("*.ini",)
@@ -1129,6 +1298,7 @@ class JSONFormat(TTKitFormat):
     unit_class = JSONUnit
     autoload: Tuple[str, ...] = ("*.json",)
     new_translation = "{}\n"
+    can_patch = True
 
     @staticmethod
     def mimetype():
@@ -1140,11 +1310,43 @@ class JSONFormat(TTKitFormat):
         """Return most common file extension for format."""
         return "json"
 
+    def get_unit_content(self, ttkit_unit) -> Optional[bytes]:
+        # Only top level keys are supported
+        parts = ttkit_unit.IdClass.from_string(ttkit_unit.getid()).parts
+        if len(parts) != 1 or parts[0][0] != "key":
+            return None
+        dump_args = dict(self.store.dump_args)
+        if dump_args.get("sort_keys"):
+            # Keys would be reordered on save
+            return None
+        # Include indentation to match only top level keys
+        indent = dump_args.pop("indent", None)
+        if not isinstance(indent, int):
+            return None
+        try:
+            content = json.dumps({parts[0][1]: ttkit_unit.converttarget()}, **dump_args)
+            content = "\n" + " " * indent + content[1:-1]
+            return content.encode(self.store.encoding)
+        except (LookupError, UnicodeError, TypeError, ValueError):
+            return None
+
+    def is_unit_boundary(self, content: bytes, start: int, end: int) -> bool:
+        # The content starts with new line and indentation
+        return content[end : end + 1] in (b",", b"\r", b"\n")
+
+    def find_unit_content(self, content: bytes, original: bytes) -> Optional[int]:
+        # Nested keys would match when the file uses different indentation
+        match = JSON_INDENT_RE.match(content)
+        if match is None or len(match.group(1)) != self.store.dump_args.get("indent"):
+            return None
+        return super().find_unit_content(content, original)
+
 
 class JSONNestedFormat(JSONFormat):
     name = _("JSON nested structure file")
     format_id = "json-nested"
     loader = ("jsonl10n", "JsonNestedFile")
+    can_patch = False
     autoload = ()
 
 
@@ -1152,6 +1354,7 @@ class WebExtensionJSONFormat(JSONFormat):
     name = _("WebExtension JSON file")
     format_id = "webextension"
     loader = ("jsonl10n", "WebExtensionJsonFile")
+    can_patch = False
     monolingual = True
     autoload = ("messages*.json",)
     unit_class = WebExtensionJSONUnit
@@ -1161,6 +1364,7 @@ class I18NextFormat(JSONFormat):
     name = _("i18next JSON file")
     format_id = "i18next"
     loader = ("jsonl10n", "I18NextFile")
+    can_patch = False
     autoload = ()
     check_flags = ("i18next-interpolation",)
 
@@ -1169,6 +1373,7 @@ class GoI18JSONFormat(JSONFormat):
     name = _("go-i18n JSON file")
     format_id = "go-i18n-json"
     loader = ("jsonl10n", "GoI18NJsonFile")
+    can_patch = False
     autoload = ()
 
 
@@ -1176,6 +1381,7 @@ class ARBFormat(JSONFormat):
     name = _("ARB file")
     format_id = "arb"
     loader = ("jsonl10n", "ARBJsonFile")
+    can_patch = False
     autoload = ("*.arb",)
     unit_class = ARBJSONUnit
 
@@ -1486,6 +1692,8 @@ class XWikiPropertiesFormat(PropertiesBaseFormat):
     language_format = "java"
     autoload = ("*.properties",)
     new_translation = "\n"
+    # Units are rewritten on save
+    can_patch = False
 
     def save_content(self, handle):
         current_units = self.all_units
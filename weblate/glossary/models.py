@@ -35,7 +35,6 @@ from whoosh.analysis.filters import StopFilter
 from whoosh.lang import NoStopWords
 
 from weblate.checks.same import strip_string
-from weblate.formats.auto import AutodetectFormat
 from weblate.lang.models import Language, get_default_lang
 from weblate.trans.defines import GLOSSARY_LENGTH, PROJECT_NAME_LENGTH
 from weblate.trans.models.component import Component
@@ -103,6 +102,7 @@ class TermManager(models.Manager):
 
     def upload(self, request, glossary, language, fileobj, method):
         """Handle glossary upload."""
+        from weblate.formats.auto import AutodetectFormat
         from weblate.trans.models.change import Change
 
         store = AutodetectFormat.parse(fileobj)
@@ -19,14 +19,21 @@
 
 import gettext
 import re
+import threading
+import weakref
 from collections import defaultdict
 from itertools import chain
+from time import monotonic
+from uuid import uuid4
 
 from appconf import AppConf
 from django.conf import settings
+from django.core.cache import cache
 from django.db import models, transaction
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
 from django.db.utils import OperationalError
+from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.encoding import force_str
 from django.utils.functional import cached_property
@@ -55,6 +62,13 @@ PLURAL_TITLE = """
 """
 COPY_RE = re.compile(r"\([0-9]+\)")
 
+# Cache key shared by processes to detect changed languages
+LANGUAGE_INDEX_VERSION = "languages-index-version"
+# Interval in seconds for checking the version
+LANGUAGE_INDEX_INTERVAL = 5
+# Index including changes not yet committed in current thread
+ATOMIC_INDEX = threading.local()
+
 
 def get_plural_type(base_code, plural_formula):
     """Get correct plural type for language."""
@@ -92,6 +106,29 @@ def get_default_lang():
         return -1
 
 
+class LanguageIndex:
+    """Process local index of languages used for resolving codes."""
+
+    fields = ("id", "code", "name", "direction")
+
+    def __init__(self, languages):
+        self.exact = {}
+        self.codes = {}
+        self.names = {}
+        # Memoized results of fuzzy_get
+        self.resolved = {}
+        for values in languages:
+            self.exact[values[1]] = values
+            self.add(self.codes, values[1], values)
+            self.add(self.names, values[2], values)
+
+    @staticmethod
+    def add(lookup, key, values):
+        key = key.lower()
+        # Ambiguous match is not resolved, same as try_get does
+        lookup[key] = None if key in lookup else values
+
+
 class LanguageQuerySet(models.QuerySet):
     # pylint: disable=no-init
 
@@ -159,14 +196,25 @@ class LanguageQuerySet(models.QuerySet):
         ]
         if expanded_code:
             codes.append(expanded_code)
+        index = self.model.objects.index
         for newcode in codes:
             if newcode in ALIASES:
-                newcode = ALIASES[newcode]
-                ret = self.try_get(code=newcode)
+                ret = index.exact.get(ALIASES[newcode])
                 if ret is not None:
-                    return ret
+                    return self.from_index(ret)
         return None
 
+    def from_index(self, values):
+        """Construct language from values stored in the index."""
+        return self.model.from_db(self.db, LanguageIndex.fields, values)
+
+    def get_indexed(self, code):
+        """Get language by exact code without hitting the database."""
+        values = self.model.objects.index.exact.get(code)
+        if values is None:
+            raise self.model.DoesNotExist(code)
+        return self.from_index(values)
+
     def fuzzy_get(self, code, strict=False):
         """Get matching language for code.
 
@@ -174,36 +222,49 @@ class LanguageQuerySet(models.QuerySet):
         cs-CZ) or returns None.
 
         It also handles Android special naming of regional locales like pt-rBR.
+
+        The lookups are done against in-memory index of languages and results
+        are memoized there, the index is invalidated on language changes.
         """
+        index = self.model.objects.index
+        key = (code, settings.SIMPLIFY_LANGUAGES)
+        if key not in index.resolved:
+            index.resolved[key] = self.fuzzy_resolve(index, code)
+        ret = index.resolved[key]
+        if isinstance(ret, tuple):
+            return self.from_index(ret)
+        return None if strict else ret
+
+    def fuzzy_resolve(self, index, code):
+        """Resolve code to indexed language values or normalized code."""
         code = self.sanitize_code(code)
         expanded_code = None
 
         lookups = [
             # First try getting language as is
-            Q(code__iexact=code),
+            (index.codes, code),
             # Replace dash with underscore (for things as zh_Hant)
-            Q(code__iexact=code.replace("-", "_")),
+            (index.codes, code.replace("-", "_")),
             # Replace plus with underscore (for things as zh+Hant+HK on Android)
-            Q(code__iexact=code.replace("+", "_")),
+            (index.codes, code.replace("+", "_")),
             # Try using name
-            Q(name__iexact=code),
+            (index.names, code),
         ]
 
         # Country codes used without underscore (ptbr insteat of pt_BR)
         if len(code) == 4:
             expanded_code = "{}_{}".format(code[:2], code[2:]).lower()
-            lookups.append(Q(code__iexact=expanded_code))
+            lookups.append((index.codes, expanded_code))
 
-        for lookup in lookups:
-            # First try getting language as is
-            ret = self.try_get(lookup)
+        for lookup, value in lookups:
+            ret = lookup.get(value.lower())
             if ret is not None:
                 return ret
 
         # Handle aliases
         ret = self.aliases_get(code, expanded_code)
         if ret is not None:
-            return ret
+            return index.exact[ret.code]
 
         # Parse the string
         lang, country, subtags = self.parse_lang_country(code)
@@ -226,20 +287,20 @@ class LanguageQuerySet(models.QuerySet):
         if subtags:
             newcode += subtags
 
-        ret = self.try_get(code__iexact=newcode)
+        ret = index.codes.get(newcode.lower())
         if ret is not None:
             return ret
 
         # Try canonical variant
         if settings.SIMPLIFY_LANGUAGES:
             if newcode.lower() in DEFAULT_LANGS:
-                ret = self.try_get(code=lang.lower())
+                ret = index.exact.get(lang.lower())
             elif expanded_code in DEFAULT_LANGS:
-                ret = self.try_get(code=expanded_code[:2])
+                ret = index.exact.get(expanded_code[:2])
             if ret is not None:
                 return ret
 
-        return None if strict else newcode
+        return newcode
 
     def auto_get_or_create(self, code, create=True):
         """Try to get language using fuzzy_get and create it if that fails."""
@@ -258,7 +319,10 @@ class LanguageQuerySet(models.QuerySet):
         # Create standard language
         name = "{0} (generated)".format(code)
         if create:
-            lang = self.get_or_create(code=code, defaults={"name": name})[0]
+            lang, created = self.get_or_create(code=code, defaults={"name": name})
+            if not created:
+                # Created meanwhile by other process
+                return lang
         else:
             lang = Language(code=code, name=name)
 
@@ -337,9 +401,78 @@ class LanguageQuerySet(models.QuerySet):
 class LanguageManager(models.Manager.from_queryset(LanguageQuerySet)):
     use_in_migrations = True
 
+    def __init__(self):
+        super().__init__()
+        self._index = None
+        self._index_version = None
+        self._index_checked = 0
+
     def flush_object_cache(self):
         if "default_language" in self.__dict__:
             del self.__dict__["default_language"]
+        self._index = None
+
+    def invalidate_index(self):
+        """Invalidate in-memory index after language change."""
+        self.flush_object_cache()
+        hook = self.commit_index
+        if transaction.get_connection().in_atomic_block:
+            # The change might be rolled back, do not cache it until committed.
+            # Django drops the commit hook on rollback, what makes the weak
+            # reference dead and the index of the transaction is discarded.
+            ATOMIC_INDEX.hooks = getattr(ATOMIC_INDEX, "hooks", []) + [
+                weakref.ref(hook)
+            ]
+            ATOMIC_INDEX.index = None
+        # Other processes rebuild their index once the change is committed
+        transaction.on_commit(hook)
+
+    def commit_index(self):
+        # Hook executed immediately inside a transaction (as done in the
+        # testsuite), the rollback can not be tracked in this case
+        ATOMIC_INDEX.untracked = transaction.get_connection().in_atomic_block
+        ATOMIC_INDEX.hooks = []
+        ATOMIC_INDEX.index = None
+        self._index_version = uuid4().hex
+        cache.set(LANGUAGE_INDEX_VERSION, self._index_version, None)
+
+    def get_atomic_index(self):
+        """Return index including uncommitted changes if there are any."""
+        if getattr(ATOMIC_INDEX, "untracked", False):
+            if transaction.get_connection().in_atomic_block:
+                return LanguageIndex(self.values_list(*LanguageIndex.fields))
+            ATOMIC_INDEX.untracked = False
+        hooks = getattr(ATOMIC_INDEX, "hooks", None)
+        if not hooks:
+            return None
+        alive = [hook for hook in hooks if hook() is not None]
+        if len(alive) != len(hooks):
+            # Some of the changes were rolled back
+            ATOMIC_INDEX.hooks = alive
+            ATOMIC_INDEX.index = None
+            if not alive:
+                return None
+        if ATOMIC_INDEX.index is None:
+            ATOMIC_INDEX.index = LanguageIndex(self.values_list(*LanguageIndex.fields))
+        return ATOMIC_INDEX.index
+
+    @property
+    def index(self):
+        """Return in-memory index of languages."""
+        result = self.get_atomic_index()
+        if result is not None:
+            return result
+        now = monotonic()
+        if now - self._index_checked >= LANGUAGE_INDEX_INTERVAL:
+            self._index_checked = now
+            version = cache.get(LANGUAGE_INDEX_VERSION)
+            if version != self._index_version:
+                # Languages were changed by other process
+                self.flush_object_cache()
+                self._index_version = version
+        if self._index is None:
+            self._index = LanguageIndex(self.values_list(*LanguageIndex.fields))
+        return self._index
 
     @cached_property
     def default_language(self):
@@ -703,6 +836,13 @@ class Plural(models.Model):
             }
 
 
+@receiver(post_save, sender=Language)
+@receiver(post_delete, sender=Language)
+def flush_language_index(sender, **kwargs):
+    """Invalidate in-memory language index on change."""
+    Language.objects.invalidate_index()
+
+
 class WeblateLanguagesConf(AppConf):
     """Languages settings."""
 
@@ -22,8 +22,11 @@
 import gettext
 from io import StringIO
 from itertools import chain
+from unittest.mock import patch
 
+from django.core.cache import cache
 from django.core.management import call_command
+from django.db import transaction
 from django.test import TestCase
 from django.urls import reverse
 from django.utils.encoding import force_str
@@ -32,7 +35,13 @@ from weblate_language_data.languages import LANGUAGES
 from weblate_language_data.plurals import EXTRAPLURALS
 
 from weblate.lang import data
-from weblate.lang.models import Language, Plural, get_plural_type
+from weblate.lang.models import (
+    ATOMIC_INDEX,
+    LANGUAGE_INDEX_VERSION,
+    Language,
+    Plural,
+    get_plural_type,
+)
 from weblate.trans.tests.test_models import BaseTestCase
 from weblate.trans.tests.test_views import FixtureTestCase
 
@@ -236,6 +245,88 @@ class LanguagesTest(BaseTestCase, metaclass=TestSequenceMeta):
         self.test_private_use("en-US-x-twain", "en_US-x-twain")
 
 
+class LanguageIndexTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        # Changes done by other tests were rolled back
+        ATOMIC_INDEX.untracked = False
+        Language.objects._index_checked = 0
+        Language.objects.flush_object_cache()
+
+    def test_cached(self):
+        self.assertEqual(Language.objects.fuzzy_get("cs_CZ").code, "cs")
+        with self.assertNumQueries(0):
+            self.assertEqual(Language.objects.fuzzy_get("cs_CZ").code, "cs")
+            self.assertEqual(Language.objects.fuzzy_get("Czech").code, "cs")
+            self.assertEqual(Language.objects.fuzzy_get("pt-rBR").code, "pt_BR")
+            self.assertEqual(Language.objects.get_indexed("de").code, "de")
+            self.assertEqual(Language.objects.fuzzy_get("xx-YY"), "xx_YY")
+
+    def test_invalidate(self):
+        self.assertIsNone(Language.objects.fuzzy_get("xx-YY", strict=True))
+        Language.objects.create(code="xx_YY", name="Test")
+        self.assertEqual(Language.objects.fuzzy_get("xx-YY").code, "xx_YY")
+
+    def test_rollback(self):
+        try:
+            with transaction.atomic():
+                Language.objects.create(code="xx_YY", name="Test")
+                self.assertEqual(Language.objects.fuzzy_get("xx-YY").code, "xx_YY")
+                raise ValueError()
+        except ValueError:
+            pass
+        self.assertIsNone(Language.objects.fuzzy_get("xx-YY", strict=True))
+
+    def test_invalidate_other_process(self):
+        self.assertIsNone(Language.objects.fuzzy_get("xx-YY", strict=True))
+        # Simulate change done by other process, no signals are emitted
+        Language.objects.bulk_create([Language(code="xx_YY", name="Test")])
+        self.assertIsNone(Language.objects.fuzzy_get("xx-YY", strict=True))
+        cache.set(LANGUAGE_INDEX_VERSION, "other")
+        # The version is checked only periodically
+        self.assertIsNone(Language.objects.fuzzy_get("xx-YY", strict=True))
+        Language.objects._index_checked = 0
+        self.assertEqual(Language.objects.fuzzy_get("xx-YY").code, "xx_YY")
+
+    def test_version_throttled(self):
+        self.assertEqual(Language.objects.fuzzy_get("cs_CZ").code, "cs")
+        with patch("weblate.lang.models.cache") as mocked:
+            self.assertEqual(Language.objects.fuzzy_get("cs_CZ").code, "cs")
+        mocked.get.assert_not_called()
+
+    def test_transaction_cached(self):
+        def on_commit(func, using=None):
+            # Register hooks as Django does, the test transaction never commits
+            transaction.get_connection(using).on_commit(func)
+
+        with patch("django.db.transaction.on_commit", on_commit):
+            with transaction.atomic():
+                Language.objects.create(code="xx_YY", name="Test")
+                self.assertEqual(Language.objects.fuzzy_get("xx-YY").code, "xx_YY")
+                # Index of the transaction is kept
+                with self.assertNumQueries(0):
+                    self.assertEqual(Language.objects.get_indexed("de").code, "de")
+                    self.assertEqual(Language.objects.fuzzy_get("xx-YY").code, "xx_YY")
+                try:
+                    with transaction.atomic():
+                        Language.objects.create(code="zz_YY", name="Test")
+                        self.assertEqual(
+                            Language.objects.fuzzy_get("zz-YY").code, "zz_YY"
+                        )
+                        raise ValueError()
+                except ValueError:
+                    pass
+                self.assertIsNone(Language.objects.fuzzy_get("zz-YY", strict=True))
+                self.assertEqual(Language.objects.fuzzy_get("xx-YY").code, "xx_YY")
+
+    def test_auto_create_existing(self):
+        # Created meanwhile by other process
+        Language.objects.bulk_create([Language(code="xx_YY", name="Test")])
+        language = Language.objects.auto_create("xx_YY")
+        self.assertEqual(language.name, "Test")
+        self.assertFalse(language.plural_set.exists())
+
+
 class CommandTest(BaseTestCase):
     """Test for management commands."""
 
@@ -33,6 +33,7 @@ from weblate.lang.models import Language
 from weblate.logger import LOGGER
 from weblate.utils.errors import report_error
 from weblate.utils.hash import calculate_hash
+from weblate.utils.metrics import measure
 from weblate.utils.requests import request
 from weblate.utils.search import Comparer
 from weblate.utils.site import get_site_url
@@ -40,7 +41,7 @@ from weblate.utils.site import get_site_url
 
 def get_machinery_language(language):
     if language.code.endswith("_devel"):
-        return Language.objects.get(code=language.code[:-6])
+        return Language.objects.get_indexed(language.code[:-6])
     return language
 
 
@@ -284,11 +285,12 @@ class MachineTranslation:
                 return result
 
         try:
-            result = list(
-                self.download_translations(
-                    source, language, text, unit, user, search=bool(search)
+            with measure("machinery", unit.translation.component):
+                result = list(
+                    self.download_translations(
+                        source, language, text, unit, user, search=bool(search)
+                    )
                 )
-            )
             if replacements:
                 self.uncleanup_results(replacements, result)
             if cache_key:
@@ -0,0 +1,129 @@
+#
+# Copyright © 2012 - 2020 Michal Čihař <michal@cihar.com>
+#
+# This file is part of Weblate <https://weblate.org/>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import json
+from itertools import chain
+from xml.sax.saxutils import escape, quoteattr
+
+from weblate.lang.models import Language
+from weblate.memory.utils import get_category
+
+EXPORT_FIELDS = (
+    "pk",
+    "source",
+    "target",
+    "source_language_id",
+    "target_language_id",
+    "origin",
+    "from_file",
+    "shared",
+    "project_id",
+    "user_id",
+)
+
+
+def iterate_entries(queryset, chunk_size=1000):
+    """Iterate over memory entries as dicts suitable for JSON export.
+
+    The entries are fetched in primary key ordered chunks of plain values and
+    languages are resolved using map loaded upfront, so memory usage does not
+    grow with number of entries.
+    """
+    languages = dict(Language.objects.values_list("pk", "code"))
+    queryset = queryset.order_by("pk").values_list(*EXPORT_FIELDS)
+    last = 0
+    while True:
+        chunk = list(queryset.filter(pk__gt=last)[:chunk_size])
+        if not chunk:
+            return
+        for (
+            pk,
+            source,
+            target,
+            source_language_id,
+            target_language_id,
+            origin,
+            from_file,
+            shared,
+            project_id,
+            user_id,
+        ) in chunk:
+            yield {
+                "source": source,
+                "target": target,
+                "source_language": languages[source_language_id],
+                "target_language": languages[target_language_id],
+                "origin": origin,
+                "category": get_category(from_file, shared, project_id, user_id),
+            }
+        last = chunk[-1][0]
+
+
+def export_json(entries, indent=None):
+    """Serialize entries as JSON array, yielding one entry at a time."""
+    separator = "[\n"
+    for entry in entries:
+        yield separator + json.dumps(entry, indent=indent)
+        separator = ",\n"
+    if separator == "[\n":
+        yield "[]\n"
+    else:
+        yield "\n]\n"
+
+
+TMX_TU = """<tu>
+<tuv xml:lang={}>
+<seg>{}</seg>
+</tuv>
+<tuv xml:lang={}>
+<seg>{}</seg>
+</tuv>
+</tu>
+"""
+
+
+def export_tmx(entries, indent=None):
+    """Serialize entries as TMX, yielding one entry at a time."""
+    entries = iter(entries)
+    first = next(entries, None)
+    srclang = quoteattr(first["source_language"] if first else "en")
+    yield (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<tmx version="1.4">\n'
+        "<header adminlang={0} srclang={0}>\n"
+        "</header>\n"
+        "<body>\n"
+    ).format(srclang)
+    if first is not None:
+        for entry in chain([first], entries):
+            yield TMX_TU.format(
+                quoteattr(entry["source_language"]),
+                escape(entry["source"]),
+                quoteattr(entry["target_language"]),
+                escape(entry["target"]),
+            )
+    yield "</body>\n</tmx>\n"
+
+
+EXPORTERS = {"json": export_json, "tmx": export_tmx}
+
+
+def export_memory(queryset, fmt, indent=None):
+    """Return iterator over serialized memory in given format."""
+    return EXPORTERS[fmt](iterate_entries(queryset), indent=indent)
@@ -17,8 +17,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
-import json
-
+from weblate.memory.export import EXPORTERS, export_memory
 from weblate.memory.models import Memory
 from weblate.utils.management.base import BaseCommand
 
@@ -26,7 +25,7 @@ from weblate.utils.management.base import BaseCommand
 class Command(BaseCommand):
     """Command for exporting translation memory."""
 
-    help = "exports translation memory in JSON format"
+    help = "exports translation memory"
 
     def add_arguments(self, parser):
         super().add_arguments(parser)
@@ -37,6 +36,15 @@ class Command(BaseCommand):
             type=int,
             help=("Specifies the indent level to use when " "pretty-printing output."),
         )
+        parser.add_argument(
+            "--format",
+            default="json",
+            choices=sorted(EXPORTERS),
+            help="Export format",
+        )
+        parser.add_argument(
+            "--output", help="File to store export to (default: standard output)"
+        )
         parser.add_argument(
             "--backup",
             action="store_true",
@@ -44,9 +52,13 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
-        memory = Memory.objects.all().prefetch_lang()
-        self.stdout.ending = None
-        json.dump(
-            [item.as_dict() for item in memory], self.stdout, indent=options["indent"]
+        chunks = export_memory(
+            Memory.objects.all(), options["format"], indent=options["indent"]
         )
-        self.stdout.write("\n")
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as handle:
+                handle.writelines(chunks)
+        else:
+            self.stdout.ending = None
+            for chunk in chunks:
+                self.stdout.write(chunk)
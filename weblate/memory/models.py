@@ -34,12 +34,7 @@ from translate.storage.tmx import tmxfile
 from weblate_schemas import load_schema
 
 from weblate.lang.models import Language
-from weblate.memory.utils import (
-    CATEGORY_FILE,
-    CATEGORY_PRIVATE_OFFSET,
-    CATEGORY_SHARED,
-    CATEGORY_USER_OFFSET,
-)
+from weblate.memory.utils import get_category
 from weblate.utils.errors import report_error
 
 
@@ -247,15 +242,7 @@ class Memory(models.Model):
         return text.format(self.origin)
 
     def get_category(self):
-        if self.from_file:
-            return CATEGORY_FILE
-        if self.shared:
-            return CATEGORY_SHARED
-        if self.project_id:
-            return CATEGORY_PRIVATE_OFFSET + self.project_id
-        if self.user_id:
-            return CATEGORY_USER_OFFSET + self.user_id
-        return 0
+        return get_category(self.from_file, self.shared, self.project_id, self.user_id)
 
     def as_dict(self):
         """Convert to dict suitable for JSON export."""
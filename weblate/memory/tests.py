@@ -18,6 +18,7 @@
 #
 
 import json
+import os
 from io import StringIO
 
 from django.conf import settings
@@ -28,6 +29,7 @@ from jsonschema import validate
 from weblate_schemas import load_schema
 
 from weblate.lang.models import Language
+from weblate.memory.export import export_json, iterate_entries
 from weblate.memory.machine import WeblateMemory
 from weblate.memory.models import Memory
 from weblate.memory.tasks import handle_unit_translation_change, import_memory
@@ -110,6 +112,40 @@ class MemoryModelTest(FixtureTestCase):
             ],
         )
 
+    def test_dump_command_tmx(self):
+        add_document()
+        Memory.objects.create(
+            source_language=Language.objects.get(code="en"),
+            target_language=Language.objects.get(code="de"),
+            source="Hello & <b>world</b>",
+            target="Hallo & <b>Welt</b>",
+            origin="test",
+            from_file=True,
+            shared=False,
+        )
+        output = os.path.join(settings.DATA_DIR, "memory.tmx")
+        call_command("dump_memory", format="tmx", output=output)
+        Memory.objects.all().delete()
+        call_command("import_memory", output)
+        self.assertEqual(
+            set(
+                Memory.objects.values_list("target_language__code", "source", "target")
+            ),
+            {
+                ("cs", "Hello", "Ahoj"),
+                ("de", "Hello & <b>world</b>", "Hallo & <b>Welt</b>"),
+            },
+        )
+
+    def test_export_chunks(self):
+        for _unused in range(3):
+            add_document()
+        entries = list(iterate_entries(Memory.objects.all(), chunk_size=2))
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(entries[0], Memory.objects.all()[0].as_dict())
+        self.assertEqual(json.loads("".join(export_json(entries))), entries)
+        self.assertEqual(json.loads("".join(export_json([]))), [])
+
     def test_import_invalid_command(self):
         with self.assertRaises(CommandError):
             call_command("import_memory", get_test_file("cs.po"))
@@ -144,6 +180,9 @@ class MemoryModelTest(FixtureTestCase):
 
 
 class MemoryViewTest(FixtureTestCase):
+    def get_json(self, response):
+        return json.loads(b"".join(response.streaming_content))
+
     def upload_file(self, name, prefix: str = "", **kwargs):
         with open(get_test_file(name), "rb") as handle:
             return self.client.post(
@@ -175,7 +214,7 @@ class MemoryViewTest(FixtureTestCase):
 
         # Test download
         response = self.client.get(reverse(f"{prefix}memory-download", **kwargs))
-        validate(response.json(), load_schema("weblate-memory.schema.json"))
+        validate(self.get_json(response), load_schema("weblate-memory.schema.json"))
 
         # Test download
         response = self.client.get(
@@ -190,7 +229,7 @@ class MemoryViewTest(FixtureTestCase):
         response = self.client.get(
             reverse(f"{prefix}memory-download", **kwargs), {"format": "json"}
         )
-        validate(response.json(), load_schema("weblate-memory.schema.json"))
+        validate(self.get_json(response), load_schema("weblate-memory.schema.json"))
 
         # Test wipe
         count = Memory.objects.count()
@@ -250,10 +289,10 @@ class MemoryViewTest(FixtureTestCase):
             reverse("manage-memory-download"),
             {"format": "json", "kind": "all"},
         )
-        validate(response.json(), load_schema("weblate-memory.schema.json"))
+        validate(self.get_json(response), load_schema("weblate-memory.schema.json"))
         # Download shared entries
         response = self.client.get(
             reverse("manage-memory-download"),
             {"format": "json", "kind": "shared"},
         )
-        validate(response.json(), load_schema("weblate-memory.schema.json"))
+        validate(self.get_json(response), load_schema("weblate-memory.schema.json"))
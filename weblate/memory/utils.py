@@ -36,3 +36,16 @@ def parse_category(category):
     if CATEGORY_PRIVATE_OFFSET <= category < CATEGORY_USER_OFFSET:
         return False, False, category - CATEGORY_PRIVATE_OFFSET, None
     return False, False, None, category - CATEGORY_USER_OFFSET
+
+
+def get_category(from_file, shared, project_id, user_id):
+    """Return category field, inverse of parse_category."""
+    if from_file:
+        return CATEGORY_FILE
+    if shared:
+        return CATEGORY_SHARED
+    if project_id:
+        return CATEGORY_PRIVATE_OFFSET + project_id
+    if user_id:
+        return CATEGORY_USER_OFFSET + user_id
+    return 0
@@ -21,14 +21,14 @@
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
 from django.db.models import Count
-from django.http import JsonResponse
-from django.shortcuts import render
+from django.http import StreamingHttpResponse
 from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.utils.encoding import force_str
 from django.utils.translation import gettext as _
 from django.views.generic.base import TemplateView
 
+from weblate.memory.export import export_memory
 from weblate.memory.forms import DeleteForm, UploadForm
 from weblate.memory.models import Memory, MemoryImportError
 from weblate.utils import messages
@@ -144,23 +144,21 @@ class MemoryView(TemplateView):
 class DownloadView(MemoryView):
     def get(self, request, *args, **kwargs):
         fmt = request.GET.get("format", "json")
-        data = Memory.objects.filter_type(**self.objects).prefetch_lang()
+        data = Memory.objects.filter_type(**self.objects)
         if "origin" in request.GET:
             data = data.filter(origin=request.GET["origin"])
         if "from_file" in self.objects and "kind" in request.GET:
             if request.GET["kind"] == "shared":
-                data = Memory.objects.filter_type(use_shared=True).prefetch_lang()
+                data = Memory.objects.filter_type(use_shared=True)
             elif request.GET["kind"] == "all":
-                data = Memory.objects.prefetch_lang()
+                data = Memory.objects.all()
         if fmt == "tmx":
-            response = render(
-                request,
-                "memory/dump.tmx",
-                {"data": data},
-                content_type="application/x-tmx",
-            )
+            content_type = "application/x-tmx"
         else:
             fmt = "json"
-            response = JsonResponse([item.as_dict() for item in data], safe=False)
+            content_type = "application/json"
+        response = StreamingHttpResponse(
+            export_memory(data, fmt), content_type=content_type
+        )
         response["Content-Disposition"] = CD_TEMPLATE.format(fmt)
         return response
@@ -0,0 +1,147 @@
+#
+# Copyright © 2012 - 2020 Michal Čihař <michal@cihar.com>
+#
+# This file is part of Weblate <https://weblate.org/>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import difflib
+import hashlib
+import heapq
+from collections import Counter, defaultdict
+
+from django.core.cache import cache
+from PIL import Image
+
+from weblate.utils.locale import c_locale
+
+try:
+    with c_locale():
+        from tesserocr import RIL, PyTessBaseAPI
+    HAS_OCR = True
+except ImportError:
+    HAS_OCR = False
+
+# Recognized text depends only on the image, keep it for a month
+OCR_CACHE_TIMEOUT = 30 * 86400
+
+
+def get_ngrams(text, size=3):
+    """Return set of character n-grams of a text."""
+    text = " {} ".format(text.lower())
+    return {text[pos : pos + size] for pos in range(len(text) - size + 1)}
+
+
+class NgramIndex:
+    """Index of strings by character trigrams for fuzzy lookups.
+
+    Candidates sharing enough trigrams with the looked up text are verified
+    using difflib, giving same matches as difflib.get_close_matches without
+    comparing the text with every indexed string.
+    """
+
+    def __init__(self, strings, cutoff=0.9):
+        self.strings = list(strings)
+        self.cutoff = cutoff
+        self.ngrams = [get_ngrams(string) for string in self.strings]
+        self.index = defaultdict(list)
+        for pos, ngrams in enumerate(self.ngrams):
+            for ngram in ngrams:
+                self.index[ngram].append(pos)
+
+    def get_close_matches(self, text, limit=3):
+        ngrams = get_ngrams(text)
+        shared = Counter()
+        for ngram in ngrams:
+            shared.update(self.index.get(ngram, ()))
+
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(text)
+        result = []
+        for pos, count in shared.items():
+            # Skip candidates with Dice coefficient of trigrams below half
+            if 4 * count < len(ngrams) + len(self.ngrams[pos]):
+                continue
+            matcher.set_seq1(self.strings[pos])
+            if (
+                matcher.real_quick_ratio() >= self.cutoff
+                and matcher.quick_ratio() >= self.cutoff
+                and matcher.ratio() >= self.cutoff
+            ):
+                result.append((matcher.ratio(), self.strings[pos]))
+        return [string for _score, string in heapq.nlargest(limit, result)]
+
+
+def ocr_extract(api, image):
+    """Extract text lines from an image."""
+    api.SetImage(image)
+    for item in api.GetComponentImages(RIL.TEXTLINE, True):
+        api.SetRectangle(item[1]["x"], item[1]["y"], item[1]["w"], item[1]["h"])
+        ocr_result = api.GetUTF8Text()
+        yield from [ocr_result] + ocr_result.split("|") + ocr_result.split()
+    api.Clear()
+
+
+def ocr_image(filename):
+    """Return set of texts recognized in an image."""
+    # Load image
+    original_image = Image.open(filename)
+    # Convert to greyscale
+    original_image = original_image.convert("L")
+    # Resize image (tesseract works best around 300dpi)
+    scaled_image = original_image.copy().resize(
+        [size * 4 for size in original_image.size], Image.BICUBIC
+    )
+
+    result = set()
+    with c_locale(), PyTessBaseAPI() as api:
+        for image in (original_image, scaled_image):
+            result.update(ocr_extract(api, image))
+
+    # Close images
+    original_image.close()
+    scaled_image.close()
+
+    return result
+
+
+def get_image_hash(filename):
+    digest = hashlib.sha256()
+    with open(filename, "rb") as handle:
+        for chunk in iter(lambda: handle.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def ocr_screenshot(screenshot):
+    """Return set of texts recognized in a screenshot, cached by image content."""
+    filename = screenshot.image.path
+    key = "screenshot-ocr-{}".format(get_image_hash(filename))
+    result = cache.get(key)
+    if result is None:
+        result = ocr_image(filename)
+        cache.set(key, result, OCR_CACHE_TIMEOUT)
+    return result
+
+
+def ocr_match(screenshot):
+    """Return primary keys of units matching text in a screenshot."""
+    sources = dict(screenshot.translation.unit_set.values_list("source", "pk"))
+    index = NgramIndex(sources.keys())
+    results = set()
+    for text in ocr_screenshot(screenshot):
+        for match in index.get_close_matches(text):
+            results.add(sources[match])
+    return results
@@ -23,6 +23,7 @@ import os.path
 from django.core.files.storage import DefaultStorage
 
 from weblate.screenshots.models import Screenshot
+from weblate.screenshots.ocr import ocr_match
 from weblate.utils.celery import app
 
 
@@ -40,6 +41,16 @@ def cleanup_screenshot_files():
             storage.delete(fullname)
 
 
+@app.task(trail=False)
+def screenshot_ocr(pk):
+    """Return primary keys of source strings recognized in a screenshot."""
+    try:
+        screenshot = Screenshot.objects.get(pk=pk)
+    except Screenshot.DoesNotExist:
+        return []
+    return sorted(ocr_match(screenshot))
+
+
 @app.on_after_finalize.connect
 def setup_periodic_tasks(sender, **kwargs):
     sender.add_periodic_task(
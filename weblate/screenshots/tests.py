@@ -16,13 +16,18 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
+import difflib
 from unittest import SkipTest
+from unittest.mock import patch
 
 from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase
 from django.urls import reverse
 
 import weblate.screenshots.views
 from weblate.screenshots.models import Screenshot
+from weblate.screenshots.ocr import NgramIndex
 from weblate.trans.tests.test_views import FixtureTestCase
 from weblate.trans.tests.utils import get_test_file
 
@@ -183,6 +188,31 @@ class ViewTest(FixtureTestCase):
         finally:
             weblate.screenshots.views.HAS_OCR = orig
 
+    def test_ocr_background(self):
+        self.make_manager()
+        self.do_upload()
+        screenshot = Screenshot.objects.all()[0]
+        cache.clear()
+
+        orig = weblate.screenshots.views.HAS_OCR
+        weblate.screenshots.views.HAS_OCR = True
+        try:
+            with patch(
+                "weblate.screenshots.ocr.ocr_image", return_value={"Hello, world!"}
+            ) as ocr_image:
+                for _unused in range(2):
+                    response = self.client.post(
+                        reverse("screenshot-js-ocr", kwargs={"pk": screenshot.pk})
+                    )
+                    data = response.json()
+                    self.assertEqual(data["responseCode"], 200)
+                    self.assertEqual(len(data["results"]), 1)
+                    self.assertEqual(data["results"][0]["assigned"], 0)
+                # The recognized text is cached
+                self.assertEqual(ocr_image.call_count, 1)
+        finally:
+            weblate.screenshots.views.HAS_OCR = orig
+
     def test_translation_manipulations(self):
         self.make_manager()
         translation = self.component.translation_set.get(language_code="cs")
@@ -223,3 +253,33 @@ class ViewTest(FixtureTestCase):
             {"source": source_pk},
         )
         self.assertEqual(screenshot.units.count(), 0)
+
+
+class NgramIndexTest(SimpleTestCase):
+    strings = [
+        "Hello, world!\n",
+        "Thank you for using Weblate.",
+        "Orangutan has %d banana.\n",
+        "Orangutan has %d bananas.\n",
+    ]
+
+    def test_matches(self):
+        index = NgramIndex(self.strings)
+        self.assertEqual(index.get_close_matches("Hello, world!"), [self.strings[0]])
+        self.assertEqual(
+            index.get_close_matches("Thank you for usinq Weblate."), [self.strings[1]]
+        )
+        self.assertEqual(
+            index.get_close_matches("Orangutan has %d bananas."),
+            [self.strings[3], self.strings[2]],
+        )
+        self.assertEqual(index.get_close_matches("Weblate"), [])
+        self.assertEqual(index.get_close_matches(""), [])
+
+    def test_difflib(self):
+        index = NgramIndex(self.strings)
+        for text in ("Hello, world", "Hello world!", "Thank you", "banana"):
+            self.assertEqual(
+                index.get_close_matches(text),
+                difflib.get_close_matches(text, self.strings, cutoff=0.9),
+            )
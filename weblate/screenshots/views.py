@@ -17,32 +17,27 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
-import difflib
-
+from celery.result import AsyncResult
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
+from django.db.models import Count
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.urls import reverse
 from django.utils.translation import gettext as _
 from django.views.decorators.http import require_POST
 from django.views.generic import DetailView, ListView
-from PIL import Image
 
 from weblate.screenshots.forms import ScreenshotEditForm, ScreenshotForm, SearchForm
 from weblate.screenshots.models import Screenshot
+from weblate.screenshots.ocr import HAS_OCR
+from weblate.screenshots.tasks import screenshot_ocr
 from weblate.trans.models import Unit
 from weblate.utils import messages
-from weblate.utils.locale import c_locale
+from weblate.utils.celery import is_task_ready
 from weblate.utils.search import parse_query
 from weblate.utils.views import ComponentViewMixin
 
-try:
-    with c_locale():
-        from tesserocr import RIL, PyTessBaseAPI
-    HAS_OCR = True
-except ImportError:
-    HAS_OCR = False
-
 
 def try_add_source(request, obj):
     if "source" not in request.POST:
@@ -182,7 +177,9 @@ def search_results(code, obj, units=None):
     if units is None:
         units = []
     else:
-        units = units.exclude(id__in=obj.units.values_list("id", flat=True))
+        units = units.exclude(id__in=obj.units.values_list("id", flat=True)).annotate(
+            screenshots_count=Count("screenshots")
+        )
 
     results = [
         {
@@ -190,7 +187,7 @@ def search_results(code, obj, units=None):
             "pk": unit.pk,
             "context": unit.context,
             "location": unit.location,
-            "assigned": unit.screenshots.count(),
+            "assigned": unit.screenshots_count,
         }
         for unit in units
     ]
@@ -212,16 +209,23 @@ def search_source(request, pk):
     )
 
 
-def ocr_extract(api, image, strings):
-    """Extract closes matches from an image."""
-    api.SetImage(image)
-    for item in api.GetComponentImages(RIL.TEXTLINE, True):
-        api.SetRectangle(item[1]["x"], item[1]["y"], item[1]["w"], item[1]["h"])
-        ocr_result = api.GetUTF8Text()
-        parts = [ocr_result] + ocr_result.split("|") + ocr_result.split()
-        for part in parts:
-            yield from difflib.get_close_matches(part, strings, cutoff=0.9)
-    api.Clear()
+def ocr_results(obj, result):
+    """Return OCR results or tell client where to poll for them."""
+    if not is_task_ready(result):
+        return JsonResponse(
+            data={
+                "responseCode": 202,
+                "url": reverse(
+                    "screenshot-js-ocr-result",
+                    kwargs={"pk": obj.pk, "task_id": result.id},
+                ),
+            }
+        )
+    if result.failed():
+        return search_results(500, obj)
+    return search_results(
+        200, obj, obj.translation.unit_set.filter(pk__in=result.result)
+    )
 
 
 @login_required
@@ -230,34 +234,13 @@ def ocr_search(request, pk):
     obj = get_screenshot(request, pk)
     if not HAS_OCR:
         return search_results(500, obj)
-    translation = obj.translation
-
-    # Load image
-    original_image = Image.open(obj.image.path)
-    # Convert to greyscale
-    original_image = original_image.convert("L")
-    # Resize image (tesseract works best around 300dpi)
-    scaled_image = original_image.copy().resize(
-        [size * 4 for size in original_image.size], Image.BICUBIC
-    )
-
-    # Find all our strings
-    sources = dict(translation.unit_set.values_list("source", "pk"))
-    strings = tuple(sources.keys())
+    return ocr_results(obj, screenshot_ocr.delay(obj.pk))
 
-    results = set()
 
-    # Extract and match strings
-    with c_locale(), PyTessBaseAPI() as api:
-        for image in (original_image, scaled_image):
-            for match in ocr_extract(api, image, strings):
-                results.add(sources[match])
-
-    # Close images
-    original_image.close()
-    scaled_image.close()
-
-    return search_results(200, obj, translation.unit_set.filter(pk__in=results))
+@login_required
+def ocr_result(request, pk, task_id):
+    obj = get_screenshot(request, pk)
+    return ocr_results(obj, AsyncResult(str(task_id)))
 
 
 @login_required
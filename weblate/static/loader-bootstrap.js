@@ -100,8 +100,13 @@ function submitForm(evt) {
 }
 Mousetrap.bindGlobal(["alt+enter", "mod+enter"], submitForm);
 
+/* Give up polling for screenshot results after two minutes */
+var screenshotPollLimit = 120;
+var screenshotPolls = 0;
+
 function screenshotStart() {
   $("#search-results").empty();
+  screenshotPolls = 0;
   increaseLoading("screenshots");
 }
 
@@ -162,6 +167,25 @@ function screenshotResultSet(results) {
 }
 
 function screenshotLoaded(data) {
+  if (data.responseCode === 202 && screenshotPolls >= screenshotPollLimit) {
+    decreaseLoading("screenshots");
+    screnshotResultError("danger", gettext("Timed out waiting for results!"));
+    return;
+  }
+  if (data.responseCode === 202) {
+    /* Recognition is running in the background, poll for results */
+    screenshotPolls++;
+    setTimeout(function () {
+      $.ajax({
+        type: "GET",
+        url: data.url,
+        dataType: "json",
+        success: screenshotLoaded,
+        error: screenshotFailure,
+      });
+    }, 1000);
+    return;
+  }
   decreaseLoading("screenshots");
   if (data.responseCode !== 200) {
     screnshotResultError("danger", gettext("Error loading search results!"));
@@ -21,7 +21,8 @@
 from django.db import transaction
 
 from weblate.checks.flags import Flags
-from weblate.trans.models import Change, Component, Unit, update_source
+from weblate.checks.models import CheckSummary
+from weblate.trans.models import Change, Component, PendingCommit, Unit, update_source
 from weblate.utils.state import STATE_APPROVED, STATE_FUZZY, STATE_TRANSLATED
 
 EDITABLE_STATES = STATE_FUZZY, STATE_TRANSLATED, STATE_APPROVED
@@ -99,9 +100,15 @@ def bulk_perform(
                     updated += 1
 
             if target_state != -1:
-                component_units.filter(state__in=EDITABLE_STATES).exclude(
-                    state=target_state
-                ).update(pending=True, state=target_state)
+                if (
+                    component_units.filter(state__in=EDITABLE_STATES)
+                    .exclude(state=target_state)
+                    .update(pending=True, state=target_state)
+                ):
+                    PendingCommit.schedule(component)
+                    # The states were changed in bulk, recalculate checks summary
+                    for translation in component.translation_set.iterator():
+                        CheckSummary.objects.update_translation(translation)
                 for unit in component_units:
                     if unit.is_source:
                         unit.is_bulk_edit = True
@@ -76,6 +76,8 @@ class ComponentDiscovery:
         copy_addons=True,
     ):
         self.component = component
+        # Use repository file index unless scanning different location
+        self.use_index = path is None
         if path is None:
             self.path = self.component.full_path
         else:
@@ -113,46 +115,62 @@ class ComponentDiscovery:
             offset += 1
         return re.compile("^{}$".format(parts[0]))
 
+    def list_files(self):
+        """List files and directories relative to the path."""
+        if self.use_index:
+            files = self.component.repository.get_file_index()
+            dirs = set()
+            for name in files:
+                while "/" in name:
+                    name = name.rsplit("/", 1)[0]
+                    if name in dirs:
+                        break
+                    dirs.add(name)
+            return sorted(chain(files, dirs))
+        result = []
+        for root, dirnames, filenames in os.walk(self.path, followlinks=True):
+            for filename in chain(filenames, dirnames):
+                result.append(
+                    path_separator(
+                        os.path.relpath(os.path.join(root, filename), self.path)
+                    )
+                )
+        return result
+
     @cached_property
     def matches(self):
         """Return matched files together with match groups and mask."""
         result = []
         base = os.path.realpath(self.path)
-        for root, dirnames, filenames in os.walk(self.path, followlinks=True):
-            for filename in chain(filenames, dirnames):
-                fullname = os.path.join(root, filename)
-
-                # Skip files outside our root
-                if not os.path.realpath(fullname).startswith(base):
-                    continue
-
-                # Calculate relative path
-                path = path_separator(os.path.relpath(fullname, self.path))
+        for path in self.list_files():
+            # Check match against our regexp
+            matches = self.path_match.match(path)
+            if not matches:
+                continue
 
-                # Check match against our regexp
-                matches = self.path_match.match(path)
-                if not matches:
-                    continue
+            # Skip files outside our root
+            if not os.path.realpath(os.path.join(self.path, path)).startswith(base):
+                continue
 
-                # Check language regexp
-                if not self.language_match.match(matches.group("language")):
-                    continue
+            # Check language regexp
+            if not self.language_match.match(matches.group("language")):
+                continue
 
-                # Calculate file mask for match
-                replacements = [(matches.start("language"), matches.end("language"))]
-                for group in matches.groupdict().keys():
-                    if group.startswith("_language_"):
-                        replacements.append((matches.start(group), matches.end(group)))
-                maskparts = []
-                maskpath = path
-                for start, end in sorted(replacements, reverse=True):
-                    maskparts.append(maskpath[end:])
-                    maskpath = maskpath[:start]
-                maskparts.append(maskpath)
-
-                mask = "*".join(reversed(maskparts))
-
-                result.append((path, matches.groupdict(), mask))
+            # Calculate file mask for match
+            replacements = [(matches.start("language"), matches.end("language"))]
+            for group in matches.groupdict().keys():
+                if group.startswith("_language_"):
+                    replacements.append((matches.start(group), matches.end(group)))
+            maskparts = []
+            maskpath = path
+            for start, end in sorted(replacements, reverse=True):
+                maskparts.append(maskpath[end:])
+                maskpath = maskpath[:start]
+            maskparts.append(maskpath)
+
+            mask = "*".join(reversed(maskparts))
+
+            result.append((path, matches.groupdict(), mask))
 
         return result
 
@@ -555,7 +555,7 @@ class DownloadForm(forms.Form):
     q = QueryField()
     format = forms.ChoiceField(
         label=_("File format"),
-        choices=[(x.name, x.verbose) for x in EXPORTERS.values()],
+        choices=[(x, EXPORTERS.get_info(x).verbose) for x in EXPORTERS],
         initial="po",
         required=True,
         widget=forms.RadioSelect,
@@ -1506,7 +1506,7 @@ class ComponentScratchCreateForm(ComponentProjectForm):
         label=_("File format"),
         initial="po-mono",
         choices=FILE_FORMATS.get_choices(
-            cond=lambda x: bool(x.new_translation) or hasattr(x, "update_bilingual")
+            cond=lambda x: x.new_translation or x.update_bilingual
         ),
     )
 
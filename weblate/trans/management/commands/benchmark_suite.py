@@ -0,0 +1,330 @@
+#
+# Copyright © 2012 - 2020 Michal Čihař <michal@cihar.com>
+#
+# This file is part of Weblate <https://weblate.org/>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import json
+import os
+import platform
+import time
+from statistics import median
+
+from django.core.management.base import CommandError
+from django.db import connection
+from translate.storage.jsonl10n import JsonFile
+from translate.storage.po import pofile
+from translate.storage.xliff import xlifffile
+from weblate_language_data.languages import LANGUAGES
+
+import weblate
+from weblate.auth.models import get_anonymous
+from weblate.trans.models import Component, Project, Unit
+from weblate.trans.tasks import update_checks
+from weblate.utils.management.base import BaseCommand
+from weblate.utils.state import STATE_TRANSLATED
+from weblate.utils.views import download_translation_file
+from weblate.vcs.git import LocalRepository
+
+FORMATS = ("po", "json", "xliff")
+
+PHASES = (
+    "import",
+    "reparse",
+    "change",
+    "checks",
+    "stats",
+    "commit",
+    "export",
+    "search",
+)
+
+SEARCHES = (
+    "string",
+    "source:Benchmark",
+    "state:<translated",
+    "has:check",
+)
+
+SOURCE_LANGUAGE = "en"
+
+# Fixed header date to keep generated files reproducible
+HEADER_DATE = "2020-01-01 00:00+0000"
+
+
+def get_languages(count):
+    """Return deterministic list of language codes."""
+    codes = sorted(lang[0] for lang in LANGUAGES if lang[0] != SOURCE_LANGUAGE)
+    if count > len(codes):
+        raise CommandError("At most {} languages are supported".format(len(codes)))
+    return codes[:count]
+
+
+def get_strings(count, language=None, changed=False):
+    """Generate source and target strings.
+
+    Every other string is left untranslated and some translations omit the
+    placeholders to give the checks some work.
+    """
+    result = []
+    for i in range(count):
+        source = "Benchmark string {0} with %s and {1} items.".format(i, "{count}")
+        if language is None or i % 2:
+            target = ""
+        elif i % 10 == 0:
+            target = "Translated string {0} for {1}.".format(i, language)
+        else:
+            target = "Translated string {0} with %s and {1} items for {2}.".format(
+                i, "{count}", language
+            )
+        if target and changed:
+            target += " Changed."
+        result.append(("string{}".format(i), source, target))
+    return result
+
+
+def generate_po(language, strings):
+    store = pofile()
+    store.updateheader(add=True, language=language, POT_Creation_Date=HEADER_DATE)
+    for key, source, target in strings:
+        unit = store.UnitClass(source)
+        unit.target = target
+        unit.addlocation("benchmark.c:{}".format(key[6:]))
+        store.addunit(unit)
+    return bytes(store)
+
+
+def generate_json(language, strings):
+    store = JsonFile()
+    for key, source, target in strings:
+        unit = store.UnitClass(source if language == SOURCE_LANGUAGE else target)
+        unit.setid(key)
+        store.addunit(unit)
+    return bytes(store)
+
+
+def generate_xliff(language, strings):
+    store = xlifffile(sourcelanguage=SOURCE_LANGUAGE, targetlanguage=language)
+    for key, source, target in strings:
+        unit = store.UnitClass(source)
+        unit.setid(key)
+        if target:
+            unit.settarget(target)
+        store.addunit(unit)
+    return bytes(store)
+
+
+GENERATORS = {
+    "po": ("po/{}.po", "", generate_po),
+    "json": ("json/{}.json", "json/en.json", generate_json),
+    "xliff": ("xliff/{}.xliff", "", generate_xliff),
+}
+
+
+def generate_file(fmt, language, strings, changed=False):
+    """Generate single translation file, returns filename and content."""
+    filemask, template, generator = GENERATORS[fmt]
+    filename = filemask.format(language)
+    return filename, generator(language, get_strings(strings, language, changed))
+
+
+def generate_files(fmt, strings, languages):
+    """Generate content of synthetic repository."""
+    filemask, template, generator = GENERATORS[fmt]
+    files = dict(
+        generate_file(fmt, language, strings) for language in get_languages(languages)
+    )
+    if template:
+        files[template] = generator(SOURCE_LANGUAGE, get_strings(strings))
+    return files
+
+
+class QueryCounter:
+    """Database execute wrapper counting queries."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    """Run reproducible benchmark on synthetic repositories."""
+
+    help = "runs benchmark suite on generated repositories"
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--format",
+            action="append",
+            choices=FORMATS,
+            dest="formats",
+            help="file format to benchmark, can be repeated (default: all)",
+        )
+        parser.add_argument(
+            "--strings", type=int, default=1000, help="number of strings"
+        )
+        parser.add_argument(
+            "--languages", type=int, default=10, help="number of languages"
+        )
+        parser.add_argument(
+            "--changes",
+            type=int,
+            default=100,
+            help="number of strings to translate before committing",
+        )
+        parser.add_argument(
+            "--rounds", type=int, default=1, help="number of measured rounds"
+        )
+        parser.add_argument(
+            "--project", default="benchmark", help="project slug to use"
+        )
+        parser.add_argument(
+            "--output", help="file to store JSON results (default: standard output)"
+        )
+
+    def measure(self, results, phase, function, *args, **kwargs):
+        counter = QueryCounter()
+        start = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            result = function(*args, **kwargs)
+        results[phase] = {"time": time.perf_counter() - start, "queries": counter.count}
+        return result
+
+    def create_component(self, project, fmt, options):
+        filemask, template, _generator = GENERATORS[fmt]
+        slug = "benchmark-{}".format(fmt)
+        Component.objects.filter(project=project, slug=slug).delete()
+        # Create fake component (needed to calculate path)
+        fake = Component(project=project, slug=slug, name=slug)
+        LocalRepository.from_files(
+            fake.full_path,
+            generate_files(fmt, options["strings"], options["languages"]),
+        )
+        component = Component.objects.create(
+            project=project,
+            slug=slug,
+            name="Benchmark {}".format(fmt),
+            vcs="local",
+            repo="local:",
+            push="",
+            branch=LocalRepository.default_branch,
+            filemask=filemask.replace("{}", "*"),
+            template=template,
+            file_format=fmt,
+        )
+        component.after_save(True, False, False, False, True)
+        return component
+
+    def change_file(self, component, fmt, options):
+        language = get_languages(1)[0]
+        filename, content = generate_file(
+            fmt, language, options["strings"], changed=True
+        )
+        with open(os.path.join(component.full_path, filename), "wb") as handle:
+            handle.write(content)
+        with component.repository.lock:
+            component.repository.commit(
+                "Benchmark change", "Benchmark <noreply@weblate.org>", files=[filename]
+            )
+        component.create_translations()
+
+    def update_stats(self, component):
+        for translation in component.translation_set.iterator():
+            translation.stats.invalidate()
+            translation.stats.ensure_all()
+        component.stats.invalidate()
+        component.stats.ensure_basic()
+
+    def translate(self, component, options):
+        user = get_anonymous()
+        units = Unit.objects.filter(
+            translation__component=component, state__lt=STATE_TRANSLATED
+        ).exclude(translation__language=component.source_language)
+        for unit in units.prefetch()[: options["changes"]]:
+            unit.translate(user, "Benchmark translation", STATE_TRANSLATED)
+
+    def export(self, component, fmt):
+        size = 0
+        for translation in component.translation_set.iterator():
+            response = download_translation_file(translation, fmt)
+            if response.streaming:
+                size += sum(len(chunk) for chunk in response.streaming_content)
+            else:
+                size += len(response.content)
+        return size
+
+    def search(self, component):
+        units = Unit.objects.filter(translation__component=component)
+        return [units.search(query).count() for query in SEARCHES]
+
+    def run_round(self, project, fmt, options):
+        results = {}
+        component = self.measure(
+            results, "import", self.create_component, project, fmt, options
+        )
+        try:
+            self.measure(results, "reparse", component.create_translations)
+            self.measure(results, "change", self.change_file, component, fmt, options)
+            self.measure(results, "checks", update_checks, component.pk)
+            self.measure(results, "stats", self.update_stats, component)
+            self.translate(component, options)
+            self.measure(results, "commit", component.commit_pending, "benchmark", None)
+            self.measure(results, "export", self.export, component, fmt)
+            self.measure(results, "search", self.search, component)
+        finally:
+            component.delete()
+        return results
+
+    def handle(self, *args, **options):
+        project, _created = Project.objects.get_or_create(
+            slug=options["project"],
+            defaults={"name": "Benchmark", "web": "https://weblate.org/"},
+        )
+        results = {}
+        for fmt in options["formats"] or FORMATS:
+            rounds = [
+                self.run_round(project, fmt, options) for _i in range(options["rounds"])
+            ]
+            # Report median time, query counts are stable across rounds
+            results[fmt] = {
+                phase: {
+                    "time": median(result[phase]["time"] for result in rounds),
+                    "queries": rounds[0][phase]["queries"],
+                }
+                for phase in PHASES
+            }
+        output = json.dumps(
+            {
+                "weblate": weblate.GIT_VERSION,
+                "python": platform.python_version(),
+                "database": connection.vendor,
+                "strings": options["strings"],
+                "languages": options["languages"],
+                "rounds": options["rounds"],
+                "results": results,
+            },
+            indent=2,
+        )
+        if options["output"]:
+            with open(options["output"], "w") as handle:
+                handle.write(output)
+                handle.write("\n")
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,43 @@
+#
+# Copyright © 2012 - 2020 Michal Čihař <michal@cihar.com>
+#
+# This file is part of Weblate <https://weblate.org/>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from django.utils import timezone
+
+from weblate.trans.models import DailyActivity
+from weblate.utils.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "rebuilds activity statistics from history"
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=None,
+            help="rebuild only given number of past days (default: whole history)",
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["days"] is not None:
+            since = timezone.now().date() - timezone.timedelta(days=options["days"])
+        count = DailyActivity.rebuild(since)
+        self.stdout.write("Stored {} activity records".format(count))
@@ -0,0 +1,44 @@
+# Generated by Django 3.1.1 on 2020-11-10 10:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("trans", "0106_remove_unit_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="unit",
+            name="last_content_author",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="unit",
+            name="last_content_change",
+            field=models.ForeignKey(
+                blank=True,
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="+",
+                to="trans.Change",
+            ),
+        ),
+        migrations.AddField(
+            model_name="unit",
+            name="last_content_timestamp",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,100 @@
+# Generated by Django 3.1.1 on 2020-11-12 09:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("lang", "0010_auto_20200627_0508"),
+        ("trans", "0107_unit_last_content_change"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyActivity",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(db_index=True)),
+                ("family", models.IntegerField(default=0)),
+                ("changes", models.IntegerField(default=0)),
+                ("chars", models.IntegerField(default=0)),
+                ("words", models.IntegerField(default=0)),
+                ("t_chars", models.IntegerField(default=0)),
+                ("t_words", models.IntegerField(default=0)),
+                ("edits", models.IntegerField(default=0)),
+                (
+                    "author",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "component",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="trans.Component",
+                    ),
+                ),
+                (
+                    "language",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="lang.Language",
+                    ),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="trans.Project",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "daily activity",
+                "verbose_name_plural": "daily activities",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="dailyactivity",
+            constraint=models.UniqueConstraint(
+                fields=(
+                    "date",
+                    "project",
+                    "component",
+                    "language",
+                    "user",
+                    "author",
+                    "family",
+                ),
+                name="trans_dailyactivity_key",
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 3.1.1 on 2020-11-20 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def schedule_pending(apps, schema_editor):
+    Unit = apps.get_model("trans", "Unit")
+    PendingCommit = apps.get_model("trans", "PendingCommit")
+    db_alias = schema_editor.connection.alias
+
+    # Commit existing pending changes on next run
+    now = timezone.now()
+    components = (
+        Unit.objects.using(db_alias)
+        .filter(pending=True)
+        .values_list("translation__component_id", flat=True)
+        .distinct()
+    )
+    PendingCommit.objects.using(db_alias).bulk_create(
+        [
+            PendingCommit(component_id=component_id, due=now)
+            for component_id in components
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("trans", "0108_dailyactivity"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingCommit",
+            fields=[
+                (
+                    "component",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        serialize=False,
+                        to="trans.component",
+                    ),
+                ),
+                ("due", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "verbose_name": "pending commit",
+                "verbose_name_plural": "pending commits",
+            },
+        ),
+        migrations.RunPython(
+            schedule_pending, migrations.RunPython.noop, elidable=True
+        ),
+    ]
@@ -18,10 +18,13 @@
 #
 import os
 
+from django.conf import settings
+from django.db import transaction
 from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 from weblate.trans.models._conf import WeblateConf
+from weblate.trans.models.activity import DailyActivity
 from weblate.trans.models.agreement import ContributorAgreement
 from weblate.trans.models.alert import Alert
 from weblate.trans.models.announcement import Announcement
@@ -30,6 +33,7 @@ from weblate.trans.models.comment import Comment
 from weblate.trans.models.component import Component
 from weblate.trans.models.componentlist import AutoComponentList, ComponentList
 from weblate.trans.models.label import Label
+from weblate.trans.models.pending import PendingCommit
 from weblate.trans.models.project import Project
 from weblate.trans.models.suggestion import Suggestion, Vote
 from weblate.trans.models.translation import Translation
@@ -55,6 +59,8 @@ __all__ = [
     "Alert",
     "Variant",
     "Label",
+    "DailyActivity",
+    "PendingCommit",
 ]
 
 
@@ -97,13 +103,18 @@ def update_source(sender, instance, **kwargs):
         instance.old_unit.extra_flags != instance.extra_flags
         or instance.state != instance.old_unit.state
     ):
-        # We can not exclude current unit here as we need to trigger the updates below
-        for unit in instance.unit_set.prefetch_full():
-            unit.update_state()
-            unit.update_priority()
-            unit.run_checks()
-        if not instance.is_bulk_edit and not instance.is_batch_update:
-            instance.translation.component.invalidate_stats_deep()
+        if instance.is_bulk_edit or instance.is_batch_update:
+            instance.propagate_source_change()
+            return
+        # Large fan-out is handled in the background
+        component = instance.translation.component
+        if component.translation_set.count() > settings.SOURCE_PROPAGATION_THRESHOLD:
+            from weblate.trans.tasks import propagate_source_change
+
+            transaction.on_commit(lambda: propagate_source_change.delay(instance.pk))
+            return
+        instance.propagate_source_change()
+        component.invalidate_stats_deep()
 
 
 @receiver(m2m_changed, sender=Unit.labels.through)
@@ -151,22 +162,21 @@ def change_componentlist(sender, instance, action, **kwargs):
 @receiver(post_save, sender=AutoComponentList)
 @disable_for_loaddata
 def auto_componentlist(sender, instance, **kwargs):
-    for component in Component.objects.iterator():
-        instance.check_match(component)
+    AutoComponentList.objects.filter(pk=instance.pk).assign(Component.objects.all())
 
 
 @receiver(post_save, sender=Project)
 @disable_for_loaddata
 def auto_project_componentlist(sender, instance, **kwargs):
-    for component in instance.component_set.iterator():
-        auto_component_list(sender, component)
+    from weblate.trans.tasks import update_auto_component_lists
+
+    transaction.on_commit(lambda: update_auto_component_lists.delay(instance.pk))
 
 
 @receiver(post_save, sender=Component)
 @disable_for_loaddata
 def auto_component_list(sender, instance, **kwargs):
-    for auto in AutoComponentList.objects.iterator():
-        auto.check_match(instance)
+    AutoComponentList.objects.assign(Component.objects.filter(pk=instance.pk))
 
 
 @receiver(post_save, sender=Component)
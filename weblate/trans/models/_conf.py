@@ -175,6 +175,16 @@ Current translation status:
     SUGGESTION_CLEANUP_DAYS = None
     COMMENT_CLEANUP_DAYS = None
     REPOSITORY_ALERT_THRESHOLD = 25
+    SOURCE_PROPAGATION_THRESHOLD = 100
+
+    # Processes used to parse translation files
+    COMPONENT_PARSE_WORKERS = 1
+
+    # External link checks
+    LINK_CHECK_WORKERS = 8
+    LINK_CHECK_TIMEOUT = 10
+    LINK_CHECK_HOST_DELAY = 1
+    LINK_CHECK_CACHE_TIMEOUT = 3600
 
     SINGLE_PROJECT = False
     LICENSE_EXTRA = []
@@ -0,0 +1,259 @@
+#
+# Copyright © 2012 - 2020 Michal Čihař <michal@cihar.com>
+#
+# This file is part of Weblate <https://weblate.org/>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime, time
+
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+
+class DailyActivityQuerySet(models.QuerySet):
+    # pylint: disable=no-init
+
+    def filter_scope(
+        self,
+        project=None,
+        component=None,
+        translation=None,
+        language=None,
+        user=None,
+    ):
+        """Limit activity to given object, mirrors filtering of changes."""
+        result = self
+        if translation is not None:
+            result = result.filter(
+                component=translation.component, language=translation.language
+            )
+        elif component is not None:
+            result = result.filter(component=component)
+        elif project is not None:
+            result = result.filter(project=project)
+        if language is not None:
+            result = result.filter(language=language)
+        if user is not None:
+            result = result.filter(user=user)
+        return result
+
+    def filter_dates(self, start, end):
+        """Limit activity to given timestamps, rows are keyed by UTC date."""
+        return self.filter(
+            date__range=(
+                start.astimezone(timezone.utc).date(),
+                end.astimezone(timezone.utc).date(),
+            )
+        )
+
+    def content(self):
+        """Return activity on translation content."""
+        return self.exclude(family=DailyActivity.FAMILY_OTHER)
+
+    def base_stats(
+        self,
+        days,
+        step,
+        project=None,
+        component=None,
+        translation=None,
+        language=None,
+        user=None,
+    ):
+        """Count number of changes in last days grouped by step days."""
+        dtstart = timezone.now().date() - timezone.timedelta(days=days - 1)
+        counts = dict(
+            self.filter_scope(project, component, translation, language, user)
+            .filter(date__gte=dtstart)
+            .values_list("date")
+            .annotate(total=Sum("changes"))
+            .order_by()
+        )
+        result = []
+        for _unused in range(0, days, step):
+            total = sum(
+                counts.get(dtstart + timezone.timedelta(days=offset), 0)
+                for offset in range(step)
+            )
+            result.append((dtstart, total))
+            dtstart += timezone.timedelta(days=step)
+        return result
+
+
+class DailyActivity(models.Model):
+    """Pre-aggregated history events.
+
+    Every change is accounted in a row grouped by day, scope, user and action
+    family, this makes activity charts and reports single grouped queries.
+    """
+
+    FAMILY_OTHER = 0
+    FAMILY_EDIT = 1
+    FAMILY_NEW = 2
+    FAMILY_APPROVE = 3
+
+    FAMILY_NAMES = {FAMILY_EDIT: "edit", FAMILY_NEW: "new", FAMILY_APPROVE: "approve"}
+
+    date = models.DateField(db_index=True)
+    project = models.ForeignKey("Project", null=True, on_delete=models.deletion.CASCADE)
+    component = models.ForeignKey(
+        "Component", null=True, on_delete=models.deletion.CASCADE
+    )
+    language = models.ForeignKey(
+        "lang.Language", null=True, on_delete=models.deletion.CASCADE
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        related_name="+",
+        on_delete=models.deletion.CASCADE,
+    )
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        related_name="+",
+        on_delete=models.deletion.CASCADE,
+    )
+    family = models.IntegerField(default=FAMILY_OTHER)
+
+    changes = models.IntegerField(default=0)
+    chars = models.IntegerField(default=0)
+    words = models.IntegerField(default=0)
+    t_chars = models.IntegerField(default=0)
+    t_words = models.IntegerField(default=0)
+    edits = models.IntegerField(default=0)
+
+    objects = DailyActivityQuerySet.as_manager()
+
+    class Meta:
+        app_label = "trans"
+        verbose_name = "daily activity"
+        verbose_name_plural = "daily activities"
+        constraints = [
+            models.UniqueConstraint(
+                fields=(
+                    "date",
+                    "project",
+                    "component",
+                    "language",
+                    "user",
+                    "author",
+                    "family",
+                ),
+                name="trans_dailyactivity_key",
+            )
+        ]
+
+    def __str__(self):
+        return "{}: {}".format(self.date, self.changes)
+
+    @classmethod
+    def get_family(cls, change):
+        # Only changes on units carry content to account
+        if change.unit_id is None or change.action not in change.ACTIONS_CONTENT:
+            return cls.FAMILY_OTHER
+        if change.action == change.ACTION_NEW:
+            return cls.FAMILY_NEW
+        if change.action == change.ACTION_APPROVE:
+            return cls.FAMILY_APPROVE
+        return cls.FAMILY_EDIT
+
+    @classmethod
+    def get_values(cls, change):
+        """Return grouping key and counters for a change."""
+        family = cls.get_family(change)
+        key = {
+            "date": change.timestamp.date(),
+            "project_id": change.project_id,
+            "component_id": change.component_id,
+            "language_id": change.language_id,
+            "user_id": change.user_id,
+            "author_id": change.author_id,
+            "family": family,
+        }
+        values = {"changes": 1}
+        if family != cls.FAMILY_OTHER:
+            values.update(
+                {
+                    "chars": len(change.unit.source),
+                    "words": change.unit.num_words,
+                    "t_chars": len(change.target),
+                    "t_words": len(change.target.split()),
+                    "edits": change.get_distance(),
+                }
+            )
+        return key, values
+
+    @classmethod
+    def aggregate(cls, changes):
+        """Sum counters of changes grouped by the key."""
+        result = {}
+        for change in changes:
+            key, values = cls.get_values(change)
+            current = result.setdefault(tuple(sorted(key.items())), {})
+            for name, value in values.items():
+                current[name] = current.get(name, 0) + value
+        return result
+
+    @classmethod
+    def add_values(cls, key, values):
+        # The unique constraint does not cover keys with empty fields (SQL
+        # treats NULLs as distinct), concurrent creation can still duplicate
+        # these, which is fine as all reads sum the counters.
+        update = {name: F(name) + value for name, value in values.items()}
+        if cls.objects.filter(**key).update(**update):
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(**key, **values)
+        except IntegrityError:
+            # Row created concurrently, account into it
+            cls.objects.filter(**key).update(**update)
+
+    @classmethod
+    def record(cls, change):
+        """Account change into the matching row."""
+        cls.add_values(*cls.get_values(change))
+
+    @classmethod
+    def record_many(cls, changes):
+        """Account changes created in bulk."""
+        for key, values in cls.aggregate(changes).items():
+            cls.add_values(dict(key), values)
+
+    @classmethod
+    @transaction.atomic
+    def rebuild(cls, since=None):
+        """Rebuild activity from history events, optionally since given date."""
+        from weblate.trans.models.change import Change
+
+        changes = Change.objects.all()
+        activity = cls.objects.all()
+        if since is not None:
+            # The rows are keyed by UTC date, see get_values
+            changes = changes.filter(
+                timestamp__gte=datetime.combine(since, time.min, tzinfo=timezone.utc)
+            )
+            activity = activity.filter(date__gte=since)
+        result = cls.aggregate(changes.select_related("unit").iterator())
+        activity.delete()
+        cls.objects.bulk_create(
+            [cls(**dict(key), **values) for key, values in result.items()],
+            batch_size=1000,
+        )
+        return len(result)
@@ -20,7 +20,6 @@
 from django.conf import settings
 from django.db import models, transaction
 from django.db.models import Count, Q
-from django.utils import timezone
 from django.utils.encoding import force_str
 from django.utils.translation import gettext as _
 from django.utils.translation import gettext_lazy, ngettext_lazy
@@ -28,6 +27,7 @@ from jellyfish import damerau_levenshtein_distance
 
 from weblate.lang.models import Language
 from weblate.trans.mixins import UserDisplayMixin
+from weblate.trans.models.activity import DailyActivity
 from weblate.trans.models.alert import ALERTS
 from weblate.trans.models.project import Project
 from weblate.utils.fields import JSONField
@@ -43,63 +43,6 @@ class ChangeQuerySet(models.QuerySet):
             base = base.prefetch()
         return base.filter(action__in=Change.ACTIONS_CONTENT)
 
-    @staticmethod
-    def count_stats(days, step, dtstart, base):
-        """Count number of changes in given dataset and period grouped by step days."""
-        # Count number of changes
-        result = []
-        for _unused in range(0, days, step):
-            # Calculate interval
-            int_start = dtstart
-            int_end = int_start + timezone.timedelta(days=step)
-
-            # Count changes
-            int_base = base.filter(timestamp__range=(int_start, int_end))
-            count = int_base.aggregate(Count("id"))
-
-            # Append to result
-            result.append((int_start, count["id__count"]))
-
-            # Advance to next interval
-            dtstart = int_end
-
-        return result
-
-    def base_stats(
-        self,
-        days,
-        step,
-        project=None,
-        component=None,
-        translation=None,
-        language=None,
-        user=None,
-    ):
-        """Core of daily/weekly/monthly stats calculation."""
-        # Get range (actually start)
-        dtstart = timezone.now() - timezone.timedelta(days=days + 1)
-
-        # Base for filtering
-        base = self.all()
-
-        # Filter by translation/project
-        if translation is not None:
-            base = base.filter(translation=translation)
-        elif component is not None:
-            base = base.filter(component=component)
-        elif project is not None:
-            base = base.filter(project=project)
-
-        # Filter by language
-        if language is not None:
-            base = base.filter(language=language)
-
-        # Filter by language
-        if user is not None:
-            base = base.filter(user=user)
-
-        return self.count_stats(days, step, dtstart, base)
-
     def prefetch(self):
         """Fetch related fields in a big chungs to avoid loading them individually."""
         return self.prefetch_related(
@@ -498,9 +441,27 @@ class Change(models.Model, UserDisplayMixin):
         if self.glossary_term:
             self.project = self.glossary_term.glossary.project
             self.language = self.glossary_term.language
+        created = self.pk is None
         super().save(*args, **kwargs)
+        if created:
+            DailyActivity.record(self)
+        if self.unit and self.action in self.ACTIONS_CONTENT:
+            self.update_last_content_change()
         transaction.on_commit(lambda: notify_change.delay(self.pk))
 
+    def update_last_content_change(self):
+        """Store this change as last content change of the unit."""
+        from weblate.trans.models.unit import Unit
+
+        values = {
+            "last_content_change": self,
+            "last_content_author": self.author,
+            "last_content_timestamp": self.timestamp,
+        }
+        Unit.objects.filter(pk=self.unit_id).update(**values)
+        for name, value in values.items():
+            setattr(self.unit, name, value)
+
     def get_absolute_url(self):
         """Return link either to unit or translation."""
         if self.unit is not None:
@@ -24,11 +24,11 @@ from collections import Counter, defaultdict
 from contextlib import contextmanager
 from copy import copy
 from datetime import datetime
-from glob import glob
 from itertools import chain
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
+import billiard
 from celery import current_task
 from celery.result import AsyncResult
 from django.conf import settings
@@ -46,6 +46,8 @@ from filelock import FileLock, Timeout
 from redis_lock import Lock, NotAcquired
 
 from weblate.checks.flags import Flags
+from weblate.checks.models import CheckSummary
+from weblate.formats.base import CachedUnit
 from weblate.formats.models import FILE_FORMATS
 from weblate.lang.models import Language, get_default_lang
 from weblate.trans.defines import (
@@ -88,6 +90,7 @@ from weblate.utils.celery import get_task_progress, is_task_ready
 from weblate.utils.db import FastDeleteModelMixin, FastDeleteQuerySetMixin
 from weblate.utils.errors import report_error
 from weblate.utils.fields import JSONField
+from weblate.utils.files import match_mask
 from weblate.utils.licenses import get_license_choices, get_license_url, is_libre
 from weblate.utils.render import (
     render_template,
@@ -96,7 +99,7 @@ from weblate.utils.render import (
     validate_render_component,
     validate_repoweb,
 )
-from weblate.utils.requests import get_uri_error
+from weblate.utils.requests import get_uri_errors
 from weblate.utils.site import get_site_url
 from weblate.utils.state import STATE_FUZZY, STATE_READONLY, STATE_TRANSLATED
 from weblate.utils.stats import ComponentStats, prefetch_stats
@@ -174,6 +177,40 @@ def prefetch_tasks(components):
     return components
 
 
+# Template store inherited by the parse worker processes
+PARSE_TEMPLATE_STORE = None
+
+# Timeout for waiting on a file parsed by the worker process in seconds
+PARSE_TIMEOUT = 300
+
+
+def init_parse_worker(template_store):
+    global PARSE_TEMPLATE_STORE
+    PARSE_TEMPLATE_STORE = template_store
+
+
+def parse_translation_file(file_format, filename, language_code, is_template):
+    """Parse translation file into plain unit records.
+
+    This is executed in the worker process, so it can not access the database.
+    None is returned on failure, the file is then parsed once more by the
+    caller to handle the error.
+    """
+    try:
+        store = FILE_FORMATS[file_format].parse(
+            filename,
+            PARSE_TEMPLATE_STORE,
+            language_code=language_code,
+            is_template=is_template,
+        )
+        return {
+            "plural": store.get_plural_formula(),
+            "units": [CachedUnit.serialize(unit) for unit in store.content_units],
+        }
+    except Exception:
+        return None
+
+
 class ComponentQuerySet(FastDeleteQuerySetMixin, models.QuerySet):
     # pylint: disable=no-init
 
@@ -718,6 +755,7 @@ class Component(FastDeleteModelMixin, models.Model, URLMixin, PathMixin, CacheKe
         self.translations_count = None
         self.translations_progress = 0
         self.acting_user = None
+        self.linked_templates = None
 
     def generate_changes(self, old):
         def getvalue(base, attribute):
@@ -1631,10 +1669,8 @@ class Component(FastDeleteModelMixin, models.Model, URLMixin, PathMixin, CacheKe
 
     def get_mask_matches(self):
         """Return files matching current mask."""
-        prefix = path_separator(os.path.join(self.full_path, ""))
         matches = set()
-        for filename in glob(os.path.join(self.full_path, self.filemask)):
-            path = path_separator(filename).replace(prefix, "")
+        for path in match_mask(self.repository.get_file_index(), self.filemask):
             code = self.get_lang_code(path)
             if re.match(self.language_regex, code) and code != "source":
                 matches.add(path)
@@ -1726,6 +1762,22 @@ class Component(FastDeleteModelMixin, models.Model, URLMixin, PathMixin, CacheKe
                 self.delete_alert(alert)
         self.alerts_trigger = {}
 
+    def start_linked_update(self):
+        """Share parsed templates with linked components."""
+        linked_templates = {}
+        self.linked_templates = linked_templates
+        for component in self.linked_childs:
+            component.linked_templates = linked_templates
+
+    def finish_linked_update(self):
+        if self.linked_templates is None:
+            return
+        self.linked_templates = None
+        for component in self.linked_childs:
+            component.linked_templates = None
+            # Do not keep store shared with other components beyond the update
+            component.drop_template_store_cache()
+
     def create_translations(
         self,
         force: bool = False,
@@ -1738,9 +1790,16 @@ class Component(FastDeleteModelMixin, models.Model, URLMixin, PathMixin, CacheKe
         """Load translations from VCS."""
         try:
             with self.lock():
-                return self._create_translations(
-                    force, langs, request, changed_template, from_link
-                )
+                if not from_link and self.linked_childs:
+                    # Parse shared templates once for all linked components
+                    self.start_linked_update()
+                try:
+                    return self._create_translations(
+                        force, langs, request, changed_template, from_link
+                    )
+                finally:
+                    if not from_link:
+                        self.finish_linked_update()
         except ComponentLockTimeout:
             if not retry_async:
                 self.create_translations(
@@ -1765,6 +1824,90 @@ class Component(FastDeleteModelMixin, models.Model, URLMixin, PathMixin, CacheKe
             )
             return False
 
+    @contextmanager
+    def parse_translations(self, matches, source_file, force=False, langs=None):
+        """Parse translation files in worker processes.
+
+        Yields dictionary of pending results for files which will be
+        synchronized, the database is updated by the caller.
+        """
+        workers = settings.COMPONENT_PARSE_WORKERS
+        if workers <= 1 or self.intermediate:
+            yield {}
+            return
+
+        current = {}
+        for translation in self.translation_set.all():
+            translation.component = self
+            current[translation.filename] = translation
+
+        paths = []
+        for path in matches:
+            if path == source_file:
+                code = self.source_language.code
+            else:
+                code = self.get_lang_code(path)
+            if langs is not None and code not in langs:
+                continue
+            # Unchanged files are skipped without parsing
+            translation = current.get(path)
+            if (
+                not force
+                and translation is not None
+                and translation.language_code == code
+                and translation.revision
+                and translation.revision == translation.get_git_blob_hash()
+            ):
+                continue
+            paths.append((path, code))
+
+        if len(paths) <= 1:
+            yield {}
+            return
+
+        try:
+            # Billiard pool can be started from daemonic Celery workers
+            pool = billiard.get_context("fork").Pool(
+                min(workers, len(paths)), init_parse_worker, (self.template_store,)
+            )
+        except OSError as error:
+            self.log_warning("could not start parsing processes: %s", error)
+            yield {}
+            return
+
+        self.log_info("parsing %d files in %d processes", len(paths), workers)
+        with pool:
+            yield {
+                path: pool.apply_async(
+                    parse_translation_file,
+                    (
+                        self.file_format,
+                        os.path.join(self.full_path, path),
+                        code,
+                        path == self.template,
+                    ),
+                )
+                for path, code in paths
+            }
+
+    def get_parsed(self, parsed, path):
+        """Return result of parsing the file in the worker process.
+
+        None is returned when it is not available, the file is then parsed
+        in the current process.
+        """
+        if path not in parsed:
+            return None
+        try:
+            return parsed[path].get(PARSE_TIMEOUT)
+        except billiard.TimeoutError:
+            self.log_warning("parsing %s timed out", path)
+            # Do not wait for the remaining files
+            parsed.clear()
+        except Exception as error:
+            self.log_warning("parsing %s failed: %s", path, error)
+        return None
+
     def _create_translations(  # noqa: C901
         self,
         force: bool = False,
@@ -1814,54 +1957,65 @@ class Component(FastDeleteModelMixin, models.Model, URLMixin, PathMixin, CacheKe
             # Delete old source units after change from monolingual to bilingual
             if changed_template:
                 translation.unit_set.all().delete()
+                CheckSummary.objects.update_translation(translation)
 
         if self.translations_count != -1:
             self.translations_progress = 0
-            self.translations_count = len(matches) + sum(
-                (c.translation_set.count() for c in self.linked_childs)
-            )
-        for pos, path in enumerate(matches):
-            if not self._sources_prefetched and path != source_file:
-                self.preload_sources()
-            with transaction.atomic():
-                if path == source_file:
-                    code = self.source_language.code
-                else:
-                    code = self.get_lang_code(path)
-                if langs is not None and code not in langs:
-                    self.log_info("skipping %s", path)
-                    continue
+            self.translations_count = len(matches)
+            if self.linked_childs:
+                self.translations_count += Translation.objects.filter(
+                    component__in=self.linked_childs
+                ).count()
+        with self.parse_translations(matches, source_file, force, langs) as parsed:
+            for pos, path in enumerate(matches):
+                if not self._sources_prefetched and path != source_file:
+                    self.preload_sources()
+                with transaction.atomic():
+                    if path == source_file:
+                        code = self.source_language.code
+                    else:
+                        code = self.get_lang_code(path)
+                    if langs is not None and code not in langs:
+                        self.log_info("skipping %s", path)
+                        continue
 
-                self.log_info(
-                    "checking %s (%s) [%d/%d]", path, code, pos + 1, len(matches)
-                )
-                lang = Language.objects.auto_get_or_create(code=code)
-                if lang.code in languages:
-                    codes = "{}, {}".format(code, languages[lang.code])
-                    detail = "{} ({})".format(lang.code, codes)
-                    self.log_warning("duplicate language found: %s", detail)
-                    Change.objects.create(
-                        component=self,
-                        user=request.user if request else self.acting_user,
-                        target=detail,
-                        action=Change.ACTION_DUPLICATE_LANGUAGE,
-                    )
-                    self.trigger_alert(
-                        "DuplicateLanguage", codes=codes, language_code=lang.code
+                    self.log_info(
+                        "checking %s (%s) [%d/%d]", path, code, pos + 1, len(matches)
                     )
-                    continue
-                translation = Translation.objects.check_sync(
-                    self, lang, code, path, force, request=request
-                )
-                was_change |= bool(translation.reason)
-                translations[translation.id] = translation
-                languages[lang.code] = code
-                # Remove fuzzy flag on template name change
-                if changed_template and self.template:
-                    translation.unit_set.filter(state=STATE_FUZZY).update(
-                        state=STATE_TRANSLATED
+                    lang = Language.objects.auto_get_or_create(code=code)
+                    if lang.code in languages:
+                        codes = "{}, {}".format(code, languages[lang.code])
+                        detail = "{} ({})".format(lang.code, codes)
+                        self.log_warning("duplicate language found: %s", detail)
+                        Change.objects.create(
+                            component=self,
+                            user=request.user if request else self.acting_user,
+                            target=detail,
+                            action=Change.ACTION_DUPLICATE_LANGUAGE,
+                        )
+                        self.trigger_alert(
+                            "DuplicateLanguage", codes=codes, language_code=lang.code
+                        )
+                        continue
+                    translation = Translation.objects.check_sync(
+                        self,
+                        lang,
+                        code,
+                        path,
+                        force,
+                        request=request,
+                        prefetched=self.get_parsed(parsed, path),
                     )
-                self.progress_step()
+                    was_change |= bool(translation.reason)
+                    translations[translation.id] = translation
+                    languages[lang.code] = code
+                    # Remove fuzzy flag on template name change
+                    if changed_template and self.template:
+                        if translation.unit_set.filter(state=STATE_FUZZY).update(
+                            state=STATE_TRANSLATED
+                        ):
+                            CheckSummary.objects.update_translation(translation)
+                    self.progress_step()
 
         # Delete possibly no longer existing translations
         if langs is None:
@@ -2427,6 +2581,46 @@ class Component(FastDeleteModelMixin, models.Model, URLMixin, PathMixin, CacheKe
         else:
             self.delete_alert("DuplicateFilemask")
 
+    def get_alert_units(self):
+        # Pick random translation with translated strings except source one
+        translation = (
+            self.translation_set.filter(unit__state__gte=STATE_TRANSLATED)
+            .exclude(language_id=self.source_language_id)
+            .first()
+        )
+        if translation:
+            return translation.unit_set
+        return self.source_translation.unit_set
+
+    def get_link_checks(self, allunits=None):
+        """Return external links validated by alerts.
+
+        The dictionary is keyed by alert name, links for dismissed alerts are
+        not included.
+        """
+        dismissed = set(
+            self.alert_set.filter(
+                dismissed=True, name__in=("BrokenBrowserURL", "BrokenProjectURL")
+            ).values_list("name", flat=True)
+        )
+        result = {}
+        if "BrokenBrowserURL" not in dismissed:
+            location_link = None
+            if self.repoweb:
+                if allunits is None:
+                    allunits = self.get_alert_units()
+                unit = allunits.exclude(location="").first()
+                if unit:
+                    for _location, filename, line in unit.get_locations():
+                        location_link = self.get_repoweb_link(filename, line)
+                        # We only test first link
+                        if location_link is not None:
+                            break
+            result["BrokenBrowserURL"] = location_link
+        if self.project.web and "BrokenProjectURL" not in dismissed:
+            result["BrokenProjectURL"] = self.project.web
+        return result
+
     def update_alerts(self):
         if (
             self.project.access_control == self.project.ACCESS_PUBLIC
@@ -2438,16 +2632,7 @@ class Component(FastDeleteModelMixin, models.Model, URLMixin, PathMixin, CacheKe
         else:
             self.delete_alert("MissingLicense")
 
-        # Pick random translation with translated strings except source one
-        translation = (
-            self.translation_set.filter(unit__state__gte=STATE_TRANSLATED)
-            .exclude(language_id=self.source_language_id)
-            .first()
-        )
-        if translation:
-            allunits = translation.unit_set
-        else:
-            allunits = self.source_translation.unit_set
+        allunits = self.get_alert_units()
 
         source_space = allunits.filter(source__contains=" ")
         target_space = allunits.filter(
@@ -2474,19 +2659,12 @@ class Component(FastDeleteModelMixin, models.Model, URLMixin, PathMixin, CacheKe
         else:
             self.delete_alert("UnsupportedConfiguration")
 
-        if not self.alert_set.filter(dismissed=True, name="BrokenBrowserURL").exists():
-            location_error = None
-            location_link = None
-            if self.repoweb:
-                unit = allunits.exclude(location="").first()
-                if unit:
-                    for _location, filename, line in unit.get_locations():
-                        location_link = self.get_repoweb_link(filename, line)
-                        if location_link is None:
-                            continue
-                        # We only test first link
-                        location_error = get_uri_error(location_link)
-                        break
+        link_checks = self.get_link_checks(allunits)
+        link_errors = get_uri_errors(link for link in link_checks.values() if link)
+
+        if "BrokenBrowserURL" in link_checks:
+            location_link = link_checks["BrokenBrowserURL"]
+            location_error = link_errors.get(location_link)
             if location_error:
                 self.add_alert(
                     "BrokenBrowserURL", link=location_link, error=location_error
@@ -2494,17 +2672,14 @@ class Component(FastDeleteModelMixin, models.Model, URLMixin, PathMixin, CacheKe
             else:
                 self.delete_alert("BrokenBrowserURL")
 
-        if self.project.web:
-            if not self.alert_set.filter(
-                dismissed=True, name="BrokenProjectURL"
-            ).exists():
-                error = get_uri_error(self.project.web)
-                if error is not None:
-                    self.add_alert("BrokenProjectURL", error=error)
-                else:
-                    self.delete_alert("BrokenProjectURL")
-        else:
+        if not self.project.web:
             self.delete_alert("BrokenProjectURL")
+        elif "BrokenProjectURL" in link_checks:
+            error = link_errors[self.project.web]
+            if error is not None:
+                self.add_alert("BrokenProjectURL", error=error)
+            else:
+                self.delete_alert("BrokenProjectURL")
 
         from weblate.screenshots.models import Screenshot
 
@@ -2612,7 +2787,14 @@ class Component(FastDeleteModelMixin, models.Model, URLMixin, PathMixin, CacheKe
 
     def load_template_store(self):
         """Load translate-toolkit store for template."""
-        return self.file_format_cls.parse(self.get_template_filename())
+        if self.linked_templates is None:
+            return self.file_format_cls.parse(self.get_template_filename())
+        # Linked components share the repository, parse each template only once
+        templates = self.linked_templates
+        key = (self.file_format, self.template)
+        if key not in templates:
+            templates[key] = self.file_format_cls.parse(self.get_template_filename())
+        return templates[key]
 
     @cached_property
     def template_store(self):
@@ -2684,6 +2866,7 @@ class Component(FastDeleteModelMixin, models.Model, URLMixin, PathMixin, CacheKe
                 messages.error(request, _("Translation file already exists!"))
             else:
                 file_format.add_language(fullname, language, base_filename)
+                self.repository.drop_file_index()
 
             # We need this to happen synchronously
             self.create_translations(request=request, retry_async=False)
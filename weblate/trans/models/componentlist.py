@@ -23,6 +23,7 @@ import re
 
 from django.db import models
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from weblate.trans.fields import RegexField
@@ -83,6 +84,51 @@ class ComponentList(models.Model, CacheKeyMixin):
         return "list-" + self.slug
 
 
+class AutoComponentListQuerySet(models.QuerySet):
+    def assign(self, components):
+        """Add components to the matching component lists.
+
+        All rules are evaluated at once and only missing memberships are
+        created using single query.
+        """
+        rules = list(self)
+        if not rules:
+            return
+        matches = {
+            (rule.componentlist_id, pk)
+            for pk, slug, project_slug in components.values_list(
+                "pk", "slug", "project__slug"
+            ).iterator()
+            for rule in rules
+            if rule.matches(project_slug, slug)
+        }
+        if not matches:
+            return
+        through = ComponentList.components.through
+        existing = through.objects.filter(
+            componentlist_id__in={
+                componentlist_id for componentlist_id, _unused in matches
+            },
+            component_id__in={pk for _unused, pk in matches},
+        ).values_list("componentlist_id", "component_id")
+        missing = matches - set(existing)
+        if not missing:
+            return
+        through.objects.bulk_create(
+            [
+                through(componentlist_id=componentlist_id, component_id=component_id)
+                for componentlist_id, component_id in missing
+            ],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+        # The bulk_create does not emit m2m_changed, invalidate stats manually
+        for componentlist in ComponentList.objects.filter(
+            pk__in={componentlist_id for componentlist_id, _unused in missing}
+        ):
+            componentlist.stats.invalidate()
+
+
 class AutoComponentList(models.Model):
     project_match = RegexField(
         verbose_name=_("Project regular expression"),
@@ -102,6 +148,8 @@ class AutoComponentList(models.Model):
         on_delete=models.deletion.CASCADE,
     )
 
+    objects = AutoComponentListQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Automatic component list assignment")
         verbose_name_plural = _("Automatic component list assignments")
@@ -109,9 +157,16 @@ class AutoComponentList(models.Model):
     def __str__(self):
         return self.componentlist.name
 
-    def check_match(self, component):
-        if not re.match(self.project_match, component.project.slug):
-            return
-        if not re.match(self.component_match, component.slug):
-            return
-        self.componentlist.components.add(component)
+    @cached_property
+    def project_regex(self):
+        return re.compile(self.project_match)
+
+    @cached_property
+    def component_regex(self):
+        return re.compile(self.component_match)
+
+    def matches(self, project_slug, component_slug):
+        return bool(
+            self.project_regex.match(project_slug)
+            and self.component_regex.match(component_slug)
+        )
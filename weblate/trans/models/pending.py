@@ -0,0 +1,64 @@
+#
+# Copyright © 2012 - 2020 Michal Čihař <michal@cihar.com>
+#
+# This file is part of Weblate <https://weblate.org/>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from datetime import timedelta
+
+from django.db import IntegrityError, models, transaction
+from django.utils import timezone
+
+
+class PendingCommitQuerySet(models.QuerySet):
+    def due(self, now=None):
+        """Return components with commit due, ordered by due time."""
+        return self.filter(due__lte=now or timezone.now()).order_by("due")
+
+
+class PendingCommit(models.Model):
+    """Scheduled commit of pending changes in a component.
+
+    The due time is moved with every change, so the commit happens once
+    the component was not changed for commit_pending_age hours.
+    """
+
+    component = models.OneToOneField(
+        "Component", on_delete=models.deletion.CASCADE, primary_key=True
+    )
+    due = models.DateTimeField(db_index=True)
+
+    objects = PendingCommitQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "pending commit"
+        verbose_name_plural = "pending commits"
+
+    def __str__(self):
+        return "{} at {}".format(self.component, self.due)
+
+    @classmethod
+    def schedule(cls, component):
+        """Schedule commit of pending changes in a component."""
+        due = timezone.now() + timedelta(hours=component.commit_pending_age)
+        if cls.objects.filter(component=component).update(due=due):
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(component=component, due=due)
+        except IntegrityError:
+            # Concurrently created
+            cls.objects.filter(component=component).update(due=due)
@@ -92,6 +92,66 @@ class SuggestionQuerySet(models.QuerySet):
     def order(self):
         return self.order_by("-timestamp")
 
+    def delete_log(self, user, change=Change.ACTION_SUGGESTION_DELETE):
+        """Delete suggestions in bulk with logging changes.
+
+        This does not emit delete signals, the affected translations are
+        invalidated once at the end.
+        """
+        from weblate.trans.models.activity import DailyActivity
+        from weblate.trans.models.translation import Translation
+        from weblate.utils.db import FastCollector
+
+        suggestions = list(
+            self.values_list(
+                "pk",
+                "target",
+                "unit_id",
+                "unit__translation_id",
+                "unit__translation__component_id",
+                "unit__translation__language_id",
+                "unit__translation__component__project_id",
+            )
+        )
+        if not suggestions:
+            return 0
+        pks = [suggestion[0] for suggestion in suggestions]
+        changes = [
+            Change(
+                action=change,
+                user=user,
+                author=user,
+                target=target,
+                unit_id=unit_id,
+                translation_id=translation_id,
+                component_id=component_id,
+                language_id=language_id,
+                project_id=project_id,
+            )
+            for (
+                _pk,
+                target,
+                unit_id,
+                translation_id,
+                component_id,
+                language_id,
+                project_id,
+            ) in suggestions
+        ]
+        with transaction.atomic(using=self.db):
+            Change.objects.bulk_create(changes, batch_size=500)
+            DailyActivity.record_many(changes)
+            # Keep the history, the collector would remove it
+            Change.objects.filter(suggestion_id__in=pks).update(suggestion=None)
+            collector = FastCollector(using=self.db)
+            collector.collect(self.model.objects.filter(pk__in=pks))
+            collector.delete()
+        for translation in Translation.objects.filter(
+            pk__in={suggestion[3] for suggestion in suggestions}
+        ):
+            translation.invalidate_cache()
+        return len(pks)
+
     def filter_access(self, user):
         if user.is_superuser:
             return self
@@ -33,9 +33,8 @@ from django.utils.functional import cached_property
 from django.utils.translation import gettext as _
 
 from weblate.checks.flags import Flags
-from weblate.checks.models import CHECKS
-from weblate.formats.auto import try_load
-from weblate.formats.base import UnitNotFound
+from weblate.checks.models import CHECKS, Check, CheckSummary
+from weblate.formats.base import CachedUnit, UnitNotFound
 from weblate.formats.helpers import BytesIOMode
 from weblate.lang.models import Language, Plural
 from weblate.trans.checklists import TranslationChecklist
@@ -43,6 +42,7 @@ from weblate.trans.defines import FILENAME_LENGTH
 from weblate.trans.exceptions import FileParseError, PluralFormsMismatch
 from weblate.trans.mixins import CacheKeyMixin, LoggerMixin, URLMixin
 from weblate.trans.models.change import Change
+from weblate.trans.models.pending import PendingCommit
 from weblate.trans.models.suggestion import Suggestion
 from weblate.trans.models.unit import (
     STATE_APPROVED,
@@ -55,13 +55,20 @@ from weblate.trans.util import split_plural
 from weblate.trans.validators import validate_check_flags
 from weblate.utils.db import FastDeleteModelMixin, FastDeleteQuerySetMixin
 from weblate.utils.errors import report_error
+from weblate.utils.hash import calculate_checksum
+from weblate.utils.metrics import measure
 from weblate.utils.render import render_template
 from weblate.utils.site import get_site_url
 from weblate.utils.stats import GhostStats, TranslationStats
 
+# Parsed units are cached for a week
+PARSE_CACHE_TIMEOUT = 7 * 86400
+
 
 class TranslationManager(models.Manager):
-    def check_sync(self, component, lang, code, path, force=False, request=None):
+    def check_sync(
+        self, component, lang, code, path, force=False, request=None, prefetched=None
+    ):
         """Parse translation meta info and updates translation object."""
         translation = self.get_or_create(
             language=lang,
@@ -85,7 +92,7 @@ class TranslationManager(models.Manager):
             force = True
             translation.check_flags = flags
             translation.save(update_fields=["check_flags"])
-        translation.check_sync(force, request=request)
+        translation.check_sync(force, request=request, prefetched=prefetched)
 
         return translation
 
@@ -158,6 +165,7 @@ class Translation(
         self.addon_commit_files = []
         self.was_new = 0
         self.reason = ""
+        self.commit_scheduled = False
 
     def get_badges(self):
         if self.is_source:
@@ -322,8 +330,14 @@ class Translation(
         # Store current unit ID
         updated[id_hash] = newunit
 
-    def check_sync(self, force=False, request=None, change=None):  # noqa: C901
-        """Check whether database is in sync with git and possibly updates."""
+    def check_sync(  # noqa: C901
+        self, force=False, request=None, change=None, prefetched=None
+    ):
+        """Check whether database is in sync with git and possibly updates.
+
+        The prefetched units parsed by a worker process can be passed to avoid
+        parsing the file again, see Component.parse_translations.
+        """
         if change is None:
             change = Change.ACTION_UPDATE
         if request is None:
@@ -332,15 +346,18 @@ class Translation(
             user = request.user
 
         # Check if we're not already up to date
+        blob_hash = None
         if not self.revision:
             self.reason = "new file"
-        elif self.revision != self.get_git_blob_hash():
-            self.reason = "content changed"
-        elif force:
-            self.reason = "check forced"
         else:
-            self.reason = ""
-            return
+            blob_hash = self.get_git_blob_hash()
+            if self.revision != blob_hash:
+                self.reason = "content changed"
+            elif force:
+                self.reason = "check forced"
+            else:
+                self.reason = ""
+                return
 
         self.log_info("processing %s, %s", self.filename, self.reason)
 
@@ -348,14 +365,28 @@ class Translation(
         updated = {}
 
         try:
-            store = self.store
             translation_store = None
+            units = self.load_parse_cache(blob_hash)
+            parsed = None
+            if units is None:
+                if prefetched is None:
+                    with measure("parse", self.component):
+                        store = self.store
+                        units = store.content_units
+                    plural = store.get_plural(self.language)
+                else:
+                    plural = self.component.file_format_cls.find_plural(
+                        self.language, prefetched["plural"]
+                    )
+                    units = [CachedUnit(*values) for values in prefetched["units"]]
+
+                # Store plural
+                if plural != self.plural:
+                    self.plural = plural
+                    self.save(update_fields=["plural"])
 
-            # Store plural
-            plural = store.get_plural(self.language)
-            if plural != self.plural:
-                self.plural = plural
-                self.save(update_fields=["plural"])
+                if not self.component.intermediate:
+                    parsed = []
 
             # Was there change?
             self.was_new = 0
@@ -367,57 +398,72 @@ class Translation(
             if self.component.intermediate:
                 translation_store = store
                 store = self.load_store(force_intermediate=True)
-
-            for pos, unit in enumerate(store.content_units):
-                # Use translation store if exists and if it contains the string
-                if translation_store is not None:
-                    try:
-                        translated_unit, created = translation_store.find_unit(
-                            unit.context
+                units = store.content_units
+
+            with measure("sync", self.component):
+                for pos, unit in enumerate(units):
+                    if parsed is not None:
+                        parsed.append(unit)
+
+                    # Use translation store if exists and if it contains the string
+                    if translation_store is not None:
+                        try:
+                            translated_unit, created = translation_store.find_unit(
+                                unit.context
+                            )
+                            if translated_unit and not created:
+                                unit = translated_unit
+                            else:
+                                # Patch unit to have matching source
+                                unit.source = translated_unit.source
+                        except UnitNotFound:
+                            pass
+
+                    id_hash = unit.id_hash
+
+                    # Check for possible duplicate units
+                    if id_hash in updated:
+                        newunit = updated[id_hash]
+                        self.log_warning(
+                            "duplicate string to translate: %s (%s)",
+                            newunit,
+                            repr(newunit.source),
                         )
-                        if translated_unit and not created:
-                            unit = translated_unit
-                        else:
-                            # Patch unit to have matching source
-                            unit.source = translated_unit.source
-                    except UnitNotFound:
-                        pass
-
-                id_hash = unit.id_hash
-
-                # Check for possible duplicate units
-                if id_hash in updated:
-                    newunit = updated[id_hash]
-                    self.log_warning(
-                        "duplicate string to translate: %s (%s)",
-                        newunit,
-                        repr(newunit.source),
-                    )
-                    Change.objects.create(
-                        unit=newunit,
-                        action=Change.ACTION_DUPLICATE_STRING,
-                        user=user,
-                        author=user,
-                    )
-                    self.component.trigger_alert(
-                        "DuplicateString",
-                        language_code=self.language.code,
-                        source=newunit.source,
-                        unit_pk=newunit.pk,
-                    )
-                    continue
+                        Change.objects.create(
+                            unit=newunit,
+                            action=Change.ACTION_DUPLICATE_STRING,
+                            user=user,
+                            author=user,
+                        )
+                        self.component.trigger_alert(
+                            "DuplicateString",
+                            language_code=self.language.code,
+                            source=newunit.source,
+                            unit_pk=newunit.pk,
+                        )
+                        continue
 
-                self.sync_unit(dbunits, updated, id_hash, unit, pos + 1)
+                    self.sync_unit(dbunits, updated, id_hash, unit, pos + 1)
 
         except FileParseError as error:
             self.log_warning("skipping update due to parse error: %s", error)
             return
 
+        if parsed is not None:
+            # New files are hashed only once parsed successfully
+            self.store_parse_cache(blob_hash or self.get_git_blob_hash(), parsed)
+
         # Delete stale units
         stale = set(dbunits) - set(updated)
         if stale:
-            self.unit_set.filter(id_hash__in=stale).delete()
+            stale_units = self.unit_set.filter(id_hash__in=stale)
+            # The checks are removed without signals, update the summary
+            CheckSummary.objects.add_checks(
+                Check.objects.filter(unit__in=stale_units).select_related("unit"), -1
+            )
+            stale_units.delete()
             self.component.needs_cleanup = True
+            self.invalidate_cache()
 
         # We should also do cleanup on source strings tracking objects
 
@@ -467,6 +513,41 @@ class Translation(
 
         return ",".join(hashes)
 
+    def get_parse_cache_key(self, blob_hash):
+        """Return cache key for parsed units of current file content."""
+        component = self.component
+        return "translation-parse-{}".format(
+            calculate_checksum(
+                blob_hash,
+                component.file_format,
+                component.template,
+                self.language_code,
+                str(self.is_template),
+            )
+        )
+
+    def load_parse_cache(self, blob_hash):
+        """Return cached parsed units or None if not available."""
+        # The intermediate file adds units from other store
+        if blob_hash is None or self.component.intermediate:
+            return None
+        cached = cache.get(self.get_parse_cache_key(blob_hash))
+        # The plural is parsed from the file as well
+        if cached is None or cached["plural"] != self.plural_id:
+            return None
+        self.log_debug("using cached parse result")
+        return [CachedUnit(*values) for values in cached["units"]]
+
+    def store_parse_cache(self, blob_hash, units):
+        cache.set(
+            self.get_parse_cache_key(blob_hash),
+            {
+                "plural": self.plural_id,
+                "units": [CachedUnit.serialize(unit) for unit in units],
+            },
+            PARSE_CACHE_TIMEOUT,
+        )
+
     def store_hash(self):
         """Store current hash in database."""
         self.revision = self.get_git_blob_hash()
@@ -495,10 +576,10 @@ class Translation(
             self.log_error("skipping commit due to error: %s", error)
             return False
 
-        with self.component.repository.lock:
+        with self.component.repository.lock, measure("commit", self.component):
             units = (
                 self.unit_set.filter(pending=True)
-                .prefetch_recent_content_changes()
+                .prefetch_related("last_content_author")
                 .select_for_update()
             )
 
@@ -941,6 +1022,8 @@ class Translation(
         fuzzy: str = "",
     ):
         """Top level handler for file uploads."""
+        from weblate.formats.auto import try_load
+
         # Optionally set authorship
         orig_user = None
         if author_email:
@@ -1007,6 +1090,16 @@ class Translation(
         # Invalidate summary stats
         transaction.on_commit(self.stats.invalidate)
 
+    def schedule_commit(self):
+        """Schedule commit of pending changes.
+
+        The schedule is updated once per instance, the due time is based on
+        the first change which is close enough for a single request or task.
+        """
+        if not self.commit_scheduled:
+            self.commit_scheduled = True
+            PendingCommit.schedule(self.component)
+
     @property
     def keys_cache_key(self):
         return "translation-keys-{}".format(self.pk)
@@ -24,13 +24,13 @@ from typing import List, Optional
 from django.conf import settings
 from django.core.cache import cache
 from django.db import models, transaction
-from django.db.models import Count, Max, Q
+from django.db.models import Count, Exists, Max, OuterRef, Q
 from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy
 
 from weblate.checks.flags import Flags
-from weblate.checks.models import CHECKS, Check
+from weblate.checks.models import CHECKS, Check, CheckSummary
 from weblate.formats.helpers import CONTROLCHARS
 from weblate.memory.tasks import handle_unit_translation_change
 from weblate.trans.autofixes import fix_target
@@ -49,6 +49,7 @@ from weblate.trans.validators import validate_check_flags
 from weblate.utils.db import FastDeleteModelMixin, FastDeleteQuerySetMixin
 from weblate.utils.errors import report_error
 from weblate.utils.hash import calculate_hash, hash_to_checksum
+from weblate.utils.metrics import measure
 from weblate.utils.search import parse_query
 from weblate.utils.state import (
     STATE_APPROVED,
@@ -75,6 +76,9 @@ SIMPLE_FILTERS = {
 
 NEWLINES = re.compile(r"\r\n|\r|\n")
 
+# Fields affecting values in the checks summary, see get_check_values
+SUMMARY_FIELDS = {"source", "state", "num_words"}
+
 
 class UnitQuerySet(FastDeleteQuerySetMixin, models.QuerySet):
     def filter_type(self, rqtype):
@@ -102,6 +106,22 @@ class UnitQuerySet(FastDeleteQuerySetMixin, models.QuerySet):
             "translation__component__source_language",
         )
 
+    def annotate_existence(self):
+        """Annotate presence of suggestions, comments and failing checks.
+
+        The has_suggestion, has_comment and has_failing_check properties
+        use these instead of fetching related objects for every unit.
+        """
+        return self.annotate(
+            suggestion_exists=Exists(Suggestion.objects.filter(unit=OuterRef("pk"))),
+            comment_exists=Exists(
+                Comment.objects.filter(unit=OuterRef("pk"), resolved=False)
+            ),
+            check_exists=Exists(
+                Check.objects.filter(unit=OuterRef("pk"), dismissed=False)
+            ),
+        )
+
     def prefetch_full(self):
         return self.prefetch_related(
             "labels",
@@ -122,19 +142,19 @@ class UnitQuerySet(FastDeleteQuerySetMixin, models.QuerySet):
             ),
         )
 
-    def prefetch_recent_content_changes(self):
-        """
-        Prefetch recent content changes.
-
-        This is used in commit pending, where we need this
-        for all pending units.
-        """
-        return self.prefetch_related(
+    def prefetch_export(self):
+        """Prefetch data used by the exporters."""
+        return self.select_related("source_unit").prefetch_related(
             models.Prefetch(
-                "change_set",
-                queryset=Change.objects.content().order().prefetch_related("author"),
-                to_attr="recent_content_changes",
-            )
+                "suggestion_set",
+                queryset=Suggestion.objects.order(),
+                to_attr="suggestions",
+            ),
+            models.Prefetch(
+                "comment_set",
+                queryset=Comment.objects.filter(resolved=False),
+                to_attr="unresolved_comments",
+            ),
         )
 
     def search(self, query):
@@ -300,6 +320,24 @@ class Unit(FastDeleteModelMixin, models.Model, LoggerMixin):
         "Unit", on_delete=models.deletion.CASCADE, blank=True, null=True
     )
 
+    # Denormalized last content change, updated in Change.save
+    last_content_change = models.ForeignKey(
+        "Change",
+        on_delete=models.deletion.DO_NOTHING,
+        db_constraint=False,
+        blank=True,
+        null=True,
+        related_name="+",
+    )
+    last_content_author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.deletion.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="+",
+    )
+    last_content_timestamp = models.DateTimeField(blank=True, null=True)
+
     objects = UnitQuerySet.as_manager()
 
     class Meta:
@@ -333,6 +371,13 @@ class Unit(FastDeleteModelMixin, models.Model, LoggerMixin):
             if update_fields and "num_words" not in update_fields:
                 update_fields.append("num_words")
 
+        # Values counted in the checks summary prior to saving
+        track_checks = not update_fields or not SUMMARY_FIELDS.isdisjoint(update_fields)
+        if track_checks:
+            previous = self.check_values
+            if previous is None and self.old_unit.pk:
+                previous = self.old_unit.get_check_values()
+
         # Actually save the unit
         super().save(
             force_insert=force_insert,
@@ -341,6 +386,13 @@ class Unit(FastDeleteModelMixin, models.Model, LoggerMixin):
             update_fields=update_fields,
         )
 
+        # Update summary of existing checks
+        if track_checks:
+            current = self.get_check_values()
+            if previous is not None and previous != current:
+                CheckSummary.objects.update_units({self.pk: (previous, current)})
+            self.check_values = current
+
         # Set source_unit for source units
         if self.is_source and not self.source_unit:
             self.source_unit = self
@@ -361,6 +413,7 @@ class Unit(FastDeleteModelMixin, models.Model, LoggerMixin):
         """Constructor to initialize some cache properties."""
         super().__init__(*args, **kwargs)
         self.old_unit = copy(self)
+        self.check_values = None
         self.is_batch_update = False
         self.is_bulk_edit = False
         self.source_updated = False
@@ -385,16 +438,22 @@ class Unit(FastDeleteModelMixin, models.Model, LoggerMixin):
 
     @property
     def has_failing_check(self):
+        if "check_exists" in self.__dict__:
+            return self.check_exists
         return bool(self.active_checks)
 
     @property
     def has_comment(self):
+        if "comment_exists" in self.__dict__:
+            return self.comment_exists
         # Use bool here as unresolved_comments might be list
         # or a queryset (from prefetch)
         return bool(self.unresolved_comments)
 
     @property
     def has_suggestion(self):
+        if "suggestion_exists" in self.__dict__:
+            return self.suggestion_exists
         return bool(self.suggestions)
 
     @cached_property
@@ -607,7 +666,7 @@ class Unit(FastDeleteModelMixin, models.Model, LoggerMixin):
         ):
             transaction.on_commit(lambda: handle_unit_translation_change.delay(self.id))
 
-    def update_state(self):
+    def update_state(self, save=True):
         """
         Updates state based on flags.
 
@@ -615,28 +674,77 @@ class Unit(FastDeleteModelMixin, models.Model, LoggerMixin):
 
         * Flagged with 'read-only'
         * Where source string is not translated
+
+        Returns whether the state was changed.
         """
         if "read-only" in self.all_flags or (
             not self.is_source and self.source_unit.state < STATE_TRANSLATED
         ):
-            if not self.readonly:
-                self.state = STATE_READONLY
-                self.save(same_content=True, run_checks=False, update_fields=["state"])
+            if self.readonly:
+                return False
+            self.state = STATE_READONLY
         elif self.readonly:
             self.state = self.original_state
+        else:
+            return False
+        if save:
             self.save(same_content=True, run_checks=False, update_fields=["state"])
+        return True
 
     def update_priority(self, save=True):
         if self.all_flags.has_value("priority"):
             priority = self.all_flags.get_value("priority")
         else:
             priority = 100
-        if self.priority != priority:
-            self.priority = priority
-            if save:
-                self.save(
-                    same_content=True, run_checks=False, update_fields=["priority"]
-                )
+        if self.priority == priority:
+            return False
+        self.priority = priority
+        if save:
+            self.save(same_content=True, run_checks=False, update_fields=["priority"])
+        return True
+
+    def propagate_source_change(self):
+        """Propagate flags and state of the source unit to its translations.
+
+        The state and priority are updated using single query and the checks
+        on the source unit are run only once at the end.
+        """
+        units = list(
+            self.unit_set.prefetch_full().select_related(
+                "translation__component__project"
+            )
+        )
+
+        updated = []
+        changes = {}
+        for unit in units:
+            previous = unit.get_check_values()
+            changed = unit.update_state(save=False)
+            if unit.update_priority(save=False):
+                changed = True
+            if changed:
+                updated.append(unit)
+                unit.check_values = unit.get_check_values()
+                if unit.check_values != previous:
+                    changes[unit.pk] = (previous, unit.check_values)
+        if updated:
+            Unit.objects.bulk_update(updated, ["state", "priority"], batch_size=500)
+            CheckSummary.objects.update_units(changes)
+
+        sources = []
+        for unit in units:
+            if unit.is_source:
+                sources.append(unit)
+                continue
+            # Source checks are run once below
+            unit.is_batch_update = True
+            unit.run_checks()
+        for unit in sources:
+            unit.run_checks()
+
+    def get_check_values(self):
+        """Return words, chars and translated state counted in checks summary."""
+        return (self.num_words, len(self.source), int(self.state >= STATE_TRANSLATED))
 
     @cached_property
     def is_plural(self):
@@ -766,6 +874,7 @@ class Unit(FastDeleteModelMixin, models.Model, LoggerMixin):
             run_checks=run_checks,
             propagate_checks=propagate,
         )
+        self.translation.schedule_commit()
 
         # Generate Change object for this change
         self.generate_change(user or author, author, change_action)
@@ -941,21 +1050,25 @@ class Unit(FastDeleteModelMixin, models.Model, LoggerMixin):
             args = src, tgt, self
 
         # Run all checks
-        for check, check_obj in checks.items():
-            # Does the check fire?
-            if getattr(check_obj, meth)(*args):
-                if check in old_checks:
-                    # We already have this check
-                    old_checks.remove(check)
-                    # Propagation is handled in
-                    # weblate.checks.models.remove_complimentary_checks
-                else:
-                    # Create new check
-                    create.append(Check(unit=self, dismissed=False, check=check))
-                    needs_propagate |= check_obj.propagates
+        with measure("checks", self.translation.component):
+            for check, check_obj in checks.items():
+                # Does the check fire?
+                if getattr(check_obj, meth)(*args):
+                    if check in old_checks:
+                        # We already have this check
+                        old_checks.remove(check)
+                        # Propagation is handled in
+                        # weblate.checks.models.remove_complimentary_checks
+                    else:
+                        # Create new check
+                        create.append(Check(unit=self, dismissed=False, check=check))
+                        needs_propagate |= check_obj.propagates
 
         if create:
             Check.objects.bulk_create(create, batch_size=500, ignore_conflicts=True)
+            # The bulk_create does not emit post_save, update summary manually
+            CheckSummary.objects.add_checks(create)
+            self.translation.invalidate_cache()
             # Propagate checks which need it (for example consistency)
             if needs_propagate and propagate is not False:
                 for unit in self.same_source_units:
@@ -1166,11 +1279,7 @@ class Unit(FastDeleteModelMixin, models.Model, LoggerMixin):
 
     @cached_property
     def recent_content_changes(self):
-        """
-        Content changes for a unit ordered by timestamp.
-
-        Can be prefetched using prefetch_recent_content_changes.
-        """
+        """Content changes for a unit ordered by timestamp."""
         return self.change_set.content().select_related("author").order_by("-timestamp")
 
     def get_last_content_change(self, silent=False):
@@ -1181,6 +1290,13 @@ class Unit(FastDeleteModelMixin, models.Model, LoggerMixin):
         """
         from weblate.auth.models import get_anonymous
 
+        if self.last_content_timestamp is not None:
+            return (
+                self.last_content_author or get_anonymous(),
+                self.last_content_timestamp,
+            )
+
+        # Units not changed since the last content change is tracked
         try:
             change = self.recent_content_changes[0]
             return change.author or get_anonymous(), change.timestamp
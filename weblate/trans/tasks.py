@@ -34,21 +34,27 @@ from filelock import Timeout
 
 from weblate.addons.models import Addon
 from weblate.auth.models import User, get_anonymous
+from weblate.checks.models import CheckSummary
 from weblate.lang.models import Language
 from weblate.trans.autotranslate import AutoTranslate
 from weblate.trans.exceptions import FileParseError
 from weblate.trans.models import (
+    AutoComponentList,
     Change,
     Comment,
     Component,
+    PendingCommit,
     Project,
     Suggestion,
     Translation,
+    Unit,
 )
 from weblate.utils.celery import app
 from weblate.utils.data import data_dir
 from weblate.utils.errors import report_error
 from weblate.utils.files import remove_tree
+from weblate.utils.requests import check_uris
+from weblate.utils.state import STATE_TRANSLATED
 from weblate.vcs.base import RepositoryException
 
 
@@ -107,6 +113,10 @@ def perform_push(pk, *args, **kwargs):
     trail=False, autoretry_for=(Timeout,), retry_backoff=600, retry_backoff_max=3600
 )
 def commit_pending(hours=None, pks=None, logger=None):
+    if hours is None and pks is None:
+        commit_scheduled(logger)
+        return
+
     if pks is None:
         components = Component.objects.all()
     else:
@@ -133,6 +143,23 @@ def commit_pending(hours=None, pks=None, logger=None):
         perform_commit.delay(component.pk, "commit_pending", None)
 
 
+def commit_scheduled(logger=None):
+    """Commit components which were not changed for commit_pending_age."""
+    for scheduled in PendingCommit.objects.due().select_related("component"):
+        component = scheduled.component
+        if not component.needs_commit():
+            scheduled.delete()
+            continue
+
+        if logger:
+            logger("Committing {0}".format(component))
+
+        perform_commit.delay(component.pk, "commit_pending", None)
+        # Keep the schedule in case the commit fails, it is removed on next
+        # run once there is nothing pending
+        PendingCommit.schedule(component)
+
+
 def cleanup_sources(project):
     """Remove stale source Unit objects."""
     for component in project.component_set.filter(template="").iterator():
@@ -142,9 +169,12 @@ def cleanup_sources(project):
             continue
         with transaction.atomic():
             # Remove all units where there is just one referenced unit (self)
-            translation.unit_set.annotate(Count("unit")).filter(
-                unit__count__lte=1
-            ).delete()
+            if (
+                translation.unit_set.annotate(Count("unit"))
+                .filter(unit__count__lte=1)
+                .delete()[0]
+            ):
+                CheckSummary.objects.update_translation(translation)
 
 
 @app.task(trail=False)
@@ -160,32 +190,47 @@ def cleanup_project(pk):
 
 @app.task(trail=False)
 def cleanup_suggestions():
-    # Process suggestions
-    anonymous_user = get_anonymous()
-    suggestions = Suggestion.objects.prefetch_related("unit")
-    for suggestion in suggestions:
-        with transaction.atomic():
-            # Remove suggestions with same text as real translation
-            if (
-                suggestion.unit.target == suggestion.target
-                and suggestion.unit.translated
-            ):
-                suggestion.delete_log(
-                    anonymous_user, change=Change.ACTION_SUGGESTION_CLEANUP
-                )
+    remove = set()
+
+    # Remove suggestions with same text as real translation
+    matching = Suggestion.objects.filter(
+        unit__state__gte=STATE_TRANSLATED, target=F("unit__target")
+    ).values_list("pk", "target", "unit__target")
+    for pk, target, unit_target in matching.iterator():
+        # Do not rely on the SQL as MySQL compares strings case insensitive
+        if target == unit_target:
+            remove.add(pk)
+
+    # Remove duplicate suggestions
+    units = list(
+        Suggestion.objects.values("unit_id", "target")
+        .annotate(Count("id"))
+        .filter(id__count__gt=1)
+        .values_list("unit_id", flat=True)
+        .distinct()
+    )
+    for offset in range(0, len(units), 1000):
+        seen = set()
+        duplicates = (
+            Suggestion.objects.filter(unit_id__in=units[offset : offset + 1000])
+            .order_by("pk")
+            .values_list("pk", "unit_id", "target")
+        )
+        for pk, unit_id, target in duplicates.iterator():
+            if pk in remove:
                 continue
-
-            # Remove duplicate suggestions
-            sugs = Suggestion.objects.filter(
-                unit=suggestion.unit, target=suggestion.target
-            ).exclude(id=suggestion.id)
             # Do not rely on the SQL as MySQL compares strings case insensitive
-            for other in sugs:
-                if other.target == suggestion.target:
-                    suggestion.delete_log(
-                        anonymous_user, change=Change.ACTION_SUGGESTION_CLEANUP
-                    )
-                    break
+            if (unit_id, target) in seen:
+                remove.add(pk)
+            else:
+                seen.add((unit_id, target))
+
+    anonymous_user = get_anonymous()
+    remove = sorted(remove)
+    for offset in range(0, len(remove), 1000):
+        Suggestion.objects.filter(pk__in=remove[offset : offset + 1000]).delete_log(
+            anonymous_user, change=Change.ACTION_SUGGESTION_CLEANUP
+        )
 
 
 @app.task(trail=False)
@@ -263,10 +308,16 @@ def repository_alerts(threshold=settings.REPOSITORY_ALERT_THRESHOLD):
 @app.task(trail=False)
 def component_alerts(component_ids=None):
     if component_ids:
-        components = Component.objects.filter(pk__in=component_ids).iterator()
+        components = Component.objects.filter(pk__in=component_ids)
     else:
-        components = Component.objects.iterator()
-    for component in components:
+        components = Component.objects.all()
+    components = components.select_related("project")
+    # Check all external links at once, update_alerts then uses cached results
+    links = set()
+    for component in components.iterator():
+        links.update(link for link in component.get_link_checks().values() if link)
+    check_uris(links)
+    for component in components.iterator():
         component.update_alerts()
 
 
@@ -387,6 +438,21 @@ def update_checks(pk):
         translation.invalidate_cache()
 
 
+@app.task(trail=False)
+def propagate_source_change(pk):
+    try:
+        unit = Unit.objects.get(pk=pk)
+    except Unit.DoesNotExist:
+        return
+    unit.propagate_source_change()
+    unit.translation.component.invalidate_stats_deep()
+
+
+@app.task(trail=False)
+def update_auto_component_lists(project_id):
+    AutoComponentList.objects.assign(Component.objects.filter(project_id=project_id))
+
+
 @app.task(trail=False)
 def daily_update_checks():
     # Update every component roughly once in a month
@@ -399,7 +465,7 @@ def daily_update_checks():
 
 @app.on_after_finalize.connect
 def setup_periodic_tasks(sender, **kwargs):
-    sender.add_periodic_task(3600, commit_pending.s(), name="commit-pending")
+    sender.add_periodic_task(600, commit_pending.s(), name="commit-pending")
     sender.add_periodic_task(
         crontab(hour=3, minute=30), update_remotes.s(), name="update-remotes"
     )
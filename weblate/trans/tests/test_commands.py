@@ -19,6 +19,7 @@
 
 """Test for management commands."""
 
+import json
 import sys
 from io import StringIO
 from unittest import SkipTest
@@ -466,6 +467,37 @@ class BenchmarkCommandTest(RepoTestCase):
         )
         self.assertIn("function calls", output.getvalue())
 
+    def test_benchmark_suite(self):
+        output = StringIO()
+        call_command(
+            "benchmark_suite",
+            "--format",
+            "po",
+            "--strings",
+            "10",
+            "--languages",
+            "2",
+            "--changes",
+            "2",
+            stdout=output,
+        )
+        result = json.loads(output.getvalue())
+        self.assertEqual(result["strings"], 10)
+        self.assertEqual(
+            set(result["results"]["po"]),
+            {
+                "import",
+                "reparse",
+                "change",
+                "checks",
+                "stats",
+                "commit",
+                "export",
+                "search",
+            },
+        )
+        self.assertFalse(Component.objects.filter(slug="benchmark-po").exists())
+
 
 class SuggestionCommandTest(RepoTestCase):
     """Test suggestion addding."""
@@ -17,21 +17,41 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Test for translation models."""
+import multiprocessing
 import os
+from unittest.mock import Mock, patch
 
+import billiard
 from django.core.exceptions import ValidationError
 from django.test.utils import override_settings
 
 from weblate.checks.models import Check
+from weblate.formats.ttkit import AndroidFormat
 from weblate.lang.models import Language
 from weblate.trans.exceptions import FileParseError
-from weblate.trans.models import Change, Component, Project, Unit
+from weblate.trans.models import Change, Component, Project, Translation, Unit
 from weblate.trans.tests.test_models import RepoTestCase
 from weblate.trans.tests.test_views import ViewTestCase
 from weblate.utils.files import remove_tree
 from weblate.utils.state import STATE_EMPTY, STATE_READONLY, STATE_TRANSLATED
 
 
+def parse_in_daemon(component, queue):
+    """Parse component translations from daemonic process."""
+    try:
+        with component.parse_translations(
+            component.get_mask_matches(), component.template, force=True
+        ) as parsed:
+            queue.put(
+                {
+                    path: len(component.get_parsed(parsed, path)["units"])
+                    for path in parsed
+                }
+            )
+    except Exception as error:
+        queue.put(repr(error))
+
+
 class ComponentTest(RepoTestCase):
     """Component object testing."""
 
@@ -158,6 +178,14 @@ class ComponentTest(RepoTestCase):
         component = self.create_po()
         self.verify_component(component, 4, "cs", 4)
 
+    @override_settings(COMPONENT_PARSE_WORKERS=2)
+    def test_create_po_parallel(self):
+        with patch.object(Translation, "load_store") as load_store:
+            component = self.create_po()
+        # Files should be parsed by the worker processes only
+        load_store.assert_not_called()
+        self.verify_component(component, 4, "cs", 4)
+
     def test_create_srt(self):
         component = self.create_srt()
         self.verify_component(component, 2, "cs", 4, "Hello, world!")
@@ -213,6 +241,37 @@ class ComponentTest(RepoTestCase):
         component = self.create_json_mono()
         self.verify_component(component, 2, "cs", 4)
 
+    @override_settings(COMPONENT_PARSE_WORKERS=2)
+    def test_create_json_mono_parallel(self):
+        component = self.create_json_mono()
+        self.verify_component(component, 2, "cs", 4)
+
+    @override_settings(COMPONENT_PARSE_WORKERS=2)
+    def test_parse_daemon(self):
+        component = self.create_po()
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        process = context.Process(
+            target=parse_in_daemon, args=(component, queue), daemon=True
+        )
+        process.start()
+        # The files are parsed by the pool started from the daemonic process
+        self.assertEqual(
+            queue.get(timeout=60),
+            {"po/cs.po": 4, "po/de.po": 4, "po/it.po": 4},
+        )
+        process.join()
+
+    def test_parse_timeout(self):
+        component = self.create_po()
+        result = Mock()
+        result.get.side_effect = billiard.TimeoutError()
+        parsed = {"po/cs.po": result, "po/de.po": Mock()}
+        self.assertIsNone(component.get_parsed(parsed, "po/cs.po"))
+        # The remaining files are parsed in the current process
+        self.assertIsNone(component.get_parsed(parsed, "po/de.po"))
+        self.assertEqual(parsed, {})
+
     def test_create_json_nested(self):
         component = self.create_json_mono(suffix="nested")
         self.verify_component(component, 2, "cs", 4)
@@ -551,6 +610,40 @@ class ComponentChangeTest(RepoTestCase):
         )
         self.assertFalse(Component.objects.filter(repo="weblate://test/test").exists())
 
+    def test_linked_update(self):
+        parent = self.create_link().linked_component
+        for slug in ("android", "android2"):
+            Component.objects.create(
+                name=slug,
+                slug=slug,
+                project=parent.project,
+                repo="weblate://test/test",
+                file_format="aresource",
+                filemask="android/values-*/strings.xml",
+                template="android/values/strings.xml",
+            )
+        parent = Component.objects.get(pk=parent.pk)
+        with patch.object(AndroidFormat, "parse", wraps=AndroidFormat.parse) as parse:
+            parent.create_translations(force=True)
+        # Template was parsed once and shared by linked components
+        self.assertEqual(
+            [
+                call
+                for call in parse.call_args_list
+                if call[0][0].endswith("android/values/strings.xml")
+            ],
+            [parse.call_args_list[0]],
+        )
+        first, second = [
+            child for child in parent.linked_childs if child.slug.startswith("android")
+        ]
+        # The shared store is not kept after the update
+        self.assertIsNotNone(first.template_store)
+        self.assertIsNot(first.template_store, second.template_store)
+        self.assertIsNone(parent.linked_templates)
+        self.assertIsNone(first.linked_templates)
+        self.assertEqual(first.translation_set.count(), 2)
+
     def test_unlink_clean(self):
         """Test changing linked component to real repo based one."""
         component = self.create_link()
@@ -18,6 +18,7 @@
 #
 """Test for translation models."""
 import os
+from unittest.mock import patch
 
 from django.core.management.color import no_style
 from django.db import connection
@@ -35,6 +36,7 @@ from weblate.trans.models import (
     ComponentList,
     Project,
     Suggestion,
+    Translation,
     Unit,
     Vote,
 )
@@ -260,6 +262,32 @@ class TranslationTest(RepoTestCase):
         translation.commit_pending("test", None)
         self.assertNotEqual(start_rev, component.repository.last_revision)
 
+    def test_parse_cache(self):
+        component = self.create_component()
+        translation = component.translation_set.get(language_code="cs")
+        translation.unit_set.update(target="Changed", state=STATE_TRANSLATED)
+
+        # Forced sync of unchanged file does not parse it again
+        translation = Translation.objects.get(pk=translation.pk)
+        with patch.object(Translation, "load_store") as load_store:
+            translation.check_sync(force=True)
+        load_store.assert_not_called()
+        self.assertEqual(translation.reason, "check forced")
+        self.assertEqual(translation.unit_set.count(), 4)
+        self.assertFalse(translation.unit_set.filter(state=STATE_TRANSLATED).exists())
+
+    def test_last_content_change(self):
+        component = self.create_component()
+        translation = component.translation_set.get(language_code="cs")
+        user = create_test_user()
+        unit = translation.unit_set.all()[0]
+        unit.translate(user, "test2", STATE_TRANSLATED)
+        change = unit.change_set.content().order()[0]
+        unit = Unit.objects.select_related("last_content_author").get(pk=unit.pk)
+        self.assertEqual(unit.last_content_change_id, change.id)
+        with self.assertNumQueries(0):
+            self.assertEqual(unit.get_last_content_change(), (user, change.timestamp))
+
 
 class ComponentListTest(RepoTestCase):
     """Test(s) for ComponentList model."""
@@ -295,6 +323,29 @@ class ComponentListTest(RepoTestCase):
         )
         self.assertEqual(clist.components.count(), 0)
 
+    def test_auto_project(self):
+        component = self.create_component()
+        clist = ComponentList.objects.create(name="Name", slug="slug")
+        other = ComponentList.objects.create(name="Other", slug="other")
+        # Create rules without triggering the assignment
+        AutoComponentList.objects.bulk_create(
+            [
+                AutoComponentList(
+                    project_match="^.*$", component_match="^.*$", componentlist=clist
+                ),
+                AutoComponentList(
+                    project_match="^none$", component_match="^.*$", componentlist=other
+                ),
+            ]
+        )
+        self.assertEqual(clist.components.count(), 0)
+        component.project.save()
+        self.assertEqual(clist.components.count(), 1)
+        self.assertEqual(other.components.count(), 0)
+        # Existing membership is kept
+        component.project.save()
+        self.assertEqual(clist.components.count(), 1)
+
 
 class ModelTestCase(RepoTestCase):
     def setUp(self):
@@ -332,6 +383,24 @@ class SourceUnitTest(ModelTestCase):
         self.assertEqual(Check.objects.count(), 0)
         self.assertEqual(Component.objects.get(pk=self.component.pk).stats.allchecks, 0)
 
+    def test_readonly(self):
+        source = Unit.objects.filter(translation__language_code="cs")[0].source_unit
+        source.extra_flags = "read-only, priority:50"
+        source.save()
+        units = source.unit_set.all()
+        self.assertTrue(all(unit.readonly for unit in units))
+        self.assertEqual({unit.priority for unit in units}, {50})
+        source = Unit.objects.get(pk=source.pk)
+        source.extra_flags = ""
+        source.save()
+        units = source.unit_set.exclude(pk=source.pk)
+        self.assertFalse(any(unit.readonly for unit in units))
+        self.assertEqual({unit.priority for unit in units}, {100})
+
+    @override_settings(SOURCE_PROPAGATION_THRESHOLD=0)
+    def test_priority_background(self):
+        self.test_priority()
+
 
 class UnitTest(ModelTestCase):
     def test_newlines(self):
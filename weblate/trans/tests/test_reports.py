@@ -18,11 +18,18 @@
 #
 
 
-from datetime import timedelta
+from datetime import datetime, time, timedelta
+from io import StringIO
+from unittest.mock import patch
 
+from django.core.management import call_command
+from django.db.models import Sum
+from django.test.utils import override_settings
 from django.urls import reverse
 from django.utils import timezone
 
+from weblate.trans.models import Change, DailyActivity
+from weblate.trans.models.activity import DailyActivityQuerySet
 from weblate.trans.tests.test_views import ViewTestCase
 from weblate.trans.views.reports import generate_counts, generate_credits
 
@@ -74,7 +81,7 @@ class ReportsTest(BaseReportsTest):
             None,
             timezone.now() - timedelta(days=1),
             timezone.now() + timedelta(days=1),
-            translation__component=self.component,
+            component=self.component,
         )
         self.assertEqual(data, [])
 
@@ -84,7 +91,7 @@ class ReportsTest(BaseReportsTest):
             None,
             timezone.now() - timedelta(days=1),
             timezone.now() + timedelta(days=1),
-            translation__component=self.component,
+            component=self.component,
         )
         self.assertEqual(
             data, [{"Czech": [("weblate@example.org", "Weblate Test", expected_count)]}]
@@ -104,6 +111,73 @@ class ReportsTest(BaseReportsTest):
         )
         self.assertEqual(data, COUNTS_DATA)
 
+    def test_counts_rebuild(self):
+        self.add_change()
+        DailyActivity.objects.all().delete()
+        call_command("rebuild_activity", stdout=StringIO())
+        self.test_counts_one()
+
+    @override_settings(TIME_ZONE="America/New_York")
+    def test_rebuild_since_midnight(self):
+        self.add_change()
+        since = timezone.now().date()
+        # Shortly after UTC midnight, which is the previous day in New York
+        Change.objects.update(
+            timestamp=datetime.combine(since, time(0, 30), tzinfo=timezone.utc)
+        )
+        DailyActivity.rebuild()
+        total = DailyActivity.objects.aggregate(total=Sum("changes"))["total"]
+        DailyActivity.rebuild(since)
+        self.assertEqual(
+            DailyActivity.objects.aggregate(total=Sum("changes"))["total"], total
+        )
+
+    @override_settings(TIME_ZONE="America/New_York")
+    def test_credits_timezone(self):
+        self.add_change()
+        today = timezone.now().date()
+        # Shortly after UTC midnight, which is the previous day in New York
+        Change.objects.update(
+            timestamp=datetime.combine(today, time(0, 30), tzinfo=timezone.utc)
+        )
+        DailyActivity.rebuild()
+        local = today - timedelta(days=1)
+        data = generate_credits(
+            None,
+            timezone.make_aware(datetime.combine(local, time(0, 0))),
+            timezone.make_aware(datetime.combine(local, time(23, 59, 59))),
+            component=self.component,
+        )
+        self.assertEqual(
+            data, [{"Czech": [("weblate@example.org", "Weblate Test", 1)]}]
+        )
+
+    def test_add_values_concurrent(self):
+        key = {
+            "date": timezone.now().date(),
+            "project_id": self.project.pk,
+            "component_id": self.component.pk,
+            "language_id": self.get_translation().language_id,
+            "user_id": self.user.pk,
+            "author_id": self.user.pk,
+            "family": DailyActivity.FAMILY_EDIT,
+        }
+        DailyActivity.objects.create(changes=1, **key)
+        original = DailyActivityQuerySet.update
+        calls = []
+
+        def update(queryset, **kwargs):
+            calls.append(kwargs)
+            # The first update misses the row created by other process
+            if len(calls) == 1:
+                return 0
+            return original(queryset, **kwargs)
+
+        with patch.object(DailyActivityQuerySet, "update", update):
+            DailyActivity.add_values(key, {"changes": 2})
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(DailyActivity.objects.get(**key).changes, 3)
+
 
 class ReportsComponentTest(BaseReportsTest):
     def get_kwargs(self):
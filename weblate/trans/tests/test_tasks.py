@@ -23,11 +23,12 @@ from datetime import timedelta
 from django.test.utils import override_settings
 from django.utils import timezone
 
-from weblate.trans.models import Comment, Suggestion
+from weblate.trans.models import Change, Comment, PendingCommit, Suggestion
 from weblate.trans.tasks import (
     cleanup_old_comments,
     cleanup_old_suggestions,
     cleanup_suggestions,
+    commit_pending,
     daily_update_checks,
 )
 from weblate.trans.tests.test_views import ViewTestCase
@@ -77,6 +78,33 @@ class CleanupTest(ViewTestCase):
         cleanup_suggestions()
         self.assertEqual(len(self.get_unit().suggestions), 1)
 
+    def test_cleanup_suggestions_log(self):
+        request = self.get_request()
+        unit = self.get_unit()
+        Suggestion.objects.add(unit, "Zkouška\n", request)
+        Suggestion.objects.add(unit, "Duplicate\n", request)
+        Suggestion.objects.add(unit, "Other\n", request)
+        unit.suggestions[0].vote_set.create(user=self.user, value=1)
+        unit.suggestions[1].vote_set.create(user=self.user, value=1)
+        unit.suggestion_set.filter(target="Duplicate\n").update(target="Other\n")
+        unit.translate(self.user, "Zkouška\n", STATE_TRANSLATED)
+
+        cleanup_suggestions()
+        suggestions = self.get_unit().suggestions
+        self.assertEqual([suggestion.target for suggestion in suggestions], ["Other\n"])
+        changes = Change.objects.filter(action=Change.ACTION_SUGGESTION_CLEANUP)
+        self.assertEqual(
+            sorted(changes.values_list("target", flat=True)), ["Other\n", "Zkouška\n"]
+        )
+        self.assertEqual(
+            set(changes.values_list("translation_id", flat=True)),
+            {unit.translation.pk},
+        )
+        # History of the removed suggestions is kept
+        self.assertEqual(
+            Change.objects.filter(action=Change.ACTION_SUGGESTION).count(), 3
+        )
+
     def test_cleanup_old_suggestions(self, expected=2):
         request = self.get_request()
         unit = self.get_unit()
@@ -107,3 +135,22 @@ class CleanupTest(ViewTestCase):
 class TasksTest(ViewTestCase):
     def test_daily_update_checks(self):
         daily_update_checks()
+
+    def test_commit_pending(self):
+        unit = self.get_unit()
+        unit.translate(self.user, "Zkouška\n", STATE_TRANSLATED)
+        self.assertTrue(self.component.needs_commit())
+        scheduled = PendingCommit.objects.get(component=self.component)
+        self.assertGreater(scheduled.due, timezone.now())
+
+        # Not yet due
+        commit_pending()
+        self.assertTrue(self.get_unit().pending)
+
+        # Due, commits the changes and keeps the schedule until next run
+        PendingCommit.objects.update(due=timezone.now() - timedelta(hours=1))
+        commit_pending()
+        self.assertFalse(self.get_unit().pending)
+        PendingCommit.objects.update(due=timezone.now() - timedelta(hours=1))
+        commit_pending()
+        self.assertFalse(PendingCommit.objects.exists())
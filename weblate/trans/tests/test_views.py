@@ -195,7 +195,11 @@ class ViewTestCase(RepoTestCase):
     def assert_zip(self, response):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["Content-Type"], "application/zip")
-        with ZipFile(BytesIO(response.content), "r") as zipfile:
+        if response.streaming:
+            content = b"".join(response.streaming_content)
+        else:
+            content = response.content
+        with ZipFile(BytesIO(content), "r") as zipfile:
             self.assertIsNone(zipfile.testzip())
 
     def assert_svg(self, response):
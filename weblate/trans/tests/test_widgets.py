@@ -19,11 +19,15 @@
 
 """Test for widgets."""
 
+from unittest.mock import patch
+
+from django.core.cache import cache
 from django.urls import reverse
 
 from weblate.trans.models import Translation
 from weblate.trans.tests.test_views import FixtureTestCase
 from weblate.trans.views.widgets import WIDGETS
+from weblate.trans.widgets import SVGBadgeWidget
 
 
 class WidgetsTest(FixtureTestCase):
@@ -52,6 +56,49 @@ class WidgetsTest(FixtureTestCase):
         self.assert_png(response)
 
 
+def fake_render(self, response):
+    response.write("<svg>{}</svg>".format(self.percent))
+
+
+@patch.object(SVGBadgeWidget, "render", autospec=True, side_effect=fake_render)
+class WidgetsCacheTest(FixtureTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.url = reverse(
+            "widget-image",
+            kwargs={
+                "project": self.project.slug,
+                "widget": "svg",
+                "color": "badge",
+                "extension": "svg",
+            },
+        )
+
+    def test_cached(self, render):
+        first = self.client.get(self.url)
+        self.assertIn("ETag", first)
+        response = self.client.get(self.url)
+        self.assertEqual(response.content, first.content)
+        self.assertEqual(render.call_count, 1)
+
+    def test_not_modified(self, render):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(render.call_count, 1)
+
+    def test_stats_change(self, render):
+        first = self.client.get(self.url)
+        etag = first["ETag"]
+        self.edit_unit("Hello, world!\n", "Nazdar svete!\n")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertNotEqual(response.content, first.content)
+        self.assertEqual(render.call_count, 2)
+
+
 class WidgetsMeta(type):
     def __new__(mcs, name, bases, attrs):  # noqa
         def gen_test(widget, color):
@@ -18,7 +18,7 @@
 #
 """Charting library for Weblate."""
 
-from datetime import datetime
+from datetime import date
 from typing import Callable, Optional
 
 from django.core.cache import cache
@@ -28,7 +28,7 @@ from django.utils.translation import pgettext
 
 from weblate.auth.models import User
 from weblate.lang.models import Language
-from weblate.trans.models import Change
+from weblate.trans.models import DailyActivity
 from weblate.utils.views import get_percent_color, get_project_translation
 
 
@@ -83,14 +83,14 @@ def get_activity_stats(
     result = cache.get(key)
     if not result:
         # Get actual stats
-        result = Change.objects.base_stats(
+        result = DailyActivity.objects.base_stats(
             days, step, project, component, translation, language, user
         )
         cache.set(key, result, 3600 * 4)
     return result
 
 
-def get_label_month(pos: int, previous_month: int, timestamp: datetime) -> str:
+def get_label_month(pos: int, previous_month: int, timestamp: date) -> str:
     if previous_month != timestamp.month:
         return pgettext(
             "Format string for yearly activity chart", "{month}/{year}"
@@ -98,7 +98,7 @@ def get_label_month(pos: int, previous_month: int, timestamp: datetime) -> str:
     return ""
 
 
-def get_label_day(pos: int, previous_month: int, timestamp: datetime) -> str:
+def get_label_day(pos: int, previous_month: int, timestamp: date) -> str:
     if pos % 5 == 0:
         return pgettext(
             "Format string for monthly activity chart", "{day}/{month}"
@@ -110,7 +110,7 @@ def render_activity(
     request,
     days: int,
     step: int,
-    label_func: Callable[[int, int, datetime], str],
+    label_func: Callable[[int, int, date], str],
     project: Optional[str] = None,
     component: Optional[str] = None,
     lang: Optional[str] = None,
@@ -115,11 +115,7 @@ def download_translation(request, project, component, lang):
             show_form_errors(request, form)
             return redirect(obj)
 
-        kwargs["units"] = (
-            obj.unit_set.search(form.cleaned_data.get("q", ""))
-            .distinct()
-            .prefetch_full()
-        )
+        kwargs["units"] = obj.unit_set.search(form.cleaned_data.get("q", "")).distinct()
         kwargs["fmt"] = form.cleaned_data["format"]
 
     return download_translation_file(obj, **kwargs)
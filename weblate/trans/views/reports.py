@@ -18,13 +18,16 @@
 #
 
 
+from itertools import groupby
+from operator import itemgetter
+
 from django.contrib.auth.decorators import login_required
+from django.db.models import Sum
 from django.http import HttpResponse, JsonResponse
 from django.views.decorators.http import require_POST
 
-from weblate.lang.models import Language
 from weblate.trans.forms import ReportsForm
-from weblate.trans.models.change import Change
+from weblate.trans.models.activity import DailyActivity
 from weblate.trans.util import redirect_param
 from weblate.utils.views import get_component, get_project, show_form_errors
 
@@ -38,17 +41,23 @@ def generate_credits(user, start_date, end_date, **kwargs):
     """Generate credits data for given component."""
     result = []
 
-    base = Change.objects.content()
+    base = (
+        DailyActivity.objects.content()
+        .filter_dates(start_date, end_date)
+        .filter(author__isnull=False, **kwargs)
+    )
     if user:
         base = base.filter(author=user)
 
-    for language in Language.objects.filter(**kwargs).distinct().iterator():
-        authors = base.filter(language=language, **kwargs).authors_list(
-            (start_date, end_date)
+    authors = (
+        base.values_list("language__name", "author__email", "author__full_name")
+        .annotate(change_count=Sum("changes"))
+        .order_by("language__name")
+    )
+    for language, items in groupby(authors, key=itemgetter(0)):
+        result.append(
+            {language: sorted((item[1:] for item in items), key=itemgetter(2))}
         )
-        if not authors:
-            continue
-        result.append({language.name: sorted(authors, key=lambda item: item[2])})
 
     return result
 
@@ -59,13 +68,13 @@ def get_credits(request, project=None, component=None):
     """View for credits."""
     if project is None:
         obj = None
-        kwargs = {"translation__isnull": False}
+        kwargs = {}
     elif component is None:
         obj = get_project(request, project)
-        kwargs = {"translation__component__project": obj}
+        kwargs = {"project": obj}
     else:
         obj = get_component(request, project, component)
-        kwargs = {"translation__component": obj}
+        kwargs = {"component": obj}
 
     form = ReportsForm(request.POST)
 
@@ -160,47 +169,45 @@ COUNT_DEFAULTS = {
 def generate_counts(user, start_date, end_date, **kwargs):
     """Generate credits data for given component."""
     result = {}
-    action_map = {Change.ACTION_NEW: "new", Change.ACTION_APPROVE: "approve"}
-
-    base = Change.objects.content().filter(unit__isnull=False)
+    # Map of report fields to the activity counters
+    fields = {
+        "t_chars": "t_chars",
+        "t_words": "t_words",
+        "chars": "chars",
+        "words": "words",
+        "edits": "edits",
+        "count": "changes",
+    }
+
+    base = (
+        DailyActivity.objects.content()
+        .filter_dates(start_date, end_date)
+        .filter(**kwargs)
+    )
     if user:
         base = base.filter(author=user)
     else:
         base = base.filter(author__isnull=False)
 
-    changes = base.filter(
-        timestamp__range=(start_date, end_date), **kwargs
-    ).prefetch_related("author", "unit")
-    for change in changes:
-        email = change.author.email
+    activity = base.values("author__email", "author__full_name", "family").annotate(
+        **{"total_" + field: Sum(name) for field, name in fields.items()}
+    )
+    for item in activity:
+        email = item["author__email"]
 
         if email not in result:
-            result[email] = current = {"name": change.author.full_name, "email": email}
+            result[email] = current = {
+                "name": item["author__full_name"],
+                "email": email,
+            }
             current.update(COUNT_DEFAULTS)
         else:
             current = result[email]
 
-        src_chars = len(change.unit.source)
-        src_words = change.unit.num_words
-        tgt_chars = len(change.target)
-        tgt_words = len(change.target.split())
-        edits = change.get_distance()
-
-        current["chars"] += src_chars
-        current["words"] += src_words
-        current["t_chars"] += tgt_chars
-        current["t_words"] += tgt_words
-        current["edits"] += edits
-        current["count"] += 1
-
-        suffix = action_map.get(change.action, "edit")
-
-        current["t_chars_" + suffix] += tgt_chars
-        current["t_words_" + suffix] += tgt_words
-        current["chars_" + suffix] += src_chars
-        current["words_" + suffix] += src_words
-        current["edits_" + suffix] += edits
-        current["count_" + suffix] += 1
+        suffix = DailyActivity.FAMILY_NAMES[item["family"]]
+        for field in fields:
+            current[field] += item["total_" + field]
+            current["{}_{}".format(field, suffix)] += item["total_" + field]
 
     return list(result.values())
 
@@ -17,11 +17,15 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+from django.core.cache import cache
 from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
+from django.utils.cache import get_conditional_response
 from django.utils.html import escape
+from django.utils.http import quote_etag
 from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
 from django.views.decorators.cache import cache_control
 from django.views.decorators.vary import vary_on_cookie
 
@@ -30,6 +34,7 @@ from weblate.trans.forms import EngageForm
 from weblate.trans.models import Component
 from weblate.trans.util import render
 from weblate.trans.widgets import WIDGETS, SiteOpenGraphWidget
+from weblate.utils.hash import calculate_checksum
 from weblate.utils.site import get_site_url
 from weblate.utils.stats import ProjectLanguage
 from weblate.utils.views import get_component, get_project, try_set_language
@@ -159,9 +164,32 @@ def render_widget(
             return redirect("widget-image", permanent=True, **kwargs)
         return redirect("widget-image", permanent=True, **kwargs)
 
-    # Render widget
-    response = HttpResponse(content_type=widget_obj.content_type)
-    widget_obj.render(response)
+    # Rendered widget is cached until the stats change
+    cache_key = "widget-{}".format(
+        calculate_checksum(
+            obj.stats.cache_key,
+            widget,
+            widget_obj.color,
+            lang.code if lang else "",
+            get_language(),
+            str(obj),
+            obj.stats.stats_version,
+        )
+    )
+    etag = quote_etag(cache_key)
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        return response
+
+    content = cache.get(cache_key)
+    if content is None:
+        # Render widget
+        response = HttpResponse(content_type=widget_obj.content_type)
+        widget_obj.render(response)
+        cache.set(cache_key, response.content, 86400)
+    else:
+        response = HttpResponse(content, content_type=widget_obj.content_type)
+    response["ETag"] = etag
     return response
 
 
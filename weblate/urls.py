@@ -694,6 +694,11 @@ real_patterns = [
         weblate.screenshots.views.ocr_search,
         name="screenshot-js-ocr",
     ),
+    path(
+        "js/screenshot/<int:pk>/ocr/<uuid:task_id>/",
+        weblate.screenshots.views.ocr_result,
+        name="screenshot-js-ocr-result",
+    ),
     path(
         "js/screenshot/<int:pk>/add/",
         weblate.screenshots.views.add_source,
@@ -18,6 +18,8 @@
 #
 
 from importlib import import_module
+from importlib.util import find_spec
+from types import SimpleNamespace
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
@@ -113,3 +115,135 @@ class ClassLoader:
         if empty:
             result.insert(0, ("", ""))
         return result
+
+
+class ManifestClassLoader(ClassLoader):
+    """Dict like object to lazy load classes with statically known metadata.
+
+    The manifest maps class path to a dictionary with its identifier (``id``)
+    and other metadata. This makes it possible to list the classes and their
+    capabilities without importing them, the class is imported on first
+    access. Classes not listed in the manifest are imported upfront.
+    """
+
+    def __init__(self, name, construct=True, manifest=None):
+        super().__init__(name, construct)
+        self.manifest = manifest or {}
+        self.errors = {}
+        self.loaded = {}
+
+    def get_paths(self):
+        value = getattr(settings, self.name)
+        if not value:
+            return ()
+        if not isinstance(value, (list, tuple)):
+            raise ImproperlyConfigured(f"Setting {self.name} must be list or tuple!")
+        return value
+
+    def get_metadata(self, obj):
+        """Return metadata for class not present in the manifest."""
+        return {"id": obj.get_identifier(), "name": obj.name}
+
+    def validate(self, obj):
+        """Verify the object is usable, raises ImportError or AttributeError."""
+        return
+
+    @staticmethod
+    def check_requirements(metadata):
+        """Return error if module required by the class is not available."""
+        for module in metadata.get("requires", ()):
+            try:
+                found = find_spec(module) is not None
+            except ImportError:
+                found = False
+            if not found:
+                return f"No module named '{module}'"
+        return None
+
+    def add_object(self, key, obj):
+        if self.construct:
+            obj = obj()
+        try:
+            self.validate(obj)
+        except (AttributeError, ImportError) as error:
+            self.errors[key] = str(error)
+            return None
+        self.loaded[key] = obj
+        return obj
+
+    @cached_property
+    def index(self):
+        """Dictionary of identifiers and class metadata."""
+        result = {}
+        for path in self.get_paths():
+            if path in self.manifest:
+                metadata = self.manifest[path]
+                error = self.check_requirements(metadata)
+                if error:
+                    self.errors[metadata["id"]] = error
+                else:
+                    result[metadata["id"]] = dict(metadata, path=path)
+            else:
+                obj = load_class(path, self.name)
+                key = obj.get_identifier()
+                if self.add_object(key, obj) is not None:
+                    result[key] = dict(self.get_metadata(obj), path=path)
+        return result
+
+    def get_info(self, key):
+        """Return metadata for given key without loading the class."""
+        return SimpleNamespace(**self.index[key])
+
+    def load_data(self):
+        result = {}
+        for key in list(self.index):
+            obj = self.get(key)
+            if obj is not None:
+                result[key] = obj
+        return result
+
+    def __getitem__(self, key):
+        try:
+            return self.loaded[key]
+        except KeyError:
+            pass
+        obj = self.add_object(key, load_class(self.index[key]["path"], self.name))
+        if obj is None:
+            del self.index[key]
+            raise KeyError(key)
+        return obj
+
+    def __setitem__(self, key, value):
+        self.index[key] = dict(self.get_metadata(value), path=None)
+        self.loaded[key] = value
+
+    def get(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            return None
+
+    def keys(self):
+        return self.index.keys()
+
+    def __iter__(self):
+        return self.index.__iter__()
+
+    def __len__(self):
+        return self.index.__len__()
+
+    def __contains__(self, item):
+        return self.index.__contains__(item)
+
+    def exists(self):
+        return bool(self.index)
+
+    def get_choices(self, empty=False, exclude=(), cond=lambda x: True):
+        result = [
+            (x, self.get_info(x).name)
+            for x in sorted(self)
+            if x not in exclude and cond(self.get_info(x))
+        ]
+        if empty:
+            result.insert(0, ("", ""))
+        return result
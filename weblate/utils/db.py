@@ -26,6 +26,25 @@ from django.db.models.lookups import PatternLookup
 ESCAPED = frozenset(".\\+*?[^]$(){}=!<>|:-")
 
 
+def iterate_chunks(queryset, chunk_size=1000):
+    """Iterate over queryset in chunks ordered by primary key.
+
+    Every chunk is fetched by keyset pagination on the primary key with the
+    queryset prefetches applied, what keeps memory usage bounded on huge
+    querysets while avoiding per row queries.
+    """
+    queryset = queryset.order_by("pk")
+    last = None
+    while True:
+        chunk = queryset if last is None else queryset.filter(pk__gt=last)
+        chunk = list(chunk[:chunk_size])
+        if chunk:
+            yield chunk
+        if len(chunk) < chunk_size:
+            return
+        last = chunk[-1].pk
+
+
 def conditional_sum(value=1, **cond):
     """Wrapper to generate SUM on boolean/enum values."""
     return Sum(Case(When(then=value, **cond), default=0, output_field=IntegerField()))
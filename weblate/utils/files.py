@@ -18,8 +18,13 @@
 #
 
 import os
+import posixpath
+import re
 import shutil
 import stat
+from functools import lru_cache
+from glob import has_magic
+from typing import Iterable, List, Pattern
 
 from django.conf import settings
 
@@ -63,3 +68,63 @@ def should_skip(location):
         or location.startswith(SCRIPTS_DIR)
         or location.startswith(EXAMPLES_DIR)
     )
+
+
+@lru_cache(maxsize=512)
+def compile_mask(mask: str) -> Pattern:
+    """Compile glob mask to regular expression matching relative filenames.
+
+    Unlike fnmatch.translate, the wildcards do not match path separators and
+    do not match hidden files, the same as with glob.
+    """
+    result = []
+    for part in posixpath.normpath(mask).split("/"):
+        if not has_magic(part):
+            result.append(re.escape(part))
+            continue
+        regex = [] if part.startswith(".") else [r"(?!\.)"]
+        i = 0
+        length = len(part)
+        while i < length:
+            char = part[i]
+            i += 1
+            if char == "*":
+                regex.append("[^/]*")
+            elif char == "?":
+                regex.append("[^/]")
+            elif char == "[":
+                j = i
+                if j < length and part[j] == "!":
+                    j += 1
+                if j < length and part[j] == "]":
+                    j += 1
+                while j < length and part[j] != "]":
+                    j += 1
+                if j >= length:
+                    regex.append(r"\[")
+                    continue
+                chars = part[i:j].replace("\\", "\\\\")
+                i = j + 1
+                if chars[0] == "!":
+                    chars = "^" + chars[1:]
+                elif chars[0] == "^":
+                    chars = "\\" + chars
+                regex.append(f"(?!/)[{chars}]")
+            else:
+                regex.append(re.escape(char))
+        result.append("".join(regex))
+    return re.compile("(?s:{})\\Z".format("/".join(result)))
+
+
+def match_mask(filenames: Iterable[str], mask: str) -> List[str]:
+    """Return filenames and directories matching glob mask."""
+    regex = compile_mask(mask)
+    depth = posixpath.normpath(mask).count("/")
+    result = set()
+    for filename in filenames:
+        if filename.count("/") > depth:
+            # The mask can match parent directory as well
+            filename = "/".join(filename.split("/", depth + 1)[:-1])
+        if regex.match(filename):
+            result.add(filename)
+    return sorted(result)
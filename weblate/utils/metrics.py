@@ -0,0 +1,178 @@
+#
+# Copyright © 2012 - 2020 Michal Čihař <michal@cihar.com>
+#
+# This file is part of Weblate <https://weblate.org/>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Timing metrics of the expensive operations.
+
+The durations are collected into histograms per operation and component.
+Each process buffers the observations and periodically adds them to counters
+in the cache, so that the metrics are shared by all web and Celery workers.
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from itertools import accumulate
+from threading import Lock
+from time import monotonic
+
+from celery.signals import task_postrun
+from django.core.cache import cache
+from django.core.signals import request_finished
+from django.dispatch import receiver
+
+# Measured operations
+TIMINGS = {
+    "vcs": "Repository operations",
+    "parse": "Parsing translation files",
+    "sync": "Updating database from translation files",
+    "checks": "Quality checks",
+    "stats": "Statistics calculation",
+    "commit": "Committing pending changes",
+    "addon": "Addon hooks",
+    "machinery": "Machine translation queries",
+}
+
+# Upper bounds of the histogram buckets in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+# Interval between storing buffered observations in seconds
+FLUSH_INTERVAL = 10
+
+# Counters do not expire, partially expired series would break the histograms
+METRICS_CACHE_TIMEOUT = None
+
+
+def get_metrics_key(name: str, component_id: int, suffix) -> str:
+    return f"metrics:{name}:{component_id}:{suffix}"
+
+
+class MetricsCollector:
+    """Buffer of observed durations."""
+
+    def __init__(self):
+        self.lock = Lock()
+        self.pending = Counter()
+        self.flushed = monotonic()
+
+    def observe(self, name: str, component, duration: float):
+        component_id = component.pk if component is not None else 0
+        with self.lock:
+            pending = self.pending
+            # The count is used to look up the existing series
+            pending[get_metrics_key(name, component_id, "count")] += 1
+            # The sum is stored in microseconds as the cache increments integers
+            pending[get_metrics_key(name, component_id, "sum")] += int(
+                duration * 1000000
+            )
+            pending[
+                get_metrics_key(name, component_id, bisect_left(BUCKETS, duration))
+            ] += 1
+        if monotonic() - self.flushed > FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """Add buffered observations to the counters in the cache."""
+        with self.lock:
+            pending = self.pending
+            self.pending = Counter()
+            self.flushed = monotonic()
+        for key, value in pending.items():
+            try:
+                cache.incr(key, value)
+            except ValueError:
+                # Missing key, it might have been created meanwhile by other process
+                if not cache.add(key, value, METRICS_CACHE_TIMEOUT):
+                    cache.incr(key, value)
+
+
+COLLECTOR = MetricsCollector()
+
+
+@contextmanager
+def measure(name: str, component=None):
+    """Measure duration of the block."""
+    start = monotonic()
+    try:
+        yield
+    finally:
+        COLLECTOR.observe(name, component, monotonic() - start)
+
+
+@receiver(request_finished)
+@task_postrun.connect
+def flush_metrics(**kwargs):
+    if COLLECTOR.pending:
+        COLLECTOR.flush()
+
+
+def get_timings():
+    """Return the collected histograms for each measured operation.
+
+    The bucket values are cumulative, matching the upper bounds in BUCKETS
+    followed by the count of all observations.
+    """
+    from weblate.trans.models import Component
+
+    components = {0: ("", "")}
+    for pk, project, slug, file_format in Component.objects.values_list(
+        "pk", "project__slug", "slug", "file_format"
+    ):
+        components[pk] = (f"{project}/{slug}", file_format)
+
+    counts = cache.get_many(
+        [
+            get_metrics_key(name, component_id, "count")
+            for name in TIMINGS
+            for component_id in components
+        ]
+    )
+    keys = []
+    for name in TIMINGS:
+        for component_id in components:
+            if get_metrics_key(name, component_id, "count") not in counts:
+                continue
+            keys.append(get_metrics_key(name, component_id, "sum"))
+            keys.extend(
+                get_metrics_key(name, component_id, bucket)
+                for bucket in range(len(BUCKETS) + 1)
+            )
+    values = cache.get_many(keys)
+
+    result = {}
+    for name in TIMINGS:
+        series = result[name] = []
+        for component_id, (component, file_format) in components.items():
+            if get_metrics_key(name, component_id, "count") not in counts:
+                continue
+            buckets = list(
+                accumulate(
+                    values.get(get_metrics_key(name, component_id, bucket), 0)
+                    for bucket in range(len(BUCKETS) + 1)
+                )
+            )
+            series.append(
+                {
+                    "component": component,
+                    "format": file_format,
+                    "count": buckets[-1],
+                    "sum": values.get(get_metrics_key(name, component_id, "sum"), 0)
+                    / 1000000,
+                    "buckets": buckets,
+                }
+            )
+    return result
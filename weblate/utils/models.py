@@ -61,6 +61,8 @@ class WeblateConf(AppConf):
 
     DATABASE_BACKUP = "plain"
 
+    ZIP_COMPRESSION_LEVEL = 6
+
     HIDE_VERSION = False
 
     CSP_SCRIPT_SRC = []
@@ -17,42 +17,145 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import sleep
+from urllib.parse import urlparse
+
 import requests
+from django.conf import settings
 from django.core.cache import cache
 
 from weblate import USER_AGENT
 from weblate.logger import LOGGER
 from weblate.utils.errors import report_error
 
+SESSION = None
+SESSION_LOCK = Lock()
+
+
+def get_session():
+    """Return HTTP session shared by the link checks.
+
+    The session keeps connection pool per host, so checking several links on
+    the same server does not need to open new connection for each of them.
+    """
+    global SESSION
+    with SESSION_LOCK:
+        if SESSION is None:
+            SESSION = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=settings.LINK_CHECK_WORKERS,
+                pool_maxsize=settings.LINK_CHECK_WORKERS,
+            )
+            SESSION.mount("http://", adapter)
+            SESSION.mount("https://", adapter)
+        return SESSION
 
-def request(method, url, headers=None, **kwargs):
+
+def request(method, url, headers=None, session=None, **kwargs):
     agent = {"User-Agent": USER_AGENT}
     if headers:
         headers.update(agent)
     else:
         headers = agent
-    response = requests.request(method, url, headers=headers, **kwargs)
+    if session is None:
+        session = requests
+    response = session.request(method, url, headers=headers, **kwargs)
     response.raise_for_status()
     return response
 
 
-def get_uri_error(uri):
-    """Return error for fetching the URL or None if it works."""
+def get_uri_cache_key(uri):
+    return f"uri-check-{uri}"
+
+
+def check_uri(uri):
+    """Fetch the URL and return error or None if it works.
+
+    This always performs the HTTP request, use get_uri_errors to use cached
+    results.
+    """
     if uri.startswith("https://nonexisting.weblate.org/"):
         return "Non existing test URL"
-    cache_key = f"uri-check-{uri}"
-    cached = cache.get(cache_key)
-    if cached:
-        LOGGER.debug("URL check for %s, cached success", uri)
-        return None
     try:
-        with request("get", uri, stream=True):
-            cache.set(cache_key, True, 3600)
+        with request(
+            "get",
+            uri,
+            session=get_session(),
+            stream=True,
+            timeout=settings.LINK_CHECK_TIMEOUT,
+        ):
             LOGGER.debug("URL check for %s, tested success", uri)
             return None
     except (
         requests.exceptions.HTTPError,
         requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
     ) as error:
         report_error(cause="URL check failed")
         return str(error)
+
+
+def check_host_uris(uris):
+    """Check URLs on single host, honoring delay between the requests."""
+    result = {}
+    for i, uri in enumerate(uris):
+        if i and settings.LINK_CHECK_HOST_DELAY:
+            sleep(settings.LINK_CHECK_HOST_DELAY)
+        result[uri] = check_uri(uri)
+    return result
+
+
+def check_uris(uris):
+    """Check URLs concurrently and store the results in the cache.
+
+    URLs are grouped by host, each host is processed sequentially to avoid
+    hammering single server while different hosts are checked in parallel.
+    """
+    hosts = defaultdict(list)
+    for uri in set(uris):
+        hosts[urlparse(uri).netloc].append(uri)
+
+    result = {}
+    if len(hosts) <= 1:
+        for host_uris in hosts.values():
+            result.update(check_host_uris(host_uris))
+    else:
+        workers = min(settings.LINK_CHECK_WORKERS, len(hosts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for host_result in executor.map(check_host_uris, hosts.values()):
+                result.update(host_result)
+
+    # Store empty string for success to distinguish it from cache miss
+    cache.set_many(
+        {get_uri_cache_key(uri): error or "" for uri, error in result.items()},
+        settings.LINK_CHECK_CACHE_TIMEOUT,
+    )
+    return result
+
+
+def get_uri_errors(uris):
+    """Return dictionary of URL errors, None is used for working URLs.
+
+    Cached verdicts are used when available, rest of the URLs is checked.
+    """
+    keys = {uri: get_uri_cache_key(uri) for uri in set(uris)}
+    cached = cache.get_many(keys.values())
+    result = {}
+    missing = []
+    for uri, key in keys.items():
+        if key in cached:
+            LOGGER.debug("URL check for %s, cached result", uri)
+            result[uri] = cached[key] or None
+        else:
+            missing.append(uri)
+    if missing:
+        result.update(check_uris(missing))
+    return result
+
+
+def get_uri_error(uri):
+    """Return error for fetching the URL or None if it works."""
+    return get_uri_errors([uri])[uri]
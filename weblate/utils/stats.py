@@ -33,11 +33,13 @@ from django.urls import reverse
 from django.utils import timezone
 from django.utils.functional import cached_property
 
-from weblate.checks.models import CHECKS
+from weblate.checks.models import CHECKS, CheckSummary
 from weblate.lang.models import Language
 from weblate.trans.filter import get_filter_choice
 from weblate.trans.util import translation_percent
 from weblate.utils.db import conditional_sum
+from weblate.utils.hash import calculate_checksum
+from weblate.utils.metrics import measure
 from weblate.utils.state import (
     STATE_APPROVED,
     STATE_EMPTY,
@@ -144,6 +146,8 @@ class BaseStats:
 
     basic_keys = BASIC_KEYS
     is_ghost = False
+    # Component used to label the metrics
+    component = None
 
     def __init__(self, obj):
         self._object = obj
@@ -210,7 +214,7 @@ class BaseStats:
         if name not in self._data:
             was_pending = self._pending_save
             self._pending_save = True
-            if name in self.basic_keys:
+            if name in self.basic_keys or name == "stats_version":
                 self.prefetch_basic()
             elif name.endswith("_percent"):
                 self.store_percents(name)
@@ -267,10 +271,24 @@ class BaseStats:
         return False
 
     def prefetch_basic(self):
-        with sentry_sdk.start_span(
+        with measure("stats", self.component), sentry_sdk.start_span(
             op="stats", description=f"PREFETCH {self.cache_key}"
         ):
             self._prefetch_basic()
+        self.store_version()
+
+    def store_version(self):
+        """Store version of the basic stats.
+
+        It changes only when the numbers change, so it can be used to cache
+        content rendered from the stats, such as widgets.
+        """
+        values = [
+            (key, self._data.get(key))
+            for key in sorted(self.basic_keys)
+            if not key.startswith("last_")
+        ]
+        self.store("stats_version", calculate_checksum(repr(values)))
 
     def _prefetch_basic(self):
         raise NotImplementedError()
@@ -345,6 +363,10 @@ class DummyTranslationStats(BaseStats):
 class TranslationStats(BaseStats):
     """Per translation stats."""
 
+    @property
+    def component(self):
+        return self._object.component
+
     def get_invalidate_keys(
         self, language: Optional[Language] = None, childs: bool = False
     ):
@@ -532,22 +554,14 @@ class TranslationStats(BaseStats):
     def prefetch_checks(self):
         """Prefetch check stats."""
         allchecks = {check.url_id for check in CHECKS.values()}
-        stats = (
-            self._object.unit_set.filter(check__dismissed=False)
-            .values("check__check")
-            .annotate(
-                strings=Count("pk"), words=Sum("num_words"), chars=Sum(Length("source"))
-            )
-        )
-        for stat in stats:
-            check = stat["check__check"]
-            # Filtering here is way more effective than in SQL
-            if check is None:
-                continue
+        stats = CheckSummary.objects.filter(
+            translation=self._object, dismissed=False
+        ).values_list("check", "strings", "words", "chars")
+        for check, strings, words, chars in stats:
             check = "check:{}".format(check)
-            self.store(check, stat["strings"])
-            self.store(check + "_words", stat["words"])
-            self.store(check + "_chars", stat["chars"])
+            self.store(check, strings)
+            self.store(check + "_words", words)
+            self.store(check + "_chars", chars)
             allchecks.discard(check)
         for check in allchecks:
             self.store(check, 0)
@@ -633,6 +647,10 @@ class LanguageStats(BaseStats):
 
 
 class ComponentStats(LanguageStats):
+    @property
+    def component(self):
+        return self._object
+
     @cached_property
     def has_review(self):
         return (
@@ -22,7 +22,7 @@ from unittest import TestCase
 from django.core.exceptions import ImproperlyConfigured
 from django.test.utils import override_settings
 
-from weblate.utils.classloader import ClassLoader, load_class
+from weblate.utils.classloader import ClassLoader, ManifestClassLoader, load_class
 
 
 class LoadClassTest(TestCase):
@@ -66,3 +66,32 @@ class ClassLoaderTestCase(TestCase):
             ImproperlyConfigured, "Setting TEST_SERVICES must be list or tuple!"
         ):
             loader.load_data()
+
+
+class ManifestClassLoaderTestCase(TestCase):
+    @override_settings(
+        TEST_SERVICES=(
+            "weblate.addons.cleanup.CleanupAddon",
+            "weblate.trans.tests.missing.Foo",
+            "weblate.trans.tests.missing.Bar",
+        )
+    )
+    def test_lazy(self):
+        loader = ManifestClassLoader(
+            "TEST_SERVICES",
+            construct=False,
+            manifest={
+                "weblate.trans.tests.missing.Foo": {"id": "foo", "name": "Foo"},
+                "weblate.trans.tests.missing.Bar": {
+                    "id": "bar",
+                    "name": "Bar",
+                    "requires": ("weblate_missing_module",),
+                },
+            },
+        )
+        # Listing does not import classes from the manifest
+        self.assertEqual(set(loader.keys()), {"weblate.cleanup.generic", "foo"})
+        self.assertEqual(loader.get_info("foo").name, "Foo")
+        self.assertIn("bar", loader.errors)
+        with self.assertRaises(ImproperlyConfigured):
+            loader["foo"]
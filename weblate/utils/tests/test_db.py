@@ -19,10 +19,33 @@
 
 from unittest import TestCase
 
-from weblate.utils.db import re_escape
+from django.test import TestCase as DjangoTestCase
+
+from weblate.lang.models import Language
+from weblate.utils.db import iterate_chunks, re_escape
 
 
 class DbTest(TestCase):
     def test_re_escape(self):
         self.assertEqual(re_escape("[a-z]"), "\\[a\\-z\\]")
         self.assertEqual(re_escape("a{1,4}"), "a\\{1,4\\}")
+
+
+class IterateChunksTest(DjangoTestCase):
+    def test_chunks(self):
+        for i in range(5):
+            Language.objects.create(code="x-chunk-{}".format(i), name="Chunk")
+        queryset = Language.objects.filter(name="Chunk").order_by("-code")
+        with self.assertNumQueries(3):
+            chunks = list(iterate_chunks(queryset, 2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(
+            [language.pk for chunk in chunks for language in chunk],
+            sorted(queryset.values_list("pk", flat=True)),
+        )
+
+    def test_empty(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                list(iterate_chunks(Language.objects.filter(name="Chunk"))), []
+            )
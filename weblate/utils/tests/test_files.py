@@ -17,11 +17,12 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 import os
+from glob import glob
 
 from django.conf import settings
 from django.test import SimpleTestCase
 
-from weblate.utils.files import remove_tree
+from weblate.utils.files import match_mask, remove_tree
 from weblate.utils.unittest import tempdir_setting
 
 
@@ -51,3 +52,45 @@ class FilesTestCase(SimpleTestCase):
             os.chmod(nested, 0)
 
         self.test_remove(callback_readonly)
+
+    @tempdir_setting("DATA_DIR")
+    def test_match_mask(self):
+        filenames = (
+            "po/cs.po",
+            "po/de.po",
+            "po/.hidden.po",
+            "po/sub/fr.po",
+            "docs/po/cs.po",
+            "android/values-cs/strings.xml",
+            "android/values/strings.xml",
+            "weird[x]/cs.po",
+        )
+        for filename in filenames:
+            full = os.path.join(settings.DATA_DIR, filename)
+            os.makedirs(os.path.dirname(full), exist_ok=True)
+            with open(full, "w") as handle:
+                handle.write("test")
+        masks = (
+            "po/*.po",
+            "po/.*.po",
+            "*/po/*.po",
+            "*/*.po",
+            "*/*",
+            "po/?s.po",
+            "po/[cd]?.po",
+            "po/[!c]*.po",
+            "android/values-*/strings.xml",
+            "android/values/strings.xml",
+            "missing/*.po",
+            "weird[x/*.po",
+        )
+        prefix = os.path.join(settings.DATA_DIR, "")
+        for mask in masks:
+            self.assertEqual(
+                sorted(match_mask(filenames, mask)),
+                sorted(
+                    name[len(prefix) :]
+                    for name in glob(os.path.join(settings.DATA_DIR, mask))
+                ),
+                mask,
+            )
@@ -0,0 +1,60 @@
+#
+# Copyright © 2012 - 2020 Michal Čihař <michal@cihar.com>
+#
+# This file is part of Weblate <https://weblate.org/>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from weblate.utils.metrics import BUCKETS, COLLECTOR, get_timings, measure
+
+
+class MetricsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        COLLECTOR.flush()
+        cache.clear()
+
+    def test_measure(self):
+        with measure("vcs"):
+            pass
+        with measure("vcs"):
+            pass
+        # Nothing is stored until flushed
+        self.assertEqual(get_timings()["vcs"], [])
+        COLLECTOR.flush()
+        timings = get_timings()
+        self.assertEqual(len(timings["vcs"]), 1)
+        self.assertEqual(timings["vcs"][0]["component"], "")
+        self.assertEqual(timings["vcs"][0]["count"], 2)
+        self.assertEqual(timings["parse"], [])
+
+    def test_buckets(self):
+        COLLECTOR.observe("parse", None, 0.3)
+        COLLECTOR.observe("parse", None, 1000)
+        COLLECTOR.flush()
+        COLLECTOR.observe("parse", None, 0.001)
+        COLLECTOR.flush()
+        timing = get_timings()["parse"][0]
+        self.assertEqual(timing["count"], 3)
+        self.assertAlmostEqual(timing["sum"], 1000.301)
+        self.assertEqual(len(timing["buckets"]), len(BUCKETS) + 1)
+        self.assertEqual(timing["buckets"][BUCKETS.index(0.005)], 1)
+        self.assertEqual(timing["buckets"][BUCKETS.index(0.25)], 1)
+        self.assertEqual(timing["buckets"][BUCKETS.index(0.5)], 2)
+        self.assertEqual(timing["buckets"][-2], 2)
+        self.assertEqual(timing["buckets"][-1], 3)
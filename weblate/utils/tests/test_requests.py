@@ -0,0 +1,76 @@
+#
+# Copyright © 2012 - 2020 Michal Čihař <michal@cihar.com>
+#
+# This file is part of Weblate <https://weblate.org/>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+
+import responses
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from django.test.utils import override_settings
+
+from weblate.utils.requests import check_uris, get_uri_error, get_uri_errors
+
+
+@override_settings(LINK_CHECK_HOST_DELAY=0)
+class URICheckTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    @responses.activate
+    def test_cached(self):
+        responses.add(responses.GET, "https://example.com/", body="OK")
+        self.assertIsNone(get_uri_error("https://example.com/"))
+        self.assertIsNone(get_uri_error("https://example.com/"))
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_cached_error(self):
+        responses.add(responses.GET, "https://example.com/", status=404)
+        self.assertIn("404", get_uri_error("https://example.com/"))
+        self.assertIn("404", get_uri_error("https://example.com/"))
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_multiple(self):
+        responses.add(responses.GET, "https://example.com/", body="OK")
+        responses.add(responses.GET, "https://example.com/missing", status=404)
+        responses.add(responses.GET, "https://example.net/", body="OK")
+        errors = get_uri_errors(
+            [
+                "https://example.com/",
+                "https://example.com/missing",
+                "https://example.net/",
+                "https://example.net/",
+                "https://nonexisting.weblate.org/",
+            ]
+        )
+        self.assertEqual(len(errors), 4)
+        self.assertIsNone(errors["https://example.com/"])
+        self.assertIsNone(errors["https://example.net/"])
+        self.assertIn("404", errors["https://example.com/missing"])
+        self.assertEqual(
+            errors["https://nonexisting.weblate.org/"], "Non existing test URL"
+        )
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_refresh(self):
+        responses.add(responses.GET, "https://example.com/", body="OK")
+        self.assertIsNone(get_uri_error("https://example.com/"))
+        check_uris(["https://example.com/"])
+        self.assertEqual(len(responses.calls), 2)
@@ -18,11 +18,17 @@
 #
 
 
+import os
+import tempfile
+from io import BytesIO
 from unittest import TestCase
+from zipfile import ZipFile
 
 from django.http import HttpRequest
+from django.test.utils import override_settings
 
-from weblate.utils.views import get_page_limit
+from weblate.utils.files import remove_tree
+from weblate.utils.views import get_page_limit, iter_zip
 
 
 def fake_request(page, limit):
@@ -41,3 +47,36 @@ class PageLimitTest(TestCase):
 
     def test_valid(self):
         self.assertEqual((33, 66), get_page_limit(fake_request("33", "66"), 42))
+
+
+class ZipTest(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(remove_tree, self.root)
+        os.makedirs(os.path.join(self.root, "dir"))
+        self.files = {
+            "small.txt": b"content",
+            "dir/large.bin": os.urandom(200000),
+        }
+        for name, content in self.files.items():
+            with open(os.path.join(self.root, name), "wb") as handle:
+                handle.write(content)
+
+    def assert_zip(self):
+        chunks = list(iter_zip(self.root, [self.root], chunk_size=4096))
+        # Large file is emitted in several chunks
+        self.assertGreater(len(chunks), 2)
+        with ZipFile(BytesIO(b"".join(chunks))) as zipfile:
+            self.assertIsNone(zipfile.testzip())
+            self.assertEqual(
+                {name: zipfile.read(name) for name in zipfile.namelist()},
+                self.files,
+            )
+
+    @override_settings(ZIP_COMPRESSION_LEVEL=9)
+    def test_compressed(self):
+        self.assert_zip()
+
+    @override_settings(ZIP_COMPRESSION_LEVEL=0)
+    def test_stored(self):
+        self.assert_zip()
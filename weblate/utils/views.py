@@ -20,11 +20,16 @@
 
 import os
 from time import mktime
-from zipfile import ZipFile
+from zipfile import ZIP64_LIMIT, ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from django.conf import settings
 from django.core.paginator import EmptyPage, Paginator
-from django.http import FileResponse, Http404, HttpResponse, HttpResponseRedirect
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404
 from django.utils.http import http_date
 from django.utils.translation import activate
@@ -35,6 +40,7 @@ from django.views.generic.edit import FormView
 from weblate.formats.models import EXPORTERS
 from weblate.trans.models import Component, Project, Translation
 from weblate.utils import messages
+from weblate.utils.db import iterate_chunks
 from weblate.vcs.git import LocalRepository
 
 
@@ -237,12 +243,66 @@ def iter_files(filenames):
             yield filename
 
 
-def zip_download(root, filenames):
-    response = HttpResponse(content_type="application/zip")
-    with ZipFile(response, "w") as zipfile:
+class ZipStreamBuffer:
+    """Write only file-like object collecting output of ZipFile.
+
+    As it can not seek, ZipFile writes sizes and checksums into data
+    descriptors following each file instead of rewriting the local headers.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.size = 0
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        return
+
+    def pop(self):
+        result = b"".join(self.chunks)
+        self.chunks = []
+        self.size = 0
+        return result
+
+
+def iter_zip(root, filenames, chunk_size=65536):
+    """Generate ZIP file containing given files on the fly.
+
+    The files are read in chunks and compressed data is emitted as soon as
+    there is enough of it, so memory usage does not depend on the file sizes.
+    """
+    buffer = ZipStreamBuffer()
+    if settings.ZIP_COMPRESSION_LEVEL:
+        kwargs = {
+            "compression": ZIP_DEFLATED,
+            "compresslevel": settings.ZIP_COMPRESSION_LEVEL,
+        }
+    else:
+        kwargs = {"compression": ZIP_STORED}
+    with ZipFile(buffer, "w", **kwargs) as zipfile:
         for filename in iter_files(filenames):
-            with open(filename, "rb") as handle:
-                zipfile.writestr(os.path.relpath(filename, root), handle.read())
+            with open(filename, "rb") as handle, zipfile.open(
+                os.path.relpath(filename, root),
+                "w",
+                force_zip64=os.fstat(handle.fileno()).st_size > ZIP64_LIMIT,
+            ) as target:
+                for chunk in iter(lambda: handle.read(chunk_size), b""):
+                    target.write(chunk)
+                    if buffer.size >= chunk_size:
+                        yield buffer.pop()
+        # Emit any remaining data before writing the central directory
+        yield buffer.pop()
+    yield buffer.pop()
+
+
+def zip_download(root, filenames):
+    response = StreamingHttpResponse(
+        iter_zip(root, filenames), content_type="application/zip"
+    )
     response["Content-Disposition"] = 'attachment; filename="translations.zip"'
     return response
 
@@ -256,14 +316,20 @@ def download_translation_file(translation, fmt=None, units=None):
         if not exporter_cls.supports(translation):
             raise Http404("File format not supported")
         exporter = exporter_cls(translation=translation)
+        filetemplate = "{{project}}-{0}-{{language}}.{{extension}}".format(
+            translation.component.slug
+        )
         if units is None:
-            units = translation.unit_set.prefetch_full()
-        exporter.add_units(units)
-        response = exporter.get_response(
-            "{{project}}-{0}-{{language}}.{{extension}}".format(
-                translation.component.slug
+            units = translation.unit_set.all()
+        units = units.prefetch_export()
+        if exporter.streaming:
+            # Serialize in chunks to avoid loading all units at once
+            response = exporter.get_streaming_response(
+                iterate_chunks(units), filetemplate
             )
-        )
+        else:
+            exporter.add_units(units)
+            response = exporter.get_response(filetemplate)
     else:
         # Force flushing pending units
         translation.commit_pending("download", None)
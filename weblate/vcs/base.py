@@ -23,9 +23,11 @@ import logging
 import os
 import os.path
 import subprocess
+from collections import OrderedDict
 from datetime import datetime
 from distutils.version import LooseVersion
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import uuid4
 
 from dateutil import parser
 from django.conf import settings
@@ -36,10 +38,27 @@ from pkg_resources import Requirement, resource_filename
 from sentry_sdk import add_breadcrumb
 
 from weblate.trans.util import get_clean_env, path_separator
+from weblate.utils.metrics import measure
 from weblate.vcs.ssh import SSH_WRAPPER
 
 LOGGER = logging.getLogger("weblate.vcs")
 
+# Files in working copies keyed by path, shared by all components in the process
+FILE_INDEX: Dict[str, Tuple[str, Optional[str], Set[str]]] = OrderedDict()
+# Maximal number of working copies in the file index
+FILE_INDEX_SIZE = 200
+
+
+def get_file_index_key(path: str) -> str:
+    """Return cache key of the file index version shared by processes."""
+    return "file-index-{}".format(hashlib.sha1(path.encode()).hexdigest())
+
+
+def invalidate_file_index(path: str):
+    """Drop file index of the working copy in all processes."""
+    FILE_INDEX.pop(path, None)
+    cache.set(get_file_index_key(path), uuid4().hex, None)
+
 
 class RepositoryException(Exception):
     """Error while working with a repository."""
@@ -213,14 +232,15 @@ class Repository:
                 self.ensure_config_updated()
         is_status = args[0] == self._cmd_status[0]
         try:
-            self.last_output = self._popen(
-                args,
-                self.path,
-                fullcmd=fullcmd,
-                local=self.local,
-                merge_err=merge_err,
-                stdin=stdin,
-            )
+            with measure("vcs", self.component):
+                self.last_output = self._popen(
+                    args,
+                    self.path,
+                    fullcmd=fullcmd,
+                    local=self.local,
+                    merge_err=merge_err,
+                    stdin=stdin,
+                )
         except RepositoryException as error:
             if not is_status:
                 self.log_status(error)
@@ -264,6 +284,7 @@ class Repository:
     def clone(cls, source: str, target: str, branch: str, component=None):
         """Clone repository and return object for cloned repository."""
         SSH_WRAPPER.create()
+        invalidate_file_index(target)
         cls._clone(source, target, branch)
         return cls(target, branch, component)
 
@@ -497,6 +518,74 @@ class Repository:
         """Parses output with chanaged files."""
         raise NotImplementedError()
 
+    def list_files(self) -> Set[str]:
+        """List all files in the working copy."""
+        raise NotImplementedError()
+
+    def update_file_index(self, files: Set[str], previous: str, revision: str):
+        """Update file index with files changed between revisions."""
+        raise NotImplementedError()
+
+    def add_index_file(self, files: Set[str], name: str):
+        """Add file to the index, expanding symlinked directories."""
+        fullname = os.path.join(self.path, name)
+        if not os.path.isdir(fullname):
+            files.add(name)
+            return
+        for root, _dirnames, filenames in os.walk(fullname, followlinks=True):
+            for filename in filenames:
+                files.add(
+                    path_separator(
+                        os.path.relpath(os.path.join(root, filename), self.path)
+                    )
+                )
+
+    def remove_index_file(self, files: Set[str], name: str):
+        """Remove file or symlinked directory from the index."""
+        if name in files:
+            files.discard(name)
+        else:
+            prefix = name + "/"
+            files.difference_update(
+                [filename for filename in files if filename.startswith(prefix)]
+            )
+
+    def get_file_index(self) -> Set[str]:
+        """Return set of files in the working copy.
+
+        The index is shared by all components using the same checkout, it is
+        built once and updated from the list of changed files on new revisions.
+        Files changed without commit invalidate the index in all processes
+        using version stored in the cache.
+        """
+        revision = self.last_revision
+        version = cache.get(get_file_index_key(self.path))
+        cached = FILE_INDEX.get(self.path)
+        if cached is not None and cached[1] != version:
+            # Working copy changed by other process
+            cached = None
+        if cached is not None and cached[0] == revision:
+            return cached[2]
+        files = None
+        if cached is not None:
+            try:
+                files = set(cached[2])
+                self.update_file_index(files, cached[0], revision)
+            except (NotImplementedError, RepositoryException):
+                files = None
+        if files is None:
+            files = self.list_files()
+        FILE_INDEX.pop(self.path, None)
+        FILE_INDEX[self.path] = (revision, version, files)
+        # Drop the least recently indexed working copies
+        while len(FILE_INDEX) > FILE_INDEX_SIZE:
+            FILE_INDEX.popitem(last=False)
+        return files
+
+    def drop_file_index(self):
+        """Drop file index, needed after creating files without commit."""
+        invalidate_file_index(self.path)
+
     def list_upstream_changed_files(self):
         """List files missing upstream."""
         return list(
@@ -395,6 +395,7 @@ class GitRepository(Repository):
     def cleanup(self):
         """Remove not tracked files from the repository."""
         self.execute(["clean", "-f"])
+        self.drop_file_index()
         # Remove possible stale branches
         for branch in self.list_branches():
             if branch != self.branch:
@@ -438,6 +439,37 @@ class GitRepository(Repository):
         for line in lines:
             yield from line.split("\t")[1:]
 
+    def list_files(self):
+        """List all files in the working copy."""
+        files = set()
+        output = self.execute(
+            ["ls-files", "-z", "--stage"], needs_lock=False, merge_err=False
+        )
+        for item in output.split("\0"):
+            if not item:
+                continue
+            mode, name = item.split("\t", 1)
+            # Symlinks can point to directories
+            if mode.startswith("120000"):
+                self.add_index_file(files, name)
+            else:
+                files.add(name)
+        output = self.execute(
+            ["ls-files", "-z", "--others"], needs_lock=False, merge_err=False
+        )
+        for name in output.split("\0"):
+            if name and not name.endswith("/"):
+                self.add_index_file(files, name)
+        return files
+
+    def update_file_index(self, files, previous, revision):
+        """Update file index with files changed between revisions."""
+        for name in self.list_changed_files(f"{previous}..{revision}"):
+            if os.path.lexists(os.path.join(self.path, name)):
+                self.add_index_file(files, name)
+            else:
+                self.remove_index_file(files, name)
+
 
 class GitWithGerritRepository(GitRepository):
 
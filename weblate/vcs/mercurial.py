@@ -348,6 +348,29 @@ class HgRepository(Repository):
         """Remove not tracked files from the repository."""
         self.set_config("extensions.purge", "")
         self.execute(["purge"])
+        self.drop_file_index()
+
+    def list_files(self):
+        """List all files in the working copy."""
+        output = self.execute(
+            [
+                "status",
+                "--modified",
+                "--added",
+                "--clean",
+                "--unknown",
+                "--ignored",
+                "--no-status",
+                "--print0",
+            ],
+            needs_lock=False,
+            merge_err=False,
+        )
+        files = set()
+        for name in output.split("\0"):
+            if name:
+                self.add_index_file(files, name)
+        return files
 
     def update_remote(self):
         """Update remote repository."""
@@ -24,6 +24,7 @@ from unittest import SkipTest
 from unittest.mock import patch
 
 import responses
+from django.core.cache import cache
 from django.test import TestCase
 from django.test.utils import override_settings
 from django.utils import timezone
@@ -31,7 +32,7 @@ from django.utils import timezone
 from weblate.trans.models import Component, Project
 from weblate.trans.tests.utils import RepoTestMixin, TempDirMixin
 from weblate.utils.files import remove_tree
-from weblate.vcs.base import RepositoryException
+from weblate.vcs.base import FILE_INDEX, RepositoryException, get_file_index_key
 from weblate.vcs.git import (
     GitForcePushRepository,
     GithubRepository,
@@ -408,6 +409,34 @@ class VCSGitTest(TestCase, RepoTestMixin, TempDirMixin):
             self.repo.remove(["po/cs.po"], "Remove Czech translation")
         self.assertFalse(os.path.exists(os.path.join(self.tempdir, "po/cs.po")))
 
+    def test_file_index(self):
+        files = self.repo.get_file_index()
+        self.assertIn("README.md", files)
+        self.assertFalse([name for name in files if name.startswith((".git/", ".hg/"))])
+        # Committed changes update the index
+        with self.repo.lock:
+            self.repo.set_committer("Foo Bar", "foo@example.net")
+            self.repo.remove(["README.md"], "Remove readme")
+        self.assertNotIn("README.md", self.repo.get_file_index())
+        # Files created without commit need explicit drop
+        with open(os.path.join(self.tempdir, "new.po"), "w") as handle:
+            handle.write("")
+        self.repo.drop_file_index()
+        self.assertIn("new.po", self.repo.get_file_index())
+
+    def test_file_index_shared(self):
+        self.assertNotIn("new.po", self.repo.get_file_index())
+        with open(os.path.join(self.tempdir, "new.po"), "w") as handle:
+            handle.write("")
+        # Simulate file created by other process
+        cache.set(get_file_index_key(self.repo.path), "other")
+        self.assertIn("new.po", self.repo.get_file_index())
+
+    def test_file_index_size(self):
+        with patch("weblate.vcs.base.FILE_INDEX_SIZE", 1):
+            self.assertIn("README.md", self.repo.get_file_index())
+        self.assertEqual(list(FILE_INDEX), [self.repo.path])
+
     def test_object_hash(self):
         obj_hash = self.repo.get_object_hash("README.md")
         self.assertEqual(len(obj_hash), 40)